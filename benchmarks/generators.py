@@ -0,0 +1,264 @@
+#!user/bin/python
+# -*- coding: utf-8 -*-
+"""
+'generators.py' contains the synthetic file generators
+used by the benchmark suite. Every generator returns the
+file contents for a spectrum of `points` points, built
+from a fixed seed so that runs are comparable.
+"""
+
+# import dependencies
+import json
+import struct
+import numpy as np
+
+from sparse import spa
+
+
+def spectrum(points, seed=0):
+    """
+    Returns a smooth synthetic spectrum.
+
+    Parameters
+    ----------
+    points (int): number of points.\n
+    seed (int): random seed of the noise.
+
+    Returns
+    ----------
+    `(tuple) (x, y)` float64 arrays, `x` in nanometers.
+    """
+
+    rng = np.random.default_rng(seed)
+
+    x = np.linspace(400.0, 2500.0, points)
+    y = (
+        0.5
+        + 0.4 * np.exp(-((x - 1450.0) / 60.0) ** 2)
+        + 0.2 * np.exp(-((x - 1940.0) / 90.0) ** 2)
+        + rng.normal(0.0, 0.002, points)
+    )
+
+    return x, y
+
+
+def make_csv(points, seed=0):
+    """
+    Two column csv file with a `Wavelength,Value` header.
+    """
+
+    x, y = spectrum(points, seed)
+
+    rows = np.column_stack((x, y)).ravel().tolist()
+
+    return 'Wavelength,Value\n' + ('%.4f,%.6f\n' * points) % tuple(rows)
+
+
+def make_txt(points, cols=2, oceanview=False, seed=0):
+    """
+    Tab delimited .txt file.
+
+    Parameters
+    ----------
+    points (int): number of points.\n
+    cols (int): 2 for `x, y` rows, 4 for `x, dark, reference,
+        sample` rows.\n
+    oceanview (bool): prepend an OceanView preamble and data marker.\n
+    seed (int): random seed of the noise.
+    """
+
+    x, y = spectrum(points, seed)
+
+    if cols == 4:
+        dark = np.full(points, 1200.0)
+        reference = dark + 40000.0
+        columns = (x, dark, reference, dark + y * 40000.0)
+        fmt = '%.4f\t%.2f\t%.2f\t%.2f\n'
+    else:
+        columns = (x, y)
+        fmt = '%.4f\t%.6f\n'
+
+    rows = np.column_stack(columns).ravel().tolist()
+    text = (fmt * points) % tuple(rows)
+
+    if not oceanview:
+        return text
+
+    return (
+        'Data from synthetic.txt Node\n'
+        'Date: Mon Apr 05 10:31:23 EDT 2021\n'
+        'User: benchmark\n'
+        'Spectrometer: FLMN00000\n'
+        'Trigger mode: 0\n'
+        'Integration Time (sec): 1.700000E-3\n'
+        'Scans to average: 100\n'
+        'Nonlinearity correction enabled: false\n'
+        'Boxcar width: 0\n'
+        'Storing dark spectrum: false\n'
+        'XAxis mode: Wavelengths\n'
+        'Number of Pixels in Spectrum: ' + str(points) + '\n'
+        '>>>>>Begin Spectral Data<<<<<\n'
+    ) + text
+
+
+def make_spa(points, seed=0):
+    """
+    OMNIC .spa file with a header block and a float32
+    data block, readable by `sparse.spa`.
+    """
+
+    x, y = spectrum(points, seed)
+    data = y.astype('<f4').tobytes()
+
+    head = _spa_head(points, 2)
+    struct.pack_into(
+        '<BxII', head, spa.DIRECTORY_OFFSET + 16, spa.DATA_BLOCK,
+        len(head), len(data)
+    )
+
+    return bytes(head) + data
+
+
+def make_spg(points, spectra=8, seed=0):
+    """
+    OMNIC .spg series of `spectra` spectra sharing one
+    axis, stored as evenly spaced data blocks.
+    """
+
+    x, y = spectrum(points, seed)
+    head = _spa_head(points, spectra + 1)
+    size = 4 * points
+
+    # one directory entry per spectrum after the header block
+    for i in range(spectra):
+        struct.pack_into(
+            '<BxII', head, spa.DIRECTORY_OFFSET + 16 * (i + 1),
+            spa.DATA_BLOCK, len(head) + i * size, size
+        )
+
+    rows = (y[None, :] * np.linspace(1.0, 2.0, spectra)[:, None])
+
+    return bytes(head) + rows.astype('<f4').tobytes()
+
+
+def _spa_head(points, blocks):
+    """
+    Leading bytes of an .spa or .spg file: the title, a
+    directory of `blocks` entries whose first entry lists
+    the header block, and the header block. The header block
+    sits at its usual offset unless the directory reaches
+    past it, data blocks start at 1024 or after the header.
+    """
+
+    table_end = spa.DIRECTORY_OFFSET + 16 * blocks
+    header = max(spa.HEADER_BLOCK_OFFSET, table_end)
+
+    head = bytearray(max(1024, header + spa.HEADER_FIELDS.size))
+    head[:18] = b'Spectral Data File'
+
+    struct.pack_into(
+        '<255s', head, spa.HEADER_OFFSET, b'synthetic benchmark spectrum'
+    )
+    struct.pack_into('<H', head, spa.BLOCK_COUNT_OFFSET, blocks)
+    struct.pack_into(
+        '<BxII', head, spa.DIRECTORY_OFFSET, spa.HEADER_BLOCK, header,
+        spa.HEADER_FIELDS.size
+    )
+
+    # wavenumbers of the 400-2500 nm axis
+    struct.pack_into(
+        '<i8xff', head, header + 4, points, 1.0E7 / 400.0, 1.0E7 / 2500.0
+    )
+
+    return head
+
+
+def make_jcamp(points, seed=0):
+    """
+    JCAMP-DX file with a DIFDUP compressed XYDATA table.
+    """
+
+    x, y = spectrum(points, seed)
+    ints = np.round(y * 1.0E5).astype(np.int64)
+
+    lines = []
+    per_line = 10
+    for i in range(0, points - 1 or 1, per_line - 1):
+        seg = ints[i:i + per_line]
+        toks = [_pseudo(seg[0], _SQZ)]
+        toks.extend(_pseudo(d, _DIF) for d in np.diff(seg).tolist())
+        lines.append('%r' % float(x[i]) + ''.join(toks))
+
+    return (
+        '##TITLE= synthetic benchmark spectrum\n'
+        '##JCAMP-DX= 5.01\n'
+        '##DATA TYPE= INFRARED SPECTRUM\n'
+        '##XUNITS= NANOMETERS\n'
+        '##YUNITS= ABSORBANCE\n'
+        '##XFACTOR= 1.0\n'
+        '##YFACTOR= 0.00001\n'
+        '##FIRSTX= ' + '%r' % float(x[0]) + '\n'
+        '##LASTX= ' + '%r' % float(x[-1]) + '\n'
+        '##NPOINTS= ' + str(points) + '\n'
+        '##XYDATA= (X++(Y..Y))\n'
+        + '\n'.join(lines) + '\n'
+        '##END=\n'
+    )
+
+
+_SQZ = '@ABCDEFGHI@abcdefghi'
+_DIF = '%JKLMNOPQR%jklmnopqr'
+
+
+def _pseudo(value, table):
+    """
+    Encodes an integer with SQZ or DIF pseudo-digits.
+    """
+
+    s = str(abs(int(value)))
+    return table[int(s[0]) + (10 if value < 0 else 0)] + s[1:]
+
+
+def make_json(points, spectra=1, seed=0):
+    """
+    JSON document holding `spectra` spectra.
+    """
+
+    x, y = spectrum(points, seed)
+
+    doc = {
+        'export': 'benchmark',
+        'spectra': [
+            {'id': i, 'x': x.tolist(), 'y': y.tolist()}
+            for i in range(spectra)
+        ]
+    }
+
+    return json.dumps(doc)
+
+
+# generators by format name, with the parser options
+# and file mode used to read them back
+FORMATS = {
+    'csv': (make_csv, {'f_type': 'csv'}, 'r'),
+    'txt': (
+        make_txt, {'f_type': 'txt', 'delimiter': '\t'}, 'r'
+    ),
+    'txt4': (
+        lambda n: make_txt(n, cols=4),
+        {'f_type': 'txt', 'delimiter': '\t', 'cols': 4}, 'r'
+    ),
+    'oceanview': (
+        lambda n: make_txt(n, oceanview=True), {'f_type': 'txt'}, 'r'
+    ),
+    'oceanview4': (
+        lambda n: make_txt(n, cols=4, oceanview=True),
+        {'f_type': 'txt', 'cols': 4}, 'r'
+    ),
+    'spa': (make_spa, {'f_type': 'spa'}, 'rb'),
+    'spg': (
+        lambda n: make_spg(max(n // 8, 1)), {'f_type': 'spg'}, 'rb'
+    ),
+    'jcamp': (make_jcamp, {'f_type': 'jcamp'}, 'r'),
+    'json': (make_json, {'f_type': 'json'}, 'r'),
+}
@@ -0,0 +1,386 @@
+#!user/bin/python
+# -*- coding: utf-8 -*-
+"""
+'run.py' contains the benchmark runner. Synthetic files
+are generated once into a work directory, then each
+format, size and mode is timed and its peak memory
+traced. Results are written as JSON so that runs of
+different versions can be compared.
+
+Usage
+----------
+python -m benchmarks.run --output bench.json
+python -m benchmarks.run --sizes 1000 10000000 --formats csv spa
+python -m benchmarks.run --compare old.json new.json
+"""
+
+# import dependencies
+import argparse
+import datetime
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import numpy as np
+
+from benchmarks import generators
+from sparse.batch import parse_many
+from sparse.parsers import DataFileParser
+
+
+# default point counts, 10M is opt-in with --sizes
+SIZES = (1000, 10000, 100000, 1000000)
+
+MODES = ('read_data', 'is_valid', 'parse', 'iter_data', 'batch')
+
+# number of copies of a file parsed by the batch mode
+BATCH_FILES = 16
+
+
+def main(argv=None):
+
+    args = _arguments().parse_args(argv)
+
+    if args.compare:
+        old, new = (_load(p) for p in args.compare)
+        sys.stdout.write(compare(old, new))
+        return 0
+
+    results = run(
+        formats=args.formats,
+        sizes=args.sizes,
+        modes=args.modes,
+        repeat=args.repeat,
+        workdir=args.workdir,
+        verbose=True
+    )
+
+    report = {'meta': environment(), 'results': results}
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=1)
+    else:
+        json.dump(report, sys.stdout, indent=1)
+
+    return 0
+
+
+def run(formats=None, sizes=SIZES, modes=MODES, repeat=5, workdir=None,
+        verbose=False):
+    """
+    Runs the benchmarks.
+
+    Parameters
+    ----------
+    formats (list): format names of `generators.FORMATS`,
+        defaults to all of them.\n
+    sizes (list): number of points per file.\n
+    modes (list): entry points to time, see `MODES`.\n
+    repeat (int): timed runs per case, after one warm-up run.\n
+    workdir (str): directory holding the generated files,
+        a temporary directory by default.\n
+    verbose (bool): write progress to stderr.
+
+    Returns
+    ----------
+    (list) of result dicts, one per format, size and mode.
+    """
+
+    formats = formats or list(generators.FORMATS)
+    workdir = workdir or os.path.join(tempfile.gettempdir(), 'sparse-bench')
+    os.makedirs(workdir, exist_ok=True)
+
+    results = []
+
+    for fmt in formats:
+        for points in sizes:
+
+            path = generate(fmt, points, workdir)
+
+            for mode in modes:
+
+                if verbose:
+                    sys.stderr.write(
+                        '%-10s %10d %-10s' % (fmt, points, mode)
+                    )
+
+                try:
+                    result = measure(fmt, path, points, mode, repeat)
+                except NotImplementedError:
+                    # e.g. no streaming reader for the format
+                    if verbose:
+                        sys.stderr.write(' not supported\n')
+                    continue
+
+                results.append(result)
+
+                if verbose:
+                    sys.stderr.write(
+                        ' %10.3f ms %12.0f pts/s %10.1f MB peak\n' % (
+                            result['seconds']['median'] * 1.0E3,
+                            result['points_per_s'],
+                            result['peak_bytes'] / 2**20
+                        )
+                    )
+
+    return results
+
+
+def generate(fmt, points, workdir):
+    """
+    Writes a synthetic file once and returns its path.
+    Files are checked before use, invalid ones (e.g. left
+    by an older generator) are written again.
+    """
+
+    make, options, mode = generators.FORMATS[fmt]
+
+    ext = 'spa' if fmt == 'spa' else options['f_type']
+    path = os.path.join(workdir, '%s_%d.%s' % (fmt, points, ext))
+
+    if os.path.exists(path):
+        try:
+            check(fmt, path)
+            return path
+        except ValueError:
+            pass
+
+    content = make(points)
+    tmp = path + '.tmp'
+    with open(tmp, 'wb' if 'b' in mode else 'w') as f:
+        f.write(content)
+    os.replace(tmp, path)
+
+    check(fmt, path)
+
+    return path
+
+
+def check(fmt, path):
+    """
+    Raises ValueError if a generated file does not read
+    back as valid data with a readable header.
+    """
+
+    make, options, mode = generators.FORMATS[fmt]
+
+    with open(path, mode) as f_obj:
+        result = DataFileParser(f_obj=f_obj, **options).parse()
+
+    if not result.valid or not result.has_data():
+        raise ValueError(path + ': ' + str(result.errors))
+    if not len(result.x_data) or (
+        np.shape(result.y_data)[-1] != len(result.x_data)
+    ):
+        raise ValueError(path + ': data arrays do not match.')
+
+    with open(path, mode) as f_obj:
+        try:
+            DataFileParser(f_obj=f_obj, **options).read_metadata()
+        except NotImplementedError:
+            pass
+        except Exception as e:
+            raise ValueError(path + ': ' + str(e))
+
+
+def measure(fmt, path, points, mode, repeat):
+    """
+    Times one case and traces its peak memory.
+
+    Returns
+    ----------
+    (dict) latency statistics in seconds, throughput in
+    points and bytes per second, and peak traced memory.
+    """
+
+    call = _case(fmt, path, mode)
+
+    # warm-up, also checks the file reads back
+    call()
+
+    times = []
+    for i in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        call()
+        times.append(time.perf_counter() - start)
+
+    # traced separately, tracing slows the timed runs
+    gc.collect()
+    tracemalloc.start()
+    call()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    files = BATCH_FILES if mode == 'batch' else 1
+    median = float(np.median(times))
+
+    return {
+        'format': fmt,
+        'points': points,
+        'mode': mode,
+        'bytes': os.path.getsize(path),
+        'files': files,
+        'repeat': repeat,
+        'seconds': {
+            'min': min(times),
+            'median': median,
+            'mean': float(np.mean(times)),
+            'max': max(times)
+        },
+        'points_per_s': points * files / median,
+        'bytes_per_s': os.path.getsize(path) * files / median,
+        'peak_bytes': peak
+    }
+
+
+def _case(fmt, path, mode):
+    """
+    Returns a callable running one mode on a file.
+    """
+
+    make, options, file_mode = generators.FORMATS[fmt]
+
+    if mode == 'batch':
+        sources = [(path, options['f_type'])] * BATCH_FILES
+        extra = {k: v for k, v in options.items() if k != 'f_type'}
+
+        def call():
+            for index, result in parse_many(
+                sources, executor='thread', **extra
+            ):
+                if not result.valid:
+                    raise RuntimeError(result.errors)
+
+        return call
+
+    def call():
+        with open(path, file_mode) as f_obj:
+            parser = DataFileParser(f_obj=f_obj, **options)
+
+            if mode == 'read_data':
+                parser.read_data()
+            elif mode == 'is_valid':
+                if not parser.is_valid():
+                    raise RuntimeError(parser.errors)
+            elif mode == 'parse':
+                parser.parse()
+            elif mode == 'iter_data':
+                for block in parser.iter_data():
+                    pass
+            else:
+                raise ValueError(mode)
+
+    return call
+
+
+def environment():
+    """
+    Describes the environment of a run.
+    """
+
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip() or None
+    except OSError:
+        commit = None
+
+    return {
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'commit': commit,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'cpus': os.cpu_count()
+    }
+
+
+def compare(old, new):
+    """
+    Formats the median latency change of the cases
+    found in both reports.
+
+    Parameters
+    ----------
+    old (dict): baseline report.\n
+    new (dict): report to compare.
+
+    Returns
+    ----------
+    (str) a table of old and new median latency and speedup.
+    """
+
+    def key(r):
+        return (r['format'], r['points'], r['mode'])
+
+    baseline = {key(r): r for r in old['results']}
+
+    lines = ['%-10s %10s %-10s %12s %12s %8s' % (
+        'format', 'points', 'mode', 'old ms', 'new ms', 'speedup'
+    )]
+
+    for r in new['results']:
+        b = baseline.get(key(r))
+        if b is None:
+            continue
+        t0 = b['seconds']['median']
+        t1 = r['seconds']['median']
+        lines.append('%-10s %10d %-10s %12.3f %12.3f %7.2fx' % (
+            r['format'], r['points'], r['mode'], t0 * 1.0E3, t1 * 1.0E3,
+            t0 / t1
+        ))
+
+    return '\n'.join(lines) + '\n'
+
+
+def _load(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def _arguments():
+
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.run',
+        description='Benchmark the sparse readers on synthetic files.'
+    )
+    parser.add_argument(
+        '--formats', nargs='+', choices=list(generators.FORMATS),
+        help='formats to run, all by default'
+    )
+    parser.add_argument(
+        '--sizes', nargs='+', type=int, default=list(SIZES),
+        help='points per file, up to 10000000'
+    )
+    parser.add_argument(
+        '--modes', nargs='+', choices=MODES, default=list(MODES),
+        help='entry points to time'
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=5, help='timed runs per case'
+    )
+    parser.add_argument(
+        '--workdir', help='directory of the generated files'
+    )
+    parser.add_argument(
+        '--output', help='JSON results file, stdout by default'
+    )
+    parser.add_argument(
+        '--compare', nargs=2, metavar=('OLD', 'NEW'),
+        help='compare two results files instead of running'
+    )
+
+    return parser
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -9,5 +9,8 @@ setup(
     author_email='hsmith@thorlabs.com',
     license='Not Licensed',
     packages=['sparse'],
+    entry_points={
+        'console_scripts': ['sparse=sparse.cli:main']
+    },
     zip_safe=False
 )
\ No newline at end of file
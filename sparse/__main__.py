@@ -0,0 +1,10 @@
+"""
+Runs the command line tool, see `sparse.cli`.
+"""
+
+import sys
+
+from sparse.cli import main
+
+
+sys.exit(main())
@@ -0,0 +1,112 @@
+#!user/bin/python
+# -*- coding: utf-8 -*-
+"""
+'aio.py' contains the asyncio helpers used to run the
+blocking parsers off the event loop on a bounded
+executor.
+"""
+
+# import dependencies
+import asyncio
+import functools
+import inspect
+import os
+import threading
+from concurrent import futures
+
+
+# size of the shared executor
+DEFAULT_WORKERS = os.cpu_count() or 1
+
+_executor = None
+_lock = threading.Lock()
+
+
+def get_executor():
+    """
+    Returns the shared thread pool used when no executor
+    is given, creating it on first use. Its size bounds
+    the number of files decoded at the same time.
+
+    Returns
+    ----------
+    (concurrent.futures.ThreadPoolExecutor) the shared pool.
+    """
+
+    global _executor
+
+    with _lock:
+        if _executor is None:
+            _executor = futures.ThreadPoolExecutor(
+                max_workers=DEFAULT_WORKERS, thread_name_prefix='sparse'
+            )
+
+    return _executor
+
+
+def set_executor(executor):
+    """
+    Replaces the shared executor with another thread pool,
+    e.g. of a different size. The previous pool is not shut
+    down.
+
+    Parameters
+    ----------
+    executor (concurrent.futures.Executor): the new pool, any
+        executor running calls in this process.
+    """
+
+    check_threads(executor)
+
+    global _executor
+
+    with _lock:
+        _executor = executor
+
+
+async def run(fn, *args, executor=None):
+    """
+    Runs a blocking call on an executor and awaits it.
+    Cancelling the awaiting task cancels the call if it
+    has not started yet.
+
+    Parameters
+    ----------
+    fn (callable): the blocking call.\n
+    args: positional arguments of `fn`.\n
+    executor (concurrent.futures.Executor): pool to run on,
+        defaults to `get_executor()`.
+
+    Returns
+    ----------
+    the return value of `fn`.
+    """
+
+    loop = asyncio.get_running_loop()
+
+    return await loop.run_in_executor(
+        executor or get_executor(), functools.partial(fn, *args)
+    )
+
+
+def check_threads(executor):
+    """
+    Raises TypeError if `executor` is a process pool. The
+    async parser methods run bound methods of the parser,
+    whose state must be updated in this process.
+    """
+
+    if isinstance(executor, futures.ProcessPoolExecutor):
+        raise TypeError(
+            'Parsers must run on a thread pool, not a process pool. '
+            'Use sparse.batch.aparse_many() to parse on processes.'
+        )
+
+
+def is_async_reader(f_obj):
+    """
+    Returns True if `f_obj.read()` is a coroutine, as on
+    the upload objects of async web frameworks.
+    """
+
+    return inspect.iscoroutinefunction(getattr(f_obj, 'read', None))
@@ -0,0 +1,242 @@
+#!user/bin/python
+# -*- coding: utf-8 -*-
+"""
+'batch.py' contains the batch entry point used to
+parse many spectral data files across a process
+or thread pool.
+"""
+
+# import dependencies
+import io
+import os
+from concurrent import futures
+
+from sparse.parsers import DataFileParser
+from sparse.results import ParseResult
+
+
+def parse_many(sources, delimiter=',', cols=2, dtype=None,
+               executor='process', max_workers=None, chunksize=16,
+               ordered=True):
+    """
+    Validates and reads many data files in parallel.
+
+    Parameters
+    ----------
+    sources (list): items to parse. Each item is a path, or a
+        `(source, f_type)` tuple where `source` is a path or an
+        open file object. When no type is given it is taken from
+        the file extension, or detected from the file contents.\n
+    delimiter (str): delimiter used on csv/txt files.\n
+    cols (int): number of data columns in .txt files.\n
+    dtype (np.dtype): float32 or float64 type of the returned arrays.\n
+    executor (str or Executor): `'process'`, `'thread'`, or an
+        existing `concurrent.futures.Executor` to reuse.\n
+    max_workers (int): pool size, defaults to the cpu count.\n
+    chunksize (int): number of files sent to a worker at a time.
+        Larger chunks keep IPC overhead small on process pools.\n
+    ordered (bool): yield results in input order if True,
+        otherwise as soon as each chunk completes.
+
+    Returns
+    ----------
+    (generator) yields `(index, ParseResult)` tuples where
+    `index` is the position of the item in `sources`. Files
+    that fail to parse yield an invalid result with the error.
+    """
+
+    if chunksize < 1:
+        raise ValueError('Chunk size must be at least 1.')
+
+    jobs = [
+        _make_job(i, item, delimiter, cols, dtype)
+        for i, item in enumerate(sources)
+    ]
+    chunks = [
+        jobs[i:i + chunksize]
+        for i in range(0, len(jobs), chunksize)
+    ]
+
+    own_pool = not isinstance(executor, futures.Executor)
+    pool = _make_pool(executor, max_workers) if own_pool else executor
+
+    try:
+        if ordered:
+            for done in pool.map(_parse_chunk, chunks):
+                for index, result in done:
+                    yield index, result
+        else:
+            pending = [pool.submit(_parse_chunk, c) for c in chunks]
+            for f in futures.as_completed(pending):
+                for index, result in f.result():
+                    yield index, result
+    finally:
+        if own_pool:
+            pool.shutdown(cancel_futures=True)
+
+
+async def aparse_many(sources, delimiter=',', cols=2, dtype=None,
+                      executor='thread', max_workers=None, limit=None,
+                      ordered=False):
+    """
+    Async version of `parse_many()` for use inside an event
+    loop. Inputs are read without blocking the loop and
+    decoded on a bounded executor, with at most `limit`
+    files in flight at a time.
+
+    Parameters
+    ----------
+    sources (list): items to parse, as in `parse_many()`. Open
+        file objects may also be async readers whose `read()`
+        is a coroutine, e.g. web framework uploads.\n
+    delimiter (str): delimiter used on csv/txt files.\n
+    cols (int): number of data columns in csv/txt files.\n
+    dtype (np.dtype): float32 or float64 type of the returned arrays.\n
+    executor (str or Executor): `'thread'`, `'process'`, or an
+        existing `concurrent.futures.Executor` to reuse.\n
+    max_workers (int): pool size, defaults to the cpu count.\n
+    limit (int): maximum number of files read or decoded at
+        the same time, defaults to the pool size. Bounds the
+        memory held by pending inputs.\n
+    ordered (bool): yield results in input order if True,
+        otherwise as soon as each file completes.
+
+    Returns
+    ----------
+    (async generator) yields `(index, ParseResult)` tuples.
+    Closing the generator, or cancelling the task iterating
+    it, cancels every file not parsed yet.
+    """
+
+    # imported here, asyncio is slow to import and process
+    # pool workers import this module to run `_parse_chunk()`
+    import asyncio
+    from sparse import aio
+
+    own_pool = not isinstance(executor, futures.Executor)
+    pool = _make_pool(executor, max_workers) if own_pool else executor
+
+    semaphore = asyncio.Semaphore(limit or max_workers or aio.DEFAULT_WORKERS)
+
+    async def run(index, item):
+        async with semaphore:
+            job = await _amake_job(index, item, delimiter, cols, dtype)
+            done = await aio.run(_parse_chunk, [job], executor=pool)
+            return done[0]
+
+    tasks = [
+        asyncio.ensure_future(run(i, item)) for i, item in enumerate(sources)
+    ]
+
+    try:
+        pending = tasks if ordered else asyncio.as_completed(tasks)
+        for task in pending:
+            yield await task
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if own_pool:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def _amake_job(index, item, delimiter, cols, dtype):
+    """
+    Builds a job without blocking the event loop. Async
+    readers are awaited, other file objects are read on
+    the shared thread pool.
+    """
+
+    from sparse import aio
+
+    source = item[0] if isinstance(item, tuple) else item
+
+    if aio.is_async_reader(source):
+        content = await source.read()
+        buf = (
+            io.StringIO(content) if isinstance(content, str)
+            else io.BytesIO(content)
+        )
+        buf.name = getattr(source, 'name', None) or getattr(
+            source, 'filename', None
+        )
+        item = (buf, item[1]) if isinstance(item, tuple) else buf
+
+    elif not isinstance(source, (str, os.PathLike)):
+        return await aio.run(_make_job, index, item, delimiter, cols, dtype)
+
+    return _make_job(index, item, delimiter, cols, dtype)
+
+
+def _make_pool(executor, max_workers):
+    """
+    Creates the pool named by `executor`.
+    """
+
+    if executor == 'process':
+        return futures.ProcessPoolExecutor(max_workers=max_workers)
+    elif executor == 'thread':
+        return futures.ThreadPoolExecutor(max_workers=max_workers)
+    else:
+        raise ValueError(executor)
+
+
+def _make_job(index, item, delimiter, cols, dtype):
+    """
+    Builds a picklable job description for one item.
+    Open file objects are read here so that only their
+    contents cross the process boundary.
+    """
+
+    if isinstance(item, tuple):
+        source, f_type = item
+    else:
+        source, f_type = item, None
+
+    if f_type is None:
+        name = getattr(source, 'name', source)
+        if isinstance(name, (str, os.PathLike)):
+            f_type = os.path.splitext(os.fspath(name))[1] or None
+
+    options = (f_type and f_type.lower(), delimiter, cols, dtype)
+
+    if isinstance(source, (str, os.PathLike)):
+        return (index, 'path', str(source)) + options
+
+    return (index, 'data', source.read()) + options
+
+
+def _parse_chunk(jobs):
+    """
+    Worker function, parses a chunk of jobs.
+    """
+    return [(job[0], _parse_job(*job[1:])) for job in jobs]
+
+
+def _parse_job(kind, source, f_type, delimiter, cols, dtype):
+    """
+    Parses a single job, capturing any error in the result.
+    """
+
+    try:
+        # paths and bytes are read in place by the parser
+        if isinstance(source, str) and kind == 'data':
+            source = io.StringIO(source)
+
+        return _parse_obj(source, f_type, delimiter, cols, dtype)
+
+    except Exception as e:
+        return ParseResult(valid=False, errors=str(e) or repr(e))
+
+
+def _parse_obj(f_obj, f_type, delimiter, cols, dtype):
+    """
+    Runs a single pass parse on a path, buffer or file object.
+    """
+
+    parser = DataFileParser(
+        f_obj=f_obj, f_type=f_type, delimiter=delimiter, cols=cols,
+        dtype=dtype
+    )
+
+    return parser.parse()
@@ -0,0 +1,313 @@
+#!user/bin/python
+# -*- coding: utf-8 -*-
+"""
+'cache.py' contains the content-addressed parse cache
+used to avoid re-parsing identical spectral files.
+"""
+
+# import dependencies
+import collections
+import hashlib
+import io
+import json
+import os
+import threading
+import numpy as np
+
+from sparse import registry, spa
+from sparse.results import ParseResult
+
+
+class ParseCache():
+    """
+    Content-addressed cache of parse results. Entries
+    are keyed by a hash of the file content plus the
+    parse options, held in a size-bounded in-memory LRU
+    and optionally persisted to `.npz` files on disk.
+    """
+
+    def __init__(self, max_bytes=256 * 2**20, directory=None):
+        """
+        Initialize cache class.
+
+        Parameters
+        ------------
+        max_bytes (int): memory budget of the in-memory tier,
+            least recently used entries are evicted past it.\n
+        directory (str): optional directory of the on-disk tier.
+            Entries evicted from memory stay available there.
+        """
+
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def parse(self, parser):
+        """
+        Returns the parse result for a parser's file,
+        parsing it only if no identical file was parsed
+        with the same options before.
+
+        Parameters
+        ----------
+        parser (DataFileParser): parser holding the file
+            object and options.
+
+        Returns
+        ----------
+        (ParseResult) the cached or freshly parsed result.
+            Its arrays are shared and read-only.
+        """
+
+        content = _read_content(parser.file_obj, parser.file_type)
+        key = self.key(content, parser)
+
+        result = self.get(key)
+        if result is not None:
+            return result
+
+        # parse the in-memory copy, the file is not read again
+        result = parser.__class__(
+            f_obj=_as_file(content),
+            f_type=parser.file_type,
+            delimiter=parser.delimiter,
+            cols=parser.cols,
+            dtype=parser.dtype,
+            channel=parser.channel,
+            stats=parser.stats
+        ).parse()
+
+        return self.put(key, result)
+
+    def key(self, content, parser):
+        """
+        Computes the cache key of a file.
+
+        Parameters
+        ----------
+        content (buffer or str): the file contents.\n
+        parser (DataFileParser): parser holding the options.
+
+        Returns
+        ----------
+        (str) hex digest of the content and options.
+        """
+
+        options = repr((
+            parser.file_type,
+            parser.delimiter,
+            parser.cols,
+            None if parser.dtype is None else np.dtype(parser.dtype).str,
+            parser.channel
+        ))
+
+        h = hashlib.blake2b(options.encode('utf-8'), digest_size=16)
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        h.update(content)
+
+        return h.hexdigest()
+
+    def get(self, key):
+        """
+        Looks up a key in memory, then on disk.
+
+        Parameters
+        ----------
+        key (str): key returned by `key()`.
+
+        Returns
+        ----------
+        (ParseResult) the cached result, or None.
+        """
+
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+
+        result = self._load(key)
+
+        with self._lock:
+            if result is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        self._insert(key, result)
+
+        return result
+
+    def put(self, key, result):
+        """
+        Stores a result in memory and on disk.
+
+        Parameters
+        ----------
+        key (str): key returned by `key()`.\n
+        result (ParseResult): the result to store.
+
+        Returns
+        ----------
+        (ParseResult) the stored result with read-only arrays.
+        """
+
+        result = ParseResult(
+            x_data=_freeze(result.x_data),
+            y_data=_freeze(result.y_data),
+            valid=result.valid,
+            errors=result.errors,
+            metadata=dict(result.metadata)
+        )
+
+        self._insert(key, result)
+        self._save(key, result)
+
+        return result
+
+    def clear(self):
+        """
+        Empties the in-memory tier.
+        """
+
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def _insert(self, key, result):
+        """
+        Adds a result to the LRU and evicts past the budget.
+        """
+
+        with self._lock:
+
+            if key in self._entries:
+                self.nbytes -= _size(self._entries.pop(key))
+
+            self._entries[key] = result
+            self.nbytes += _size(result)
+
+            while self.nbytes > self.max_bytes and len(self._entries) > 1:
+                old_key, old = self._entries.popitem(last=False)
+                self.nbytes -= _size(old)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.npz')
+
+    def _save(self, key, result):
+        """
+        Writes a result to the on-disk tier, if enabled.
+        """
+
+        if self.directory is None:
+            return
+
+        has_data = result.has_data()
+        tmp = self._path(key) + '.tmp'
+
+        with open(tmp, 'wb') as f:
+            np.savez(
+                f,
+                x_data=result.x_data if has_data else np.empty(0),
+                y_data=result.y_data if has_data else np.empty(0),
+                has_data=has_data,
+                valid=result.valid,
+                errors=str(result.errors),
+                metadata=json.dumps(result.metadata, default=str)
+            )
+
+        # readers never see a partial file
+        os.replace(tmp, self._path(key))
+
+    def _load(self, key):
+        """
+        Reads a result from the on-disk tier, if present.
+        """
+
+        if self.directory is None or not os.path.exists(self._path(key)):
+            return None
+
+        with np.load(self._path(key), allow_pickle=False) as npz:
+
+            has_data = bool(npz['has_data'])
+
+            return ParseResult(
+                x_data=_freeze(npz['x_data']) if has_data else None,
+                y_data=_freeze(npz['y_data']) if has_data else None,
+                valid=bool(npz['valid']),
+                errors=str(npz['errors']),
+                metadata=(
+                    json.loads(str(npz['metadata']))
+                    if 'metadata' in npz else None
+                )
+            )
+
+
+def _read_content(f_obj, f_type):
+    """
+    Returns the full contents of a file object or buffer.
+    Binary .spa/.spg files are mapped rather than copied.
+    """
+
+    if registry.is_binary(f_type):
+        return spa.map_buffer(f_obj)
+
+    # buffers of sparse.inputs are shared, not copied
+    if hasattr(f_obj, 'getbuffer'):
+        return f_obj.getbuffer()
+
+    return f_obj.read()
+
+
+def _as_file(content):
+    """
+    Wraps file contents for a new parser.
+    """
+
+    if isinstance(content, str):
+        return io.StringIO(content)
+
+    # bytes are decoded by the new parser if needed
+    return content
+
+
+def _freeze(arr):
+    """
+    Returns a read-only array that owns its memory, so a
+    cached view does not pin the whole source buffer.
+    """
+
+    if arr is None:
+        return None
+
+    arr = np.asarray(arr)
+    if not arr.flags['OWNDATA']:
+        arr = arr.copy()
+
+    arr.setflags(write=False)
+
+    return arr
+
+
+def _size(result):
+    """
+    Approximate memory used by a result.
+    """
+
+    size = 256
+    if result.has_data():
+        size += result.x_data.nbytes + result.y_data.nbytes
+
+    return size
@@ -0,0 +1,100 @@
+#!user/bin/python
+# -*- coding: utf-8 -*-
+"""
+'channels.py' contains the derived channels computed
+from multi-column spectral data. Each channel works on
+column views of the `(n, cols)` numeric block, laid out
+as x, dark, reference and one or more sample columns.
+"""
+
+# import dependencies
+import numpy as np
+
+
+# column layout of multi-channel files
+DARK = 1
+REFERENCE = 2
+SAMPLE = 3
+
+
+def ratio(data, dark=DARK, reference=REFERENCE, sample=None):
+    """
+    Computes the dark corrected ratio
+    `(sample - dark) / (reference - dark)`.
+
+    Parameters
+    ----------
+    data (np.ndarray): numeric block of shape `(n, cols)`.\n
+    dark (int): index of the dark column.\n
+    reference (int): index of the reference column.\n
+    sample (int or slice): index of the sample column, or a
+        slice of replicate columns. Defaults to every column
+        from `SAMPLE` on.
+
+    Returns
+    ----------
+    (np.ndarray) array of shape `(n,)` for a single sample
+    column, `(n, k)` for `k` replicate columns.
+    """
+
+    if sample is None:
+        sample = SAMPLE if data.shape[1] == SAMPLE + 1 else slice(SAMPLE, None)
+
+    d = data[:, dark]
+    scale = data[:, reference] - d
+    out = data[:, sample] - (d if isinstance(sample, int) else d[:, None])
+
+    # divide in place, no further temporaries
+    np.divide(out, scale if out.ndim == 1 else scale[:, None], out=out)
+
+    return out
+
+
+def transmittance(data, dark=DARK, reference=REFERENCE, sample=None):
+    """
+    Transmittance as a fraction, see `ratio()`.
+    """
+    return ratio(data, dark, reference, sample)
+
+
+def absorbance(data, dark=DARK, reference=REFERENCE, sample=None):
+    """
+    Absorbance `-log10(transmittance)`, see `ratio()`.
+    """
+
+    out = ratio(data, dark, reference, sample)
+
+    np.log10(out, out=out)
+    np.negative(out, out=out)
+
+    return out
+
+
+# channels selectable by name
+CHANNELS = {
+    'ratio': ratio,
+    'transmittance': transmittance,
+    'absorbance': absorbance
+}
+
+
+def derive(data, channel):
+    """
+    Computes a named channel.
+
+    Parameters
+    ----------
+    data (np.ndarray): numeric block of shape `(n, cols)`.\n
+    channel (str): one of `CHANNELS`.
+
+    Returns
+    ----------
+    (np.ndarray) the derived channel, see `ratio()`.
+    """
+
+    try:
+        fn = CHANNELS[channel]
+    except KeyError:
+        raise ValueError('Unknown channel: ' + str(channel))
+
+    return fn(data)
@@ -0,0 +1,670 @@
+#!user/bin/python
+# -*- coding: utf-8 -*-
+"""
+'cli.py' contains the `sparse` command line tool used
+to validate, convert and summarize whole directories of
+spectral data files on a pool of worker processes.
+
+Usage
+----------
+sparse validate data/ --report errors.json
+sparse convert 'data/**/*.spa' --to npz --output out/ -j 8
+sparse convert data/ --to library --output all.spl
+sparse summary data/ --report -
+
+Exit status is 0 if every file succeeded, 1 if any file
+failed and 2 on usage errors or when no files match.
+"""
+
+# import dependencies
+import argparse
+import fnmatch
+import glob
+import json
+import os
+import sys
+import time
+import numpy as np
+
+from sparse import registry
+from sparse.parsers import DataFileParser
+
+
+COMMANDS = ('validate', 'convert', 'summary')
+
+# output formats of `convert`, per file except `library`
+TARGETS = ('csv', 'npy', 'npz', 'library')
+
+DTYPES = {'float32': np.float32, 'float64': np.float64}
+
+# seconds between progress updates
+PROGRESS_INTERVAL = 0.2
+
+
+def main(argv=None):
+    """
+    Runs the command line tool.
+
+    Parameters
+    ----------
+    argv (list): arguments, `sys.argv[1:]` by default.
+
+    Returns
+    ----------
+    (int) the exit status.
+    """
+
+    parser = _arguments()
+    args = parser.parse_args(argv)
+
+    if args.command == 'convert':
+        if args.output is None:
+            parser.error('convert requires --output')
+        if args.to is None:
+            args.to = _target(args.output)
+
+    files = collect(args.inputs, pattern=args.pattern)
+    if not files:
+        sys.stderr.write('sparse: no supported files found\n')
+        return 2
+
+    progress = Progress(
+        len(files), enabled=not args.quiet and sys.stderr.isatty()
+    )
+
+    report = run(
+        args.command,
+        files,
+        output=args.output,
+        to=args.to,
+        dtype=DTYPES[args.dtype] if args.dtype else None,
+        delimiter=args.delimiter,
+        cols=args.cols,
+        jobs=args.jobs,
+        chunksize=args.chunksize,
+        progress=progress,
+        log=None if args.quiet else sys.stderr
+    )
+
+    if args.command == 'summary' and args.report != '-':
+        sys.stdout.write(table(report['results']))
+
+    if args.report == '-':
+        json.dump(report, sys.stdout, indent=1)
+        sys.stdout.write('\n')
+    elif args.report:
+        with open(args.report, 'w') as f:
+            json.dump(report, f, indent=1)
+
+    if not args.quiet:
+        sys.stderr.write(progress.summary(report) + '\n')
+
+    return 1 if report['failed'] else 0
+
+
+def collect(inputs, pattern=None):
+    """
+    Expands the command line inputs into the files to
+    process. Directories are searched recursively for
+    supported files, glob patterns are expanded (`**`
+    matches any depth) and files are taken as given.
+
+    Parameters
+    ----------
+    inputs (list): paths, directories or glob patterns.\n
+    pattern (str): optional `fnmatch` pattern of the file
+        names searched in directories.
+
+    Returns
+    ----------
+    (list) `(path, name)` tuples in input order, without
+    duplicates. `name` is the path relative to the input
+    directory, or to the fixed part of a glob pattern, and
+    is used to name outputs.
+    """
+
+    files = []
+    seen = set()
+
+    def add(path, base):
+        key = os.path.abspath(path)
+        if key not in seen:
+            seen.add(key)
+            name = os.path.relpath(path, base) if base else os.path.basename(path)
+            files.append((path, name.replace(os.sep, '/')))
+
+    for item in inputs:
+
+        if os.path.isdir(item):
+            for root, dirs, names in os.walk(item):
+                dirs.sort()
+                for name in sorted(names):
+                    if registry.is_supported(name) and (
+                        pattern is None or fnmatch.fnmatch(name, pattern)
+                    ):
+                        add(os.path.join(root, name), item)
+
+        elif glob.has_magic(item):
+            base = _glob_base(item)
+            for path in sorted(glob.glob(item, recursive=True)):
+                if os.path.isfile(path) and registry.is_supported(path):
+                    add(path, base)
+
+        elif os.path.isfile(item):
+            add(item, None)
+
+        else:
+            sys.stderr.write('sparse: no such file or directory: ' + item + '\n')
+
+    return files
+
+
+def run(command, files, output=None, to=None, dtype=None, delimiter=',',
+        cols=2, jobs=None, chunksize=8, progress=None, log=None):
+    """
+    Runs a command over many files. Files are parsed on a
+    process pool, per-file outputs are written by the
+    workers and a library output by this process.
+
+    Parameters
+    ----------
+    command (str): `validate`, `convert` or `summary`.\n
+    files (list): `(path, name)` tuples as returned by `collect()`.\n
+    output (str): output directory, or library file for
+        `to='library'`.\n
+    to (str): output format of `convert`, one of `TARGETS`.\n
+    dtype (np.dtype): float32 or float64 type of the arrays.\n
+    delimiter (str): delimiter used on csv/txt files.\n
+    cols (int): number of data columns in .txt files.\n
+    jobs (int): worker processes, the cpu count by default.
+        1 runs in this process.\n
+    chunksize (int): number of files sent to a worker at a time.\n
+    progress (Progress): progress display to update.\n
+    log (file): stream receiving one line per failed file.
+
+    Returns
+    ----------
+    (dict) the report, with one entry per file in `results`.
+    `points` counts the axis values of a file, summed over
+    its spectra when each has its own axis.
+    """
+
+    if command not in COMMANDS:
+        raise ValueError(command)
+    if command == 'convert' and to not in TARGETS:
+        raise ValueError(to)
+    if chunksize < 1:
+        raise ValueError('Chunk size must be at least 1.')
+
+    progress = progress or Progress(len(files), enabled=False)
+    library = command == 'convert' and to == 'library'
+
+    jobs_list = []
+    results = [None] * len(files)
+    outputs = {}
+
+    for i, (path, name) in enumerate(files):
+
+        target = None
+        if command == 'convert' and not library:
+            target = os.path.join(
+                output, os.path.splitext(name)[0] + '.' + to
+            )
+            # e.g. a.csv and a.txt both convert to a.npy
+            if target in outputs:
+                results[i] = _record(
+                    path, name, error='Output ' + target + ' also written by '
+                    + files[outputs[target]][0] + '.'
+                )
+                continue
+            outputs[target] = i
+
+        jobs_list.append(
+            (i, path, name, target, command, to, dtype, delimiter, cols)
+        )
+
+    writer = None
+    if library:
+        # imported here, only needed for library outputs
+        from sparse.library import LibraryWriter, entry_ids
+        parent = os.path.dirname(os.path.abspath(output))
+        os.makedirs(parent, exist_ok=True)
+        writer = LibraryWriter(output, dtype=dtype or np.float32)
+
+    progress.start()
+
+    try:
+        for i, record, data in _execute(jobs_list, jobs, chunksize):
+
+            if writer is not None and record['error'] is None:
+                try:
+                    ids = entry_ids(record['name'], len(data))
+                    for id, (x, y, metadata) in zip(ids, data):
+                        writer.append(
+                            (x, y), id=id,
+                            metadata=dict(metadata, source=record['name'])
+                        )
+                    record['output'] = output
+                except (TypeError, ValueError) as e:
+                    record['error'] = str(e)
+
+            results[i] = record
+            progress.update(record['bytes'])
+
+            if log is not None and record['error'] is not None:
+                progress.clear()
+                log.write(record['path'] + ': ' + record['error'] + '\n')
+    finally:
+        if writer is not None:
+            writer.close()
+        progress.finish()
+
+    # files rejected before parsing
+    for i, record in enumerate(results):
+        if record is not None and record['bytes'] is None:
+            record['bytes'] = _size(record['path'])
+            if log is not None:
+                log.write(record['path'] + ': ' + record['error'] + '\n')
+
+    failed = sum(r['error'] is not None for r in results)
+    seconds = progress.elapsed()
+
+    return {
+        'command': command,
+        'to': to,
+        'files': len(results),
+        'succeeded': len(results) - failed,
+        'failed': failed,
+        'seconds': round(seconds, 6),
+        'files_per_second': round(len(results) / seconds, 3) if seconds else None,
+        'bytes_per_second': round(progress.bytes / seconds, 1) if seconds else None,
+        'results': results
+    }
+
+
+def table(results):
+    """
+    Formats the results of `summary` as a tab separated
+    table.
+
+    Returns
+    ----------
+    (str) one header line and one line per file.
+    """
+
+    columns = ('name', 'format', 'valid', 'points', 'spectra', 'x_min', 'x_max')
+    lines = ['\t'.join(columns + ('error',))]
+
+    for record in results:
+        values = [
+            '' if record[c] is None else str(record[c]) for c in columns
+        ]
+        lines.append('\t'.join(values + [record['error'] or '']))
+
+    return '\n'.join(lines) + '\n'
+
+
+class Progress():
+    """
+    Progress and throughput display, written on one
+    line of stderr.
+    """
+
+    def __init__(self, total, enabled=True, stream=None):
+        """
+        Initialize progress class.
+
+        Parameters
+        ------------
+        total (int): number of files.\n
+        enabled (bool): draw the progress line.\n
+        stream (file): output stream, stderr by default.
+        """
+
+        self.total = total
+        self.enabled = enabled
+        self.stream = stream or sys.stderr
+        self.done = 0
+        self.bytes = 0
+        self._start = None
+        self._stop = None
+        self._drawn = 0.0
+
+    def start(self):
+        self._start = time.perf_counter()
+
+    def update(self, nbytes):
+        """
+        Counts one processed file of `nbytes` bytes.
+        """
+
+        self.done += 1
+        self.bytes += nbytes or 0
+
+        now = time.perf_counter()
+        if self.enabled and (
+            now - self._drawn >= PROGRESS_INTERVAL or self.done == self.total
+        ):
+            self._drawn = now
+            self.stream.write('\r' + self.line())
+            self.stream.flush()
+
+    def clear(self):
+        """
+        Erases the progress line before other output.
+        """
+        if self.enabled:
+            self.stream.write('\r\x1b[K')
+
+    def finish(self):
+        self._stop = time.perf_counter()
+        if self.enabled:
+            self.stream.write('\n')
+
+    def elapsed(self):
+        """
+        Returns the seconds since `start()`.
+        """
+
+        if self._start is None:
+            return 0.0
+
+        return (self._stop or time.perf_counter()) - self._start
+
+    def line(self):
+        """
+        Returns the progress line, e.g.
+        `[ 120/500]  24.0 files/s  3.10 MB/s`.
+        """
+
+        seconds = self.elapsed() or float('inf')
+        width = len(str(self.total))
+
+        return '[%*d/%d] %7.1f files/s %8.2f MB/s' % (
+            width, self.done, self.total, self.done / seconds,
+            self.bytes / seconds / 1.0E6
+        )
+
+    def summary(self, report):
+        """
+        Returns the closing line of a `run()` report.
+        """
+
+        seconds = self.elapsed() or float('inf')
+
+        return '%d files, %d failed in %.2f s, %.1f files/s, %.2f MB/s' % (
+            report['files'], report['failed'], self.elapsed(),
+            self.done / seconds, self.bytes / seconds / 1.0E6
+        )
+
+
+def _execute(jobs, workers, chunksize):
+    """
+    Runs the jobs, in this process if `workers` is 1.
+
+    Returns
+    ----------
+    (generator) yields `(index, record, data)` tuples as
+    chunks complete.
+    """
+
+    chunks = [
+        jobs[i:i + chunksize] for i in range(0, len(jobs), chunksize)
+    ]
+
+    if workers == 1:
+        for chunk in chunks:
+            yield from _run_chunk(chunk)
+        return
+
+    # imported here, workers import this module to run
+    # `_run_chunk()` and single process runs need no pool
+    from concurrent import futures
+
+    pool = futures.ProcessPoolExecutor(max_workers=workers)
+
+    try:
+        pending = [pool.submit(_run_chunk, c) for c in chunks]
+        for f in futures.as_completed(pending):
+            yield from f.result()
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def _run_chunk(jobs):
+    """
+    Worker function, processes a chunk of jobs.
+    """
+    return [_run_job(*job) for job in jobs]
+
+
+def _run_job(index, path, name, target, command, to, dtype, delimiter, cols):
+    """
+    Parses one file and writes its per-file output. Only
+    library outputs send the arrays back. Files holding
+    several spectra with their own axes, e.g. JSON documents,
+    write one output per spectrum, numbered from 1.
+
+    Returns
+    ----------
+    (tuple) `(index, record, data)` where `data` is a list
+    of `(x, y, metadata)` tuples or None.
+    """
+
+    record = _record(path, name)
+    record['bytes'] = _size(path)
+    f_type = os.path.splitext(path)[1].lower()
+
+    try:
+        parser = DataFileParser(
+            f_obj=path, f_type=f_type, delimiter=delimiter, cols=cols,
+            dtype=dtype
+        )
+        result = parser.parse()
+        spectra = [
+            (np.asarray(x), np.asarray(y)) for x, y in parser.read_spectra()
+        ]
+    except Exception as e:
+        record['error'] = str(e) or repr(e)
+        return index, record, None
+
+    record['format'] = registry.lookup(f_type).name
+    record['valid'] = bool(result.valid)
+
+    # invalid files still report the data that was read
+    if not spectra and result.has_data():
+        spectra = [(np.asarray(result.x_data), np.asarray(result.y_data))]
+
+    if spectra and all(len(x) for x, y in spectra):
+        record['points'] = sum(len(x) for x, y in spectra)
+        record['spectra'] = sum(y.size // len(x) for x, y in spectra)
+        record['x_min'] = min(float(x.min()) for x, y in spectra)
+        record['x_max'] = max(float(x.max()) for x, y in spectra)
+
+    if not result.valid:
+        record['error'] = result.errors or 'File is not valid.'
+        return index, record, None
+
+    if command != 'convert':
+        return index, record, None
+
+    if record['points'] is None:
+        record['error'] = 'Data arrays must have length > 0.'
+        return index, record, None
+
+    if to == 'library':
+        return index, record, [(x, y, result.metadata) for x, y in spectra]
+
+    targets = [target]
+    if len(spectra) > 1:
+        stem = os.path.splitext(target)[0]
+        targets = [
+            stem + '_' + str(i) + '.' + to for i in range(1, len(spectra) + 1)
+        ]
+
+    try:
+        for out, (x, y) in zip(targets, spectra):
+            _write(out, to, x, y)
+        record['output'] = targets[0] if len(targets) == 1 else targets
+    except (OSError, ValueError) as e:
+        record['error'] = str(e)
+
+    return index, record, None
+
+
+def _write(path, to, x, y):
+    """
+    Writes one spectrum. CSV and NPY files hold the axis
+    and one column per spectrum, NPZ files the `x` and
+    `y` arrays as parsed.
+    """
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+    if to == 'npz':
+        np.savez(path, x=x, y=y)
+        return
+
+    # series are stored one row per spectrum
+    if y.ndim == 2 and y.shape[0] != len(x):
+        y = y.T
+    columns = np.column_stack((x, y))
+
+    if to == 'npy':
+        np.save(path, columns)
+        return
+
+    names = ['value'] if columns.shape[1] == 2 else [
+        'value' + str(i + 1) for i in range(columns.shape[1] - 1)
+    ]
+    np.savetxt(
+        path, columns, delimiter=',', fmt='%.10g', comments='',
+        header=','.join(['wavelength'] + names)
+    )
+
+
+def _record(path, name, error=None):
+    """
+    Returns an empty report entry of one file.
+    """
+
+    return {
+        'path': path,
+        'name': name,
+        'format': None,
+        'valid': False,
+        'points': None,
+        'spectra': None,
+        'x_min': None,
+        'x_max': None,
+        'bytes': None,
+        'output': None,
+        'error': error
+    }
+
+
+def _size(path):
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def _glob_base(pattern):
+    """
+    Returns the leading directories of a glob pattern
+    that hold no wildcards.
+    """
+
+    parts = pattern.replace(os.sep, '/').split('/')
+    fixed = []
+
+    for part in parts[:-1]:
+        if glob.has_magic(part):
+            break
+        fixed.append(part)
+
+    return '/'.join(fixed) or '.'
+
+
+def _target(output):
+    """
+    Guesses the output format of `convert` from the
+    output path: library files end in `.spl`.
+    """
+    return 'library' if output.lower().endswith('.spl') else 'csv'
+
+
+def _arguments():
+
+    parser = argparse.ArgumentParser(
+        prog='sparse',
+        description='Validate, convert and summarize spectral data files.'
+    )
+    parser.add_argument(
+        'command', choices=COMMANDS, help='action to run on every file'
+    )
+    parser.add_argument(
+        'inputs', nargs='+',
+        help='files, directories (searched recursively) or glob patterns'
+    )
+    parser.add_argument(
+        '-o', '--output',
+        help='output directory, or library file with --to library'
+    )
+    parser.add_argument(
+        '--to', choices=TARGETS,
+        help='output format of convert, csv by default or library for '
+             'a .spl output'
+    )
+    parser.add_argument(
+        '--pattern', help='file name pattern searched in directories'
+    )
+    parser.add_argument(
+        '-j', '--jobs', type=_positive, help='worker processes, cpu count by default'
+    )
+    parser.add_argument(
+        '--chunksize', type=_positive, default=8,
+        help='files sent to a worker at a time'
+    )
+    parser.add_argument(
+        '--dtype', choices=list(DTYPES), help='type of the converted values'
+    )
+    parser.add_argument(
+        '--delimiter', default=',', help='delimiter of csv files'
+    )
+    parser.add_argument(
+        '--cols', type=int, default=2, help='data columns of txt files'
+    )
+    parser.add_argument(
+        '--report', metavar='FILE',
+        help='write a JSON report, - for stdout'
+    )
+    parser.add_argument(
+        '-q', '--quiet', action='store_true',
+        help='no progress or error lines on stderr'
+    )
+
+    return parser
+
+
+def _positive(text):
+    """
+    Argument type of counts, a positive int.
+    """
+
+    try:
+        value = int(text)
+    except ValueError:
+        value = 0
+
+    if value < 1:
+        raise argparse.ArgumentTypeError(
+            'must be a positive integer, got ' + repr(text)
+        )
+
+    return value
+
+
+if __name__ == '__main__':
+    sys.exit(main())
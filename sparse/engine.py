@@ -0,0 +1,245 @@
+#!user/bin/python
+# -*- coding: utf-8 -*-
+"""
+'engine.py' contains the bulk numeric engine used
+to convert delimited spectral text (csv, txt) into
+contiguous numpy arrays.
+"""
+
+# import dependencies
+import csv
+import io
+import itertools
+import numpy as np
+
+
+def split_header(text, delimiter=',', cols=2):
+    """
+    Finds the boundary between the header rows and the
+    numeric block of a delimited text buffer. A row is
+    considered numeric when its first `cols` fields can
+    be converted to float.
+
+    Parameters
+    ----------
+    text (str): the full text buffer.\n
+    delimiter (str): the column delimiter.\n
+    cols (int): number of leading columns that must be numeric.
+
+    Returns
+    ----------
+    `(tuple) (header, offset)` where `header` is a list of
+    the split header rows and `offset` is the index in `text`
+    where the numeric block begins.
+    """
+
+    header = []
+    pos = 0
+    size = len(text)
+
+    while pos < size:
+
+        # locate the end of the current line
+        end = text.find('\n', pos)
+        end = size if end < 0 else end + 1
+
+        row = _split_row(text[pos:end], delimiter)
+        if _is_numeric(row, cols):
+            return header, pos
+
+        header.append(row)
+        pos = end
+
+    return header, size
+
+
+def _split_row(line, delimiter):
+    """
+    Splits a single line into its fields. A `None`
+    delimiter splits on runs of whitespace.
+    """
+
+    if delimiter is None:
+        return line.split()
+
+    return next(csv.reader([line], delimiter=delimiter), [])
+
+
+def _is_numeric(row, cols):
+    """
+    Returns True if the first `cols` fields of `row`
+    convert to float.
+    """
+    try:
+        for c in range(cols):
+            float(row[c])
+        return True
+    except (ValueError, IndexError):
+        return False
+
+
+def parse_block(text, delimiter=',', cols=2, quotechar=None,
+                dtype=np.float64):
+    """
+    Converts the numeric block of a delimited text buffer
+    into a C-contiguous array of shape `(n, cols)`.
+    The whole block is handed to numpy's C parser in one call;
+    if any row does not parse cleanly the block is re-read
+    row by row and the bad rows are skipped.
+
+    Parameters
+    ----------
+    text (str): numeric block, header rows already removed.\n
+    delimiter (str): the column delimiter.\n
+    cols (int): number of leading columns to read.\n
+    quotechar (str): optional quote character for csv fields.\n
+    dtype (np.dtype): float32 or float64 output type.
+
+    Returns
+    ----------
+    (np.ndarray) array of shape `(n, cols)`.
+    """
+
+    if not text:
+        return np.empty((0, cols), dtype=dtype)
+
+    try:
+        data = np.loadtxt(
+            io.StringIO(text),
+            dtype=dtype,
+            delimiter=delimiter,
+            comments=None,
+            quotechar=quotechar,
+            usecols=range(cols),
+            ndmin=2
+        )
+    except ValueError:
+        data = _parse_rows(text, delimiter, cols, dtype)
+
+    return np.ascontiguousarray(data)
+
+
+def parse_block_strict(text, delimiter=',', quotechar=None,
+                       dtype=np.float64):
+    """
+    Converts the numeric block of a delimited text buffer
+    only if every row is numeric and has the same number of
+    columns. Used by the validators to confirm a clean file
+    without a second pass.
+
+    Parameters
+    ----------
+    text (str): numeric block, header rows already removed.\n
+    delimiter (str): the column delimiter.\n
+    quotechar (str): optional quote character for csv fields.\n
+    dtype (np.dtype): float32 or float64 output type.
+
+    Returns
+    ----------
+    (np.ndarray) array of shape `(n, ncols)`, or
+    `None` if any row is irregular.
+    """
+
+    # blank lines are rejected by the validators
+    if not text or text.isspace() or '\n\n' in text or '\n\r\n' in text:
+        return None
+
+    try:
+        data = np.loadtxt(
+            io.StringIO(text),
+            dtype=dtype,
+            delimiter=delimiter,
+            comments=None,
+            quotechar=quotechar,
+            ndmin=2
+        )
+    except ValueError:
+        return None
+
+    return data
+
+
+def _parse_rows(text, delimiter, cols, dtype):
+    """
+    Slow path for `parse_block()`. Converts the block one row
+    at a time, skipping any row that cannot be converted.
+    """
+
+    values = []
+
+    if delimiter is None:
+        rows = (line.split() for line in io.StringIO(text))
+    else:
+        rows = csv.reader(io.StringIO(text), delimiter=delimiter)
+
+    for r in rows:
+        try:
+            values.append([float(r[c]) for c in range(cols)])
+        except (ValueError, IndexError):
+            pass
+
+    if not values:
+        return np.empty((0, cols), dtype=dtype)
+
+    return np.array(values, dtype=dtype)
+
+
+def iter_delimited(f_obj, delimiter=',', cols=2, quotechar=None,
+                   block_size=65536, dtype=np.float64):
+    """
+    Reads a delimited text file object as a stream of
+    numeric blocks. At most `block_size` lines are held
+    in memory at a time, regardless of the file size.
+
+    Parameters
+    ----------
+    f_obj (obj): text file object to be read.\n
+    delimiter (str): the column delimiter.\n
+    cols (int): number of leading columns to read.\n
+    quotechar (str): optional quote character for csv fields.\n
+    block_size (int): number of rows per block.\n
+    dtype (np.dtype): float32 or float64 output type.
+
+    Returns
+    ----------
+    (generator) yields arrays of shape `(block_size, cols)`,
+    the last block may be shorter.
+    """
+
+    lines = iter(f_obj)
+
+    # skip the header rows
+    first = None
+    for line in lines:
+        if _is_numeric(_split_row(line, delimiter), cols):
+            first = line
+            break
+
+    if first is None:
+        return
+
+    pending = [first]
+    carry = np.empty((0, cols), dtype=dtype)
+
+    while True:
+
+        pending.extend(itertools.islice(lines, block_size - len(pending)))
+        if not pending:
+            break
+
+        data = parse_block(
+            ''.join(pending), delimiter, cols, quotechar, dtype
+        )
+        pending = []
+
+        # skipped rows leave short blocks, top them up
+        if len(carry):
+            data = np.concatenate((carry, data))
+
+        for i in range(0, len(data) - block_size + 1, block_size):
+            yield data[i:i + block_size]
+
+        carry = data[len(data) - len(data) % block_size:]
+
+    if len(carry):
+        yield carry
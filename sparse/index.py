@@ -0,0 +1,406 @@
+#!user/bin/python
+# -*- coding: utf-8 -*-
+"""
+'index.py' contains the persistent metadata index used
+to search a spectral file tree without re-parsing it.
+Header metadata of every supported file is kept in a
+local SQLite database, refreshed incrementally.
+"""
+
+# import dependencies
+import datetime
+import fnmatch
+import hashlib
+import json
+import os
+import sqlite3
+
+from sparse import registry
+from sparse.parsers import DataFileParser
+
+
+# bytes hashed at a time
+HASH_CHUNK = 2**20
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    hash TEXT NOT NULL,
+    format TEXT,
+    title TEXT,
+    instrument TEXT,
+    date TEXT,
+    points INTEGER,
+    x_min REAL,
+    x_max REAL,
+    metadata TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS files_instrument ON files (instrument);
+CREATE INDEX IF NOT EXISTS files_range ON files (x_min, x_max);
+CREATE INDEX IF NOT EXISTS files_date ON files (date);
+"""
+
+# columns returned by `search()`
+COLUMNS = (
+    'path', 'size', 'mtime_ns', 'hash', 'format', 'title', 'instrument',
+    'date', 'points', 'x_min', 'x_max', 'metadata', 'error'
+)
+
+# date layouts of the supported headers
+_DATE_FORMATS = (
+    '%a %b %d %H:%M:%S %Y',
+    '%Y-%m-%dT%H:%M:%S',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y/%m/%d %H:%M:%S',
+    '%Y/%m/%d',
+    '%d/%m/%y',
+    '%Y-%m-%d'
+)
+
+
+class SpectralIndex():
+    """
+    SQLite index of the header metadata of spectral files.
+    Files are keyed by absolute path with their size,
+    modification time and content hash, so a refresh only
+    re-reads the files that changed.
+    """
+
+    def __init__(self, path):
+        """
+        Initialize index class.
+
+        Parameters
+        ------------
+        path (str): the database file, created if needed.
+        """
+
+        self.path = os.fspath(path)
+        self._db = sqlite3.connect(self.path)
+        self._db.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self._db.execute('SELECT COUNT(*) FROM files').fetchone()[0]
+
+    def refresh(self, root, pattern=None, max_workers=None):
+        """
+        Indexes every supported file under a directory.
+        Files whose size and mtime are unchanged are skipped,
+        changed files are hashed and re-read only if their
+        content differs, and files that no longer exist are
+        removed.
+
+        Parameters
+        ----------
+        root (str): directory searched recursively.\n
+        pattern (str): optional `fnmatch` pattern of file names.\n
+        max_workers (int): threads reading headers, defaults to
+            the pool default.
+
+        Returns
+        ----------
+        (dict) number of files `added`, `updated`, `unchanged`,
+        `removed` and `failed` to parse.
+        """
+
+        root = os.path.abspath(root)
+        counts = dict.fromkeys(
+            ('added', 'updated', 'unchanged', 'removed', 'failed'), 0
+        )
+
+        # only files the pattern selects are refreshed or removed
+        known = {
+            row[0]: row[1:] for row in self._db.execute(
+                'SELECT path, size, mtime_ns, hash FROM files '
+                'WHERE substr(path, 1, ?) = ?',
+                (len(root) + 1, root + os.sep)
+            )
+            if _matches(os.path.basename(row[0]), pattern)
+        }
+
+        changed = []
+        seen = set()
+
+        for path, stat in _walk(root, pattern):
+            seen.add(path)
+            old = known.get(path)
+            if old is not None and old[:2] == (stat.st_size, stat.st_mtime_ns):
+                counts['unchanged'] += 1
+            else:
+                changed.append((path, stat, old))
+
+        # imported here, only a refresh needs the pool
+        from concurrent import futures
+
+        with futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = pool.map(_try_read, changed)
+
+            with self._db:
+                for (path, stat, old), (row, error) in zip(changed, results):
+
+                    if error is not None:
+                        # unreadable files keep their row, files
+                        # gone since the walk lose it
+                        counts['failed'] += 1
+                        if not os.path.exists(path):
+                            seen.discard(path)
+                        continue
+
+                    if row is None:
+                        # same content, only the mtime moved
+                        self._db.execute(
+                            'UPDATE files SET size = ?, mtime_ns = ? '
+                            'WHERE path = ?',
+                            (stat.st_size, stat.st_mtime_ns, path)
+                        )
+                        counts['unchanged'] += 1
+                        continue
+
+                    self._db.execute(
+                        'INSERT OR REPLACE INTO files VALUES ('
+                        + ', '.join('?' * len(COLUMNS)) + ')',
+                        row
+                    )
+                    counts['added' if old is None else 'updated'] += 1
+                    if row[-1] is not None:
+                        counts['failed'] += 1
+
+                removed = [(p,) for p in known if p not in seen]
+                self._db.executemany(
+                    'DELETE FROM files WHERE path = ?', removed
+                )
+                counts['removed'] = len(removed)
+
+        return counts
+
+    def search(self, instrument=None, title=None, covers=None,
+               date_from=None, date_to=None, format=None):
+        """
+        Finds indexed files by their header metadata. All
+        given criteria must match.
+
+        Parameters
+        ----------
+        instrument (str): spectrometer serial or name.\n
+        title (str): substring of the title, case-insensitive.\n
+        covers (tuple): `(low, high)` range in nanometers the
+            spectrum must span.\n
+        date_from (str): earliest acquisition date, ISO format.\n
+        date_to (str): latest acquisition date, ISO format.\n
+        format (str): format name, e.g. `spa`.
+
+        Returns
+        ----------
+        (list) of dicts, one per file, with `metadata` decoded.
+        """
+
+        where = []
+        args = []
+
+        if instrument is not None:
+            where.append('instrument = ?')
+            args.append(instrument)
+        if title is not None:
+            where.append("title LIKE ? ESCAPE '\\'")
+            args.append('%' + _escape(title) + '%')
+        if covers is not None:
+            where.append('x_min <= ? AND x_max >= ?')
+            args.extend((min(covers), max(covers)))
+        if date_from is not None:
+            where.append('date >= ?')
+            args.append(date_from)
+        if date_to is not None:
+            where.append('date <= ?')
+            args.append(date_to)
+        if format is not None:
+            where.append('format = ?')
+            args.append(format)
+
+        sql = 'SELECT * FROM files'
+        if where:
+            sql += ' WHERE ' + ' AND '.join(where)
+
+        rows = []
+        for row in self._db.execute(sql + ' ORDER BY path', args):
+            row = dict(zip(COLUMNS, row))
+            row['metadata'] = json.loads(row['metadata'] or '{}')
+            rows.append(row)
+
+        return rows
+
+    def close(self):
+        """
+        Closes the database.
+        """
+        self._db.close()
+
+
+def _walk(root, pattern):
+    """
+    Yields `(path, stat)` of the supported files under `root`.
+    """
+
+    stack = [root]
+
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif (
+                    entry.is_file()
+                    and registry.is_supported(entry.name)
+                    and _matches(entry.name, pattern)
+                ):
+                    yield entry.path, entry.stat()
+
+
+def _matches(name, pattern):
+    """
+    Returns True if a file name matches the optional
+    `fnmatch` pattern.
+    """
+    return pattern is None or fnmatch.fnmatch(name, pattern)
+
+
+def _try_read(job):
+    """
+    Runs `_read()` on a `(path, stat, old)` job.
+
+    Returns
+    ----------
+    (tuple) `(row, None)`, or `(None, error)` if the file
+    could not be read.
+    """
+
+    try:
+        return _read(*job), None
+    except Exception as e:
+        return None, e
+
+
+def _read(path, stat, old):
+    """
+    Hashes a file and reads its header metadata.
+
+    Returns
+    ----------
+    (tuple) the row of the file, or None if its content
+    matches the hash of the indexed row `old`.
+    """
+
+    digest = _hash(path)
+    if old is not None and old[2] == digest:
+        return None
+
+    ext = os.path.splitext(path)[1].lower()
+    fmt = registry.lookup(ext)
+    metadata = {}
+    error = None
+
+    try:
+        metadata = DataFileParser(f_obj=path, f_type=ext).read_metadata()
+    except NotImplementedError:
+        pass
+    except Exception as e:
+        error = str(e) or repr(e)
+
+    x_range = _range_nm(metadata)
+
+    return (
+        path,
+        stat.st_size,
+        stat.st_mtime_ns,
+        digest,
+        fmt.name,
+        metadata.get('title'),
+        metadata.get('spectrometer') or _label(metadata, 'SPECTROMETERDATASYSTEM'),
+        _iso_date(metadata.get('date') or _label(metadata, 'LONGDATE')),
+        metadata.get('points'),
+        None if x_range is None else min(x_range),
+        None if x_range is None else max(x_range),
+        json.dumps(metadata, default=str),
+        error
+    )
+
+
+def _hash(path):
+    """
+    Returns the blake2b hex digest of a file.
+    """
+
+    h = hashlib.blake2b(digest_size=16)
+
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b''):
+            h.update(chunk)
+
+    return h.hexdigest()
+
+
+def _label(metadata, name):
+    """
+    Returns a JCAMP-DX label value, if any.
+    """
+    return metadata.get('labels', {}).get(name)
+
+
+def _range_nm(metadata):
+    """
+    Returns the `x_range` of the metadata in nanometers.
+    JCAMP-DX ranges in wavenumbers are converted.
+    """
+
+    x_range = metadata.get('x_range')
+    if x_range is None:
+        return None
+
+    units = str(metadata.get('x_units', '')).upper().replace(' ', '')
+    if units in ('1/CM', 'CM-1', 'CM^-1'):
+        if not all(x_range):
+            return None
+        x_range = tuple(1.0E7 / x for x in x_range)
+
+    return x_range
+
+
+def _iso_date(text):
+    """
+    Converts a header date to ISO format, dropping any
+    time zone name. Unknown layouts are kept as-is.
+    """
+
+    if not text:
+        return None
+
+    # OceanView dates carry a zone name, e.g. 'EDT'
+    words = text.split()
+    if len(words) == 6:
+        words.pop(4)
+    plain = ' '.join(words)
+
+    for layout in _DATE_FORMATS:
+        try:
+            return datetime.datetime.strptime(plain, layout).isoformat()
+        except ValueError:
+            pass
+
+    return text
+
+
+def _escape(text):
+    """
+    Escapes the LIKE wildcards of a search string.
+    """
+    return (
+        text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    )
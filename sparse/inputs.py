@@ -0,0 +1,203 @@
+#!user/bin/python
+# -*- coding: utf-8 -*-
+"""
+'inputs.py' contains the input layer of the parsers.
+Paths, bytes-like objects and binary streams become a
+`BufferReader` over the raw bytes, mapped or shared
+without copying. Text streams are used as given.
+"""
+
+# import dependencies
+import codecs
+import io
+import mmap
+import os
+
+
+ENCODING = 'utf-8'
+
+
+class BufferReader(io.RawIOBase):
+    """
+    Seekable binary stream over a buffer. Like
+    `io.BytesIO`, `getbuffer()` returns the buffer itself,
+    but the buffer is never copied and can be a memory
+    mapping.
+    """
+
+    def __init__(self, buf, name=None, pos=0):
+        """
+        Initialize reader class.
+
+        Parameters
+        ------------
+        buf (buffer): bytes, bytearray, memoryview or mmap.\n
+        name (str): path of the file the buffer holds, if any.\n
+        pos (int): initial stream position.
+        """
+
+        super().__init__()
+        self._buf = memoryview(buf).cast('B')
+        self._pos = pos
+        self.name = name
+
+    def __len__(self):
+        return len(self._buf)
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def getbuffer(self):
+        """
+        Returns a read-only view of the whole buffer.
+        """
+        return self._buf.toreadonly()
+
+    def read(self, size=-1):
+        """
+        Reads up to `size` bytes, all remaining bytes
+        if `size` is negative.
+        """
+
+        start = self._pos
+        stop = len(self._buf) if size is None or size < 0 else start + size
+        data = bytes(self._buf[start:stop])
+        self._pos = start + len(data)
+
+        return data
+
+    def readall(self):
+        return self.read()
+
+    def readinto(self, b):
+        data = self._buf[self._pos:self._pos + len(b)]
+        n = len(data)
+        memoryview(b).cast('B')[:n] = data
+        self._pos += n
+
+        return n
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._buf)
+        self._pos = max(offset, 0)
+
+        return self._pos
+
+    def tell(self):
+        return self._pos
+
+
+def open_input(source):
+    """
+    Normalizes a parser input. Nothing is decoded here and
+    only streams that cannot be mapped are read.
+
+    Parameters
+    ----------
+    source (obj): a path, a bytes/bytearray/memoryview/mmap
+        object, a binary stream, or a text stream.
+
+    Returns
+    ----------
+    (obj) a `BufferReader` for paths and binary inputs, the
+    source itself for text streams and other objects (e.g.
+    async uploads).
+    """
+
+    if source is None or isinstance(source, BufferReader):
+        return source
+
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        with open(path, 'rb') as f:
+            return BufferReader(_map(f) or b'', name=path)
+
+    if isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+        return BufferReader(source)
+
+    if isinstance(source, io.BytesIO):
+        return BufferReader(source.getbuffer())
+
+    if not is_binary(source):
+        return source
+
+    name = getattr(source, 'name', None)
+    name = name if isinstance(name, str) else None
+
+    # real OS files are mapped, others read once
+    buf = _map(source)
+    if buf is None:
+        try:
+            source.seek(0)
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            pass
+        buf = source.read()
+
+    return BufferReader(buf, name=name)
+
+
+def is_binary(f_obj):
+    """
+    Returns True if `f_obj` is a binary stream.
+    """
+
+    if isinstance(f_obj, io.TextIOBase):
+        return False
+
+    if isinstance(f_obj, (io.RawIOBase, io.BufferedIOBase)):
+        return True
+
+    return 'b' in str(getattr(f_obj, 'mode', ''))
+
+
+def read_text(f_obj, encoding=ENCODING, errors='strict'):
+    """
+    Returns the remaining contents of an input as text.
+    Buffers are decoded in one pass without an intermediate
+    copy, with universal newlines as in text mode.
+    """
+
+    if not isinstance(f_obj, BufferReader):
+        return f_obj.read()
+
+    text = codecs.decode(f_obj.getbuffer()[f_obj.tell():], encoding, errors)
+
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+
+    return text
+
+
+def text_stream(f_obj, encoding=ENCODING, errors='strict'):
+    """
+    Returns a text stream over an input, read line by line
+    or in chunks. Buffers are decoded as they are read, from
+    their current position, without moving it.
+    """
+
+    if not isinstance(f_obj, BufferReader):
+        return f_obj
+
+    raw = BufferReader(f_obj.getbuffer(), name=f_obj.name, pos=f_obj.tell())
+
+    return io.TextIOWrapper(
+        io.BufferedReader(raw), encoding=encoding, errors=errors
+    )
+
+
+def _map(f_obj):
+    """
+    Returns a read-only mapping of a real OS file, or
+    None if it cannot be mapped (e.g. empty files).
+    """
+
+    try:
+        return mmap.mmap(f_obj.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+        return None
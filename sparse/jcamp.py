@@ -0,0 +1,400 @@
+#!user/bin/python
+# -*- coding: utf-8 -*-
+"""
+'jcamp.py' contains the JCAMP-DX backend. Labelled
+data records are split with a single regex and the
+compressed XYDATA forms (AFFN, PAC, SQZ, DIF, DUP)
+are decoded with a translation table and numpy.
+"""
+
+# import dependencies
+import re
+import numpy as np
+
+
+# one labelled data record, up to the next '##'
+_LDR = re.compile(r'^[ \t]*##(.*?)=(.*?)(?=^[ \t]*##|\Z)', re.M | re.S)
+
+# characters ignored in label names
+_LABEL_CHARS = re.compile(r'[\s\-/_]')
+
+# '$$' comments run to the end of the line
+_COMMENT = re.compile(r'\$\$[^\r\n]*')
+
+# PAC sign separators, skipping exponents
+_PAC_SIGN = re.compile(r'(?<![eE])([+-])')
+
+# an AFFN exponent, between a mantissa digit and the end of a number
+_EXPONENT = re.compile(r'\d\.?[eE][+-]?\d+(?![\d.eE])')
+
+# character classes of the XYDATA byte decoder
+_DIGIT, _SQZ, _DIF, _DUP, _SIGN, _POINT, _SEP, _EOL = range(1, 9)
+
+# per-byte lookup tables: class, digit value and sign
+_CLASS = np.zeros(256, dtype=np.int8)
+_VALUE = np.zeros(256, dtype=np.float64)
+_SIGNS = np.ones(256, dtype=np.float64)
+
+for _i, _c in enumerate('0123456789'):
+    _CLASS[ord(_c)], _VALUE[ord(_c)] = _DIGIT, _i
+for _i, _c in enumerate('@ABCDEFGHI'):
+    _CLASS[ord(_c)], _VALUE[ord(_c)] = _SQZ, _i
+for _i, _c in enumerate('abcdefghi'):
+    _CLASS[ord(_c)], _VALUE[ord(_c)], _SIGNS[ord(_c)] = _SQZ, _i + 1, -1
+for _i, _c in enumerate('%JKLMNOPQR'):
+    _CLASS[ord(_c)], _VALUE[ord(_c)] = _DIF, _i
+for _i, _c in enumerate('jklmnopqr'):
+    _CLASS[ord(_c)], _VALUE[ord(_c)], _SIGNS[ord(_c)] = _DIF, _i + 1, -1
+for _i, _c in enumerate('STUVWXYZs'):
+    _CLASS[ord(_c)], _VALUE[ord(_c)] = _DUP, _i + 1
+for _c in ' \t\r,;':
+    _CLASS[ord(_c)] = _SEP
+_CLASS[ord('+')] = _SIGN
+_CLASS[ord('-')], _SIGNS[ord('-')] = _SIGN, -1
+_CLASS[ord('.')] = _POINT
+_CLASS[ord('\n')] = _EOL
+
+# exact powers of ten for the digit positions
+_POW10 = 10.0 ** np.arange(32)
+
+# labels holding a data table
+DATA_LABELS = ('XYDATA', 'XYPOINTS', 'PEAKTABLE')
+
+
+def read_blocks(text):
+    """
+    Splits a JCAMP-DX document into its blocks and
+    decodes the data table of each block. Compound
+    (LINK) files return one entry per nested block.
+
+    Parameters
+    ----------
+    text (str): the JCAMP-DX document.
+
+    Returns
+    ----------
+    (list) of dicts mapping normalized labels (e.g. `FIRSTX`)
+    to their string values, in document order. Blocks with a
+    data table also hold the decoded `x` and `y` arrays.
+    """
+
+    if '$$' in text:
+        text = _COMMENT.sub('', text)
+
+    blocks = []
+    stack = []
+
+    for name, value in _LDR.findall(text):
+
+        label = normalize_label(name)
+
+        # each TITLE opens a block, each END closes one
+        if label == 'TITLE':
+            stack.append({'TITLE': value.strip()})
+        elif not stack:
+            continue
+        elif label == 'END':
+            blocks.append(_finish_block(stack.pop()))
+        else:
+            stack[-1][label] = value if label in DATA_LABELS else value.strip()
+
+    # unterminated blocks are kept for validation
+    while stack:
+        block = _finish_block(stack.pop())
+        block['UNTERMINATED'] = True
+        blocks.append(block)
+
+    return blocks
+
+
+def normalize_label(name):
+    """
+    Returns the normalized form of a label name, e.g.
+    `FIRSTX` for `First X`.
+    """
+    return _LABEL_CHARS.sub('', name).upper()
+
+
+def read_labels(text):
+    """
+    Reads the labels of the innermost block of a JCAMP-DX
+    header, e.g. the text up to the first data table.
+
+    Parameters
+    ----------
+    text (str): the header text.
+
+    Returns
+    ----------
+    (dict) mapping normalized labels to their string values.
+    """
+
+    blocks = read_blocks(text)
+    if not blocks:
+        raise ValueError('No TITLE found in JCAMP-DX file.')
+
+    labels = blocks[0]
+    labels.pop('UNTERMINATED', None)
+
+    return labels
+
+
+def read_jcamp(text):
+    """
+    Reads the first block of a JCAMP-DX document that
+    holds a data table.
+
+    Parameters
+    ----------
+    text (str): the JCAMP-DX document.
+
+    Returns
+    ----------
+    (dict) the decoded block, see `read_blocks()`.
+    """
+
+    for block in read_blocks(text):
+        if 'x' in block:
+            return block
+
+    raise ValueError('No data table found in JCAMP-DX file.')
+
+
+def check_block(block):
+    """
+    Checks a decoded block against its own labels.
+
+    Parameters
+    ----------
+    block (dict): block returned by `read_blocks()`.
+
+    Returns
+    ----------
+    (str) an error message, or None if the block is valid.
+    """
+
+    if 'JCAMPDX' not in block:
+        return 'No ##JCAMP-DX label found.'
+
+    if block.get('UNTERMINATED'):
+        return 'No ##END label found.'
+
+    if 'x' not in block:
+        return 'No data table found in JCAMP-DX file.'
+
+    if len(block['x']) != len(block['y']):
+        return 'Data arrays must have equal length.'
+
+    if len(block['y']) == 0:
+        return 'Data arrays must have length > 0.'
+
+    if 'NPOINTS' in block and int(float(block['NPOINTS'])) != len(block['y']):
+        return (
+            'Expected ' + block['NPOINTS'] + ' points, found '
+            + str(len(block['y'])) + '.'
+        )
+
+    return None
+
+
+def _finish_block(block):
+    """
+    Decodes the data table of a closed block.
+    """
+
+    for label in DATA_LABELS:
+        if label in block:
+            block['x'], block['y'] = _decode_table(block, label)
+            break
+
+    return block
+
+
+def _decode_table(block, label):
+    """
+    Decodes a data table and applies the x/y factors.
+    """
+
+    form, _, table = block[label].partition('\n')
+    form = form.replace(' ', '').upper()
+
+    xfactor = _number(block, 'XFACTOR', 1.0)
+    yfactor = _number(block, 'YFACTOR', 1.0)
+
+    if form.startswith('(X++(Y..Y))') or form.startswith('(X++(R..R))'):
+
+        line_x, y = decode_xydata(table)
+
+        n = len(y)
+        firstx = _number(block, 'FIRSTX', None)
+        lastx = _number(block, 'LASTX', None)
+
+        if firstx is None:
+            firstx = line_x[0] * xfactor if len(line_x) else 0.0
+        if lastx is None:
+            lastx = firstx + _number(block, 'DELTAX', 1.0) * (n - 1)
+
+        x = np.linspace(firstx, lastx, n)
+
+        return x, y * yfactor
+
+    # (XY..XY) point tables
+    values = np.array(
+        table.replace(',', ' ').replace(';', ' ').split(), dtype=np.float64
+    )
+    if len(values) % 2:
+        raise ValueError('Unpaired value in ' + label + ' table.')
+
+    values = values.reshape(-1, 2)
+
+    return values[:, 0] * xfactor, values[:, 1] * yfactor
+
+
+def decode_xydata(table):
+    """
+    Decodes an `(X++(Y..Y))` table in any mix of AFFN,
+    PAC, SQZ, DIF and DUP forms. Every byte of the table
+    is classified through lookup tables and the values,
+    DUP expansion, DIF accumulation and removal of the
+    DIF y-check values are computed with numpy, without
+    a per-character Python loop.
+
+    Parameters
+    ----------
+    table (str): the table lines following the form line.
+
+    Returns
+    ----------
+    `(tuple) (line_x, y)` where `line_x` holds the abscissa
+    that starts each line and `y` the unscaled ordinates.
+    """
+
+    chars = np.frombuffer(table.encode('latin-1'), dtype=np.uint8)
+    cls = _CLASS.take(chars)
+
+    # AFFN exponents clash with the SQZ 'E' and 'e'
+    if _is_exponent_table(table, chars, cls):
+        return _decode_affn(table)
+
+    if (cls == 0).any():
+        bad = chr(chars[np.argmax(cls == 0)])
+        raise ValueError('Invalid character ' + repr(bad) + ' in XYDATA.')
+
+    # tokens open on a pseudo-digit or sign, or on a
+    # digit or point that follows a separator
+    lead = (cls >= _SQZ) & (cls <= _SIGN)
+    body = (cls == _DIGIT) | (cls == _POINT)
+    joined = np.zeros(len(cls), dtype=bool)
+    joined[1:] = body[1:] & (body[:-1] | lead[:-1])
+    starts = np.flatnonzero((lead | body) & ~joined)
+
+    if len(starts) == 0:
+        return np.empty(0), np.empty(0)
+
+    n = len(starts)
+    token = np.cumsum(lead | (body & ~joined), dtype=np.intp) - 1
+
+    # mantissa from the digits of each token, the last
+    # digit of a token has power zero
+    digits = np.flatnonzero((cls >= _DIGIT) & (cls <= _DUP))
+    d_tok = token[digits]
+    count = np.bincount(d_tok, minlength=n)
+    last = np.cumsum(count) - 1
+    power = last[d_tok] - np.arange(len(digits))
+    if count.max() > len(_POW10):
+        raise ValueError('Too many digits in XYDATA value.')
+    mantissa = np.bincount(
+        d_tok, weights=_VALUE[chars[digits]] * _POW10[power], minlength=n
+    )
+
+    # digits after a decimal point scale the mantissa
+    is_point = cls == _POINT
+    if is_point.any():
+        points = np.cumsum(is_point, dtype=np.int32)
+        before = points[starts] - is_point[starts]
+        frac = np.bincount(
+            d_tok, weights=points[digits] > before[d_tok], minlength=n
+        )
+        mantissa /= _POW10[frac.astype(np.intp)]
+
+    values = _SIGNS[chars[starts]] * mantissa
+    kind = cls[starts]
+    line = np.cumsum(cls == _EOL, dtype=np.int32)[starts]
+
+    # the first value of each line is its abscissa
+    is_x = np.ones(n, dtype=bool)
+    is_x[1:] = line[1:] != line[:-1]
+
+    line_x = values[is_x]
+
+    # DUP counts repeat the preceding ordinate
+    is_dup = kind == _DUP
+    is_y = ~is_x & ~is_dup
+    repeats = np.ones(n, dtype=np.int64)
+    dup_at = np.flatnonzero(is_dup)
+    repeats[dup_at - 1] = values[dup_at].astype(np.int64)
+
+    y_vals = np.repeat(values[is_y], repeats[is_y])
+    y_dif = np.repeat(kind[is_y] == _DIF, repeats[is_y])
+    y_line = np.repeat(line[is_y], repeats[is_y])
+
+    if len(y_vals) == 0:
+        return line_x, y_vals
+
+    if y_dif[0]:
+        raise ValueError('XYDATA table starts with a DIF value.')
+
+    # DIF values accumulate from the last absolute value
+    group = np.cumsum(~y_dif) - 1
+    absolute = np.flatnonzero(~y_dif)
+    steps = np.cumsum(np.where(y_dif, y_vals, 0.0))
+    y = y_vals[absolute][group] + steps - steps[absolute][group]
+
+    # a line following a DIF value repeats it as a y-check
+    check = np.zeros(len(y), dtype=bool)
+    check[1:] = (y_line[1:] != y_line[:-1]) & y_dif[:-1]
+
+    return line_x, y[~check]
+
+
+def _is_exponent_table(table, chars, cls):
+    """
+    True if the only letters of a table are AFFN exponents,
+    each following a mantissa and closing its number. SQZ
+    tables such as '100E23E45' use 'E' as a pseudo-digit.
+    """
+
+    letters = chars[(cls >= _SQZ) & (cls <= _DUP)]
+    return (
+        len(letters) > 0
+        and bool(np.all((letters == ord('e')) | (letters == ord('E'))))
+        and len(_EXPONENT.findall(table)) == len(letters)
+    )
+
+
+def _decode_affn(table):
+    """
+    Decodes an AFFN table with exponents, line by line.
+    """
+
+    line_x = []
+    y = []
+
+    for row in table.splitlines():
+        values = _PAC_SIGN.sub(r' \1', row).replace(',', ' ').split()
+        if values:
+            line_x.append(float(values[0]))
+            y.extend(float(v) for v in values[1:])
+
+    return np.array(line_x), np.array(y)
+
+
+def _number(block, label, default):
+    """
+    Returns a numeric label value, or `default`.
+    """
+
+    try:
+        return float(block[label])
+    except (KeyError, ValueError):
+        return default
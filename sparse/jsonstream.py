@@ -0,0 +1,481 @@
+#!user/bin/python
+# -*- coding: utf-8 -*-
+"""
+'jsonstream.py' contains the incremental JSON backend.
+Documents are scanned chunk by chunk and numeric arrays
+are converted in bulk, so no Python object tree of the
+document is ever built.
+"""
+
+# import dependencies
+import codecs
+import json
+import re
+import warnings
+import numpy as np
+
+
+# keys holding the x, y and paired [[x, y], ...] arrays
+X_KEYS = ('x', 'x_data', 'wavelength', 'wavelengths', 'wavenumbers')
+Y_KEYS = ('y', 'y_data', 'value', 'values', 'intensity', 'absorbance')
+XY_KEYS = ('xy', 'data', 'points')
+
+# characters read from the file at a time
+CHUNK_SIZE = 2**16
+
+# JSON scalars other than strings
+_SCALAR = re.compile(r'-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?|true|false|null')
+
+# anything that cannot appear in a plain array of numbers
+_NON_NUMERIC = re.compile(r'[^-+0-9.eE,\s]')
+
+_WHITESPACE = ' \t\n\r'
+
+# array brackets, counted to find the end of nested arrays
+_BRACKET = re.compile(r'[\[\]]')
+
+# first characters of a JSON number
+_NUMBER_START = '-0123456789'
+
+
+def iter_spectra(f_obj, chunk_size=CHUNK_SIZE):
+    """
+    Yields the spectra of a JSON document as it is read.
+    A spectrum is any object holding both an x and a y
+    array (see `X_KEYS` and `Y_KEYS`) or a paired array
+    (`XY_KEYS`), at any depth: a single object, a list of
+    objects, or a list nested under any key.
+
+    Parameters
+    ----------
+    f_obj (obj): text or binary file object.\n
+    chunk_size (int): characters read from the file at a time.
+
+    Returns
+    ----------
+    (generator) of dicts holding the `x` and `y` float64 arrays
+    and the scalar members of the spectrum object.
+    """
+
+    scanner = _Scanner(f_obj, chunk_size)
+
+    yield from _walk(scanner)
+
+    if scanner.peek() != '':
+        raise ValueError(
+            'Extra data after JSON document at ' + scanner.where() + '.'
+        )
+
+
+def read_metadata(f_obj, chunk_size=CHUNK_SIZE):
+    """
+    Reads the members of a JSON document other than its
+    data arrays, which are skipped without being converted.
+
+    Parameters
+    ----------
+    f_obj (obj): text or binary file object.\n
+    chunk_size (int): characters read from the file at a time.
+
+    Returns
+    ----------
+    (dict) the scalar members of the root object, the number
+    of `spectra` and the scalar `members` of each spectrum.
+    """
+
+    scanner = _Scanner(f_obj, chunk_size)
+    root = {}
+
+    if scanner.peek() == '{':
+        spectra = _walk_object(scanner, convert=False, members=root)
+    else:
+        spectra = _walk(scanner, convert=False)
+
+    members = [
+        {k: v for k, v in spectrum.items() if k not in ('x', 'y')}
+        for spectrum in spectra
+    ]
+
+    if scanner.peek() != '':
+        raise ValueError(
+            'Extra data after JSON document at ' + scanner.where() + '.'
+        )
+
+    metadata = {
+        k: v for k, v in root.items() if not isinstance(v, np.ndarray)
+    }
+    metadata['spectra'] = len(members)
+    metadata['members'] = members
+
+    return metadata
+
+
+def check_spectrum(spectrum):
+    """
+    Checks the arrays of a spectrum.
+
+    Parameters
+    ----------
+    spectrum (dict): spectrum yielded by `iter_spectra()`.
+
+    Returns
+    ----------
+    (str) an error message, or None if the spectrum is valid.
+    """
+
+    if len(spectrum['x']) != len(spectrum['y']):
+        return 'Data arrays must have equal length.'
+
+    if len(spectrum['y']) == 0:
+        return 'Data arrays must have length > 0.'
+
+    return None
+
+
+class _Scanner():
+    """
+    Sliding window over a file object.
+    """
+
+    def __init__(self, f_obj, chunk_size):
+
+        self.f_obj = f_obj
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.offset = 0
+        self.eof = False
+        self.decoder = None
+
+    def where(self):
+        return 'character ' + str(self.offset + self.pos)
+
+    def fill(self, size=None):
+        """
+        Reads the next chunk, dropping consumed text.
+        Returns False at the end of the file.
+        """
+
+        if self.eof:
+            return False
+
+        chunk = self.f_obj.read(size or self.chunk_size)
+
+        if not isinstance(chunk, str):
+            if self.decoder is None:
+                self.decoder = codecs.getincrementaldecoder('utf-8')()
+            chunk = self.decoder.decode(bytes(chunk), final=not chunk)
+
+        if not chunk:
+            self.eof = True
+
+        self.offset += self.pos
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+
+        return not self.eof
+
+    def peek(self):
+        """
+        Skips whitespace and returns the next character,
+        or '' at the end of the document.
+        """
+
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf) or not self.fill():
+                return self.buf[self.pos:self.pos + 1]
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(
+                'Expected ' + repr(char) + ' at ' + self.where() + '.'
+            )
+        self.pos += 1
+
+    def find(self, text, index):
+        """
+        Returns the buffer index of the next `text` at or
+        after `index`, reading more of the file as needed.
+        """
+
+        while True:
+            end = self.buf.find(text, index)
+            if end >= 0:
+                return end
+            # keep an overlap for multi-character text, and grow
+            # the reads so that long arrays are not copied often
+            index = max(len(self.buf) - len(text) + 1, self.pos) - self.pos
+            if not self.fill(max(self.chunk_size, len(self.buf) - self.pos)):
+                raise ValueError('Unexpected end of JSON document.')
+
+    def closing(self, index, depth=1):
+        """
+        Returns the buffer index of the `]` closing the
+        arrays opened `depth` levels up from `index`, counting
+        nested brackets and reading more of the file as needed.
+        """
+
+        while True:
+            match = _BRACKET.search(self.buf, index)
+            if match is None:
+                index = len(self.buf) - self.pos
+                if not self.fill(max(self.chunk_size, index)):
+                    raise ValueError('Unexpected end of JSON document.')
+                continue
+            index = match.end()
+            depth += 1 if match.group() == '[' else -1
+            if depth == 0:
+                return match.start()
+
+    def skip(self, index):
+        """
+        Returns the buffer index of the first non-whitespace
+        character at or after `index`, reading more of the
+        file as needed. Reads may move the buffer, so earlier
+        indices are not kept valid.
+        """
+
+        while True:
+            while index < len(self.buf) and self.buf[index] in _WHITESPACE:
+                index += 1
+            if index < len(self.buf):
+                return index
+            ahead = index - self.pos
+            if not self.fill():
+                return index
+            index = self.pos + ahead
+
+    def array_kind(self):
+        """
+        Classifies the array at the current position without
+        consuming it.
+
+        Returns
+        ----------
+        (str) `numbers` for a flat array of numbers, `pairs` for
+        an array of number arrays, `empty`, or None for any
+        other array.
+        """
+
+        i = self.skip(self.pos + 1)
+        char = self.buf[i:i + 1]
+
+        if char == ']':
+            return 'empty'
+
+        if char == '[':
+            i = self.skip(i + 1)
+            char = self.buf[i:i + 1]
+            return 'pairs' if char and char in _NUMBER_START else None
+
+        return 'numbers' if char and char in _NUMBER_START else None
+
+    def string(self):
+        """
+        Reads a string literal.
+        """
+
+        self.expect('"')
+
+        end = self.find('"', self.pos)
+        while True:
+            # an odd run of backslashes escapes the quote
+            text = self.buf[self.pos:end]
+            if (len(text) - len(text.rstrip('\\'))) % 2 == 0:
+                break
+            end = self.find('"', end + 1)
+
+        value = json.decoder.scanstring(self.buf, self.pos)[0]
+        self.pos = end + 1
+
+        return value
+
+    def scalar(self):
+        """
+        Reads a number, true, false or null.
+        """
+
+        self.peek()
+
+        # a value at the end of the buffer may continue
+        while True:
+            match = _SCALAR.match(self.buf, self.pos)
+            if match is not None and match.end() < len(self.buf):
+                break
+            if match is None and len(self.buf) - self.pos > 64:
+                break
+            if not self.fill():
+                break
+
+        if match is None:
+            raise ValueError('Invalid JSON value at ' + self.where() + '.')
+
+        self.pos = match.end()
+
+        return json.loads(match.group())
+
+    def numbers(self, pairs=False):
+        """
+        Converts an array of numbers in bulk. The opening
+        bracket has been consumed. With `pairs`, the brackets
+        of the outer array and of its first pair have been
+        consumed and the text up to the closing bracket of the
+        outer array is read as `[x, y]` pairs.
+        """
+
+        end = self.closing(self.pos, 2) if pairs else self.find(']', self.pos)
+        span = self.buf[self.pos:end]
+        self.pos = end + 1
+
+        if pairs:
+            count = 2 * (span.count('[') + 1)
+            span = span.replace('[', '').replace(']', '')
+
+        if _NON_NUMERIC.search(span):
+            raise ValueError(
+                'Non-numeric value in data array before ' + self.where() + '.'
+            )
+
+        if not span.strip():
+            return np.empty(0)
+
+        # older numpy warns on malformed text rather than
+        # raising, the count check catches it
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', DeprecationWarning)
+                values = np.fromstring(span, dtype=np.float64, sep=',')
+        except ValueError:
+            values = None
+
+        if values is None or len(values) != span.count(',') + 1:
+            raise ValueError(
+                'Invalid data array before ' + self.where() + '.'
+            )
+
+        if pairs:
+            if len(values) != count:
+                raise ValueError(
+                    'Data pairs must hold 2 values before '
+                    + self.where() + '.'
+                )
+            values = values.reshape(-1, 2)
+
+        return values
+
+
+def _walk(scanner, convert=True):
+    """
+    Walks one JSON value, yielding the spectra inside it.
+    """
+
+    char = scanner.peek()
+
+    if char == '{':
+        yield from _walk_object(scanner, convert)
+    elif char == '[':
+        scanner.pos += 1
+        while scanner.peek() != ']':
+            yield from _walk(scanner, convert)
+            if scanner.peek() != ']':
+                scanner.expect(',')
+        scanner.pos += 1
+    elif char == '"':
+        scanner.string()
+    elif char == '':
+        raise ValueError('Unexpected end of JSON document.')
+    else:
+        scanner.scalar()
+
+
+def _walk_object(scanner, convert=True, members=None):
+    """
+    Walks an object, converting its data arrays in bulk
+    and yielding it if it is a spectrum. Without `convert`,
+    data arrays are skipped and held as empty arrays. The
+    members are collected into `members` if given.
+    """
+
+    scanner.expect('{')
+    spectrum = {} if members is None else members
+
+    while scanner.peek() != '}':
+
+        key = scanner.string()
+        scanner.expect(':')
+
+        name = key.lower()
+        char = scanner.peek()
+
+        if char == '[' and _is_data(spectrum, name, scanner.array_kind()):
+            fields = ('x', 'y') if name in XY_KEYS else (
+                ('x',) if name in X_KEYS else ('y',)
+            )
+            if not convert:
+                scanner.pos = scanner.closing(scanner.pos + 1) + 1
+                spectrum.update((f, np.empty(0)) for f in fields)
+            elif name in XY_KEYS:
+                spectrum.update(_pairs(scanner))
+            else:
+                scanner.pos += 1
+                spectrum[fields[0]] = scanner.numbers()
+        elif char in '[{':
+            yield from _walk(scanner, convert)
+        elif char == '"':
+            spectrum[key] = scanner.string()
+        else:
+            spectrum[key] = scanner.scalar()
+
+        if scanner.peek() != '}':
+            scanner.expect(',')
+
+    scanner.pos += 1
+
+    if (isinstance(spectrum.get('x'), np.ndarray)
+            and isinstance(spectrum.get('y'), np.ndarray)):
+        yield spectrum
+
+
+def _is_data(spectrum, name, kind):
+    """
+    Returns True if the array of member `name` is data of
+    the spectrum: numbers under an x or y key, pairs under a
+    paired key, and only while that data is not set yet.
+    Other arrays (e.g. a `data` list of spectra) are walked.
+    """
+
+    if name in XY_KEYS:
+        fields = ('x', 'y')
+        kinds = ('pairs', 'empty')
+    elif name in X_KEYS + Y_KEYS:
+        fields = ('x',) if name in X_KEYS else ('y',)
+        kinds = ('numbers', 'empty')
+    else:
+        return False
+
+    if kind not in kinds:
+        return False
+
+    return not any(isinstance(spectrum.get(f), np.ndarray) for f in fields)
+
+
+def _pairs(scanner):
+    """
+    Converts a `[[x, y], ...]` array in bulk.
+    """
+
+    scanner.expect('[')
+
+    if scanner.peek() == ']':
+        scanner.pos += 1
+        return {'x': np.empty(0), 'y': np.empty(0)}
+
+    scanner.expect('[')
+    values = scanner.numbers(pairs=True)
+
+    return {
+        'x': np.ascontiguousarray(values[:, 0]),
+        'y': np.ascontiguousarray(values[:, 1])
+    }
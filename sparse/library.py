@@ -0,0 +1,535 @@
+#!user/bin/python
+# -*- coding: utf-8 -*-
+"""
+'library.py' contains the native spectral library
+container: an append-only binary file holding many
+parsed spectra and their metadata, read back through
+a memory mapping without re-parsing the source files.
+
+Layout
+----------
+header: `MAGIC`, format version and value dtype.\n
+records: the values of each spectrum, then its explicit
+    axis if any, then its metadata as JSON, 8-byte aligned.\n
+index: one `INDEX` entry per spectrum, then the ids as a
+    JSON list.\n
+footer: offsets of the index and ids, written last.
+
+Appending writes new records, a new index and a new footer
+after the old footer, so existing bytes are never modified.
+"""
+
+# import dependencies
+import json
+import mmap
+import os
+import struct
+import numpy as np
+
+from sparse import registry
+from sparse.results import Spectrum
+
+
+MAGIC = b'SPARSLIB'
+VERSION = 1
+
+# magic, version, dtype code
+HEADER = struct.Struct('<8sHB5x')
+
+# index offset, count, ids offset, ids size, magic
+FOOTER = struct.Struct('<QQQQ8s')
+
+# value dtypes by code
+DTYPES = {0: np.dtype('<f4'), 1: np.dtype('<f8')}
+
+# axis units by code
+UNITS = {0: 'nm', 1: 'cm-1'}
+
+# one entry per spectrum, `x_offset` is 0 for
+# implicit axes, `rows` is 0 for 1-D values
+INDEX = np.dtype([
+    ('y_offset', '<u8'),
+    ('x_offset', '<u8'),
+    ('meta_offset', '<u8'),
+    ('meta_size', '<u4'),
+    ('points', '<u4'),
+    ('rows', '<u4'),
+    ('unit', 'u1'),
+    ('pad', 'V3'),
+    ('start', '<f8'),
+    ('stop', '<f8')
+])
+
+
+class LibraryWriter():
+    """
+    Appends spectra to a library file, creating it if
+    needed. The index is written by `close()`, use the
+    writer as a context manager.
+    """
+
+    def __init__(self, path, dtype=np.float32):
+        """
+        Initialize writer class.
+
+        Parameters
+        ------------
+        path (str): the library file.\n
+        dtype (np.dtype): float32 or float64 type of the stored
+            values. Ignored for existing libraries, which keep
+            their own dtype.
+        """
+
+        self.path = os.fspath(path)
+
+        if os.path.exists(self.path) and os.path.getsize(self.path):
+            with SpectralLibrary(self.path) as lib:
+                self.dtype = lib.dtype
+                self._entries = [lib.index.copy()]
+                self._ids = list(lib.ids)
+            self._file = open(self.path, 'r+b')
+            self._file.seek(0, os.SEEK_END)
+        else:
+            self.dtype = np.dtype(dtype).newbyteorder('<')
+            self._entries = []
+            self._ids = []
+            self._file = open(self.path, 'wb')
+            self._file.write(
+                HEADER.pack(MAGIC, VERSION, _dtype_code(self.dtype))
+            )
+
+        self._known = set(self._ids)
+        self._replaced = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __contains__(self, id):
+        return str(id) in self._known
+
+    def append(self, spectrum, id=None, metadata=None, replace=False):
+        """
+        Appends one spectrum.
+
+        Parameters
+        ----------
+        spectrum (obj): a `Spectrum`, an `(x, y)` tuple as
+            returned by `read_data()`, or a `ParseResult`.
+            Evenly spaced axes are stored as `(start, stop)`.\n
+        id (str): unique id of the spectrum, its row number
+            by default.\n
+        metadata (dict): JSON serializable metadata.\n
+        replace (bool): if True, an existing spectrum of the
+            same id is replaced in place, its old records are
+            left unreferenced in the file.
+
+        Returns
+        ----------
+        (int) the row of the spectrum.
+        """
+
+        if not isinstance(spectrum, Spectrum):
+            if hasattr(spectrum, 'x_data'):
+                if not spectrum.has_data():
+                    raise ValueError('Result holds no data.')
+                spectrum = (spectrum.x_data, spectrum.y_data)
+            spectrum = Spectrum.from_arrays(*spectrum)
+
+        row = len(self._ids)
+        id = str(row) if id is None else str(id)
+        if id in self._known:
+            if not replace:
+                raise ValueError('Duplicate id ' + id + '.')
+            row = self._ids.index(id)
+
+        y = np.ascontiguousarray(spectrum.y, dtype=self.dtype)
+        if y.ndim not in (1, 2) or y.shape[-1] != len(spectrum):
+            raise ValueError('Data arrays must have equal length.')
+
+        # values that are not JSON types are stored as strings
+        meta = json.dumps(metadata or {}, default=str).encode('utf-8')
+
+        entry = np.zeros(1, INDEX)
+        entry['points'] = len(spectrum)
+        entry['rows'] = y.shape[0] if y.ndim == 2 else 0
+        entry['unit'] = 0 if spectrum.unit == 'nm' else 1
+        entry['y_offset'] = self._write(y.tobytes())
+
+        if spectrum.is_linear():
+            entry['start'], entry['stop'] = spectrum.limits()
+        else:
+            x = np.ascontiguousarray(spectrum.axis(), dtype=self.dtype)
+            entry['x_offset'] = self._write(x.tobytes())
+
+        if metadata:
+            entry['meta_offset'] = self._write(meta)
+            entry['meta_size'] = len(meta)
+
+        if row < len(self._ids):
+            self._replaced[row] = entry
+            return row
+
+        self._entries.append(entry)
+        self._ids.append(id)
+        self._known.add(id)
+
+        return row
+
+    def close(self):
+        """
+        Writes the index and footer and closes the file.
+        """
+
+        if self._file is None:
+            return
+
+        index = (
+            np.concatenate(self._entries) if self._entries
+            else np.zeros(0, INDEX)
+        )
+        for row, entry in self._replaced.items():
+            index[row] = entry[0]
+        ids = json.dumps(self._ids).encode('utf-8')
+
+        index_offset = self._write(index.tobytes())
+        ids_offset = self._write(ids)
+        self._file.write(
+            FOOTER.pack(index_offset, len(index), ids_offset, len(ids), MAGIC)
+        )
+
+        self._file.close()
+        self._file = None
+
+    def _write(self, data):
+        """
+        Writes `data` at the next 8-byte boundary and
+        returns its offset.
+        """
+
+        pos = self._file.tell()
+        pad = -pos % 8
+        if pad:
+            self._file.write(bytes(pad))
+
+        self._file.write(data)
+
+        return pos + pad
+
+
+class SpectralLibrary():
+    """
+    Read-only view of a library file. The file is mapped
+    once, spectra are returned as zero-copy views of the
+    mapping.
+    """
+
+    def __init__(self, path):
+        """
+        Initialize library class.
+
+        Parameters
+        ------------
+        path (str): the library file.
+        """
+
+        self.path = os.fspath(path)
+
+        with open(self.path, 'rb') as f:
+            self._buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        buf = self._buf
+
+        if len(buf) < HEADER.size + FOOTER.size:
+            raise ValueError('File too short for a spectral library.')
+
+        magic, version, code = HEADER.unpack_from(buf, 0)
+        if magic != MAGIC:
+            raise ValueError('Not a spectral library.')
+        if version > VERSION:
+            raise ValueError('Unsupported library version.')
+
+        index_offset, count, ids_offset, ids_size, end = FOOTER.unpack_from(
+            buf, len(buf) - FOOTER.size
+        )
+        if end != MAGIC:
+            raise ValueError('Library index not found, file is incomplete.')
+
+        self.dtype = DTYPES[code]
+        self.index = np.frombuffer(
+            buf, INDEX, count=count, offset=index_offset
+        )
+        self.ids = json.loads(bytes(buf[ids_offset:ids_offset + ids_size]))
+        self._rows = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return len(self.index)
+
+    def __getitem__(self, key):
+        """
+        Returns a spectrum by row or id, or the values of
+        a slice of rows, see `spectrum()` and `matrix()`.
+        """
+
+        if isinstance(key, slice):
+            return self.matrix(key)
+
+        return self.spectrum(key)
+
+    def row(self, key):
+        """
+        Returns the row of a spectrum id. Integers are
+        returned as rows, negative ones from the end.
+        """
+
+        if isinstance(key, (int, np.integer)):
+            if not -len(self) <= key < len(self):
+                raise IndexError(key)
+            return int(key) % len(self)
+
+        if self._rows is None:
+            self._rows = {id: i for i, id in enumerate(self.ids)}
+
+        return self._rows[key]
+
+    def spectrum(self, key):
+        """
+        Returns one spectrum.
+
+        Parameters
+        ----------
+        key (int or str): the row or id.
+
+        Returns
+        ----------
+        (Spectrum) with `y` a read-only view of the file.
+        """
+
+        entry = self.index[self.row(key)]
+        points = int(entry['points'])
+        rows = int(entry['rows'])
+
+        y = np.frombuffer(
+            self._buf, self.dtype, count=max(rows, 1) * points,
+            offset=int(entry['y_offset'])
+        )
+        if rows:
+            y = y.reshape(rows, points)
+
+        unit = UNITS[int(entry['unit'])]
+
+        if entry['x_offset']:
+            x = np.frombuffer(
+                self._buf, self.dtype, count=points,
+                offset=int(entry['x_offset'])
+            )
+            return Spectrum(y, x=x, unit=unit)
+
+        return Spectrum(
+            y, start=float(entry['start']), stop=float(entry['stop']),
+            n=points, unit=unit
+        )
+
+    def matrix(self, rows=slice(None)):
+        """
+        Returns the values of many 1-D spectra as one
+        `(n, points)` array. Runs of spectra written one
+        after the other with the same length are a single
+        strided view of the file, others are copied.
+
+        Parameters
+        ----------
+        rows (slice): the rows to return.
+
+        Returns
+        ----------
+        (np.ndarray) the values.
+        """
+
+        index = self.index[rows]
+
+        if not len(index):
+            return np.empty((0, 0), self.dtype)
+
+        if index['rows'].any():
+            raise ValueError('Series entries have no 1-D values.')
+
+        points = int(index['points'][0])
+        if (index['points'] != points).any():
+            raise ValueError('Spectra must have equal length.')
+
+        size = self.dtype.itemsize
+        offsets = index['y_offset'].astype(np.int64)
+        steps = np.diff(offsets)
+        stride = int(steps[0]) if len(steps) else points * size
+
+        # one view over consecutive records
+        if (steps == stride).all() and stride >= points * size:
+            return np.ndarray(
+                (len(index), points), self.dtype, buffer=self._buf,
+                offset=int(offsets[0]), strides=(stride, size)
+            )
+
+        return np.stack([
+            np.frombuffer(self._buf, self.dtype, count=points, offset=o)
+            for o in offsets.tolist()
+        ])
+
+    def metadata(self, key):
+        """
+        Returns the metadata dict of a spectrum.
+        """
+
+        entry = self.index[self.row(key)]
+        offset = int(entry['meta_offset'])
+        size = int(entry['meta_size'])
+
+        if not size:
+            return {}
+
+        return json.loads(bytes(self._buf[offset:offset + size]))
+
+    def close(self):
+        """
+        Releases the mapping. Views handed out keep it
+        alive until they are released.
+        """
+
+        self.index = None
+        try:
+            self._buf.close()
+        except BufferError:
+            pass
+
+
+def build_library(source, path, pattern='*', dtype=np.float32,
+                  executor='process', max_workers=None, chunksize=16,
+                  existing='error'):
+    """
+    Parses every supported file under a directory into a
+    library, appending to it if it exists. Files are parsed
+    in parallel with `sparse.batch.parse_many()`.
+
+    Parameters
+    ----------
+    source (str): directory searched recursively.\n
+    path (str): the library file.\n
+    pattern (str): glob pattern of the files to include.\n
+    dtype (np.dtype): float32 or float64 type of new libraries.\n
+    executor, max_workers, chunksize: see `parse_many()`.\n
+    existing (str): files already in the library are
+        reported as duplicates with `error`, left unread
+        with `skip` or read again with `replace`.
+
+    Returns
+    ----------
+    (dict) error message of every file that was skipped,
+    by path. Files are stored by their path relative to
+    `source`, see `entry_ids()` for files of several
+    spectra.
+    """
+
+    # imported here, batch imports the parsers
+    import pathlib
+    from sparse.batch import parse_many
+    from sparse.parsers import DataFileParser
+
+    if existing not in ('error', 'skip', 'replace'):
+        raise ValueError('Existing must be error, skip or replace.')
+
+    root = pathlib.Path(source)
+    files = sorted(
+        p for p in root.rglob(pattern)
+        if p.is_file() and registry.is_supported(p)
+    )
+
+    skipped = {}
+
+    with LibraryWriter(path, dtype=dtype) as writer:
+
+        if existing == 'skip':
+            # files of several spectra are stored from 'name#1'
+            names = [p.relative_to(root).as_posix() for p in files]
+            files = [
+                p for p, name in zip(files, names)
+                if name not in writer and entry_ids(name, 2)[0] not in writer
+            ]
+
+        results = parse_many(
+            [str(p) for p in files], executor=executor,
+            max_workers=max_workers, chunksize=chunksize
+        )
+
+        for i, result in results:
+
+            name = files[i].relative_to(root).as_posix()
+
+            if not result.valid or not result.has_data():
+                skipped[name] = result.errors
+                continue
+
+            if not len(result.x_data):
+                skipped[name] = 'Data arrays must have length > 0.'
+                continue
+
+            metadata = dict(result.metadata, source=name)
+
+            try:
+                spectra = [result]
+                if result.metadata.get('spectra', 1) > 1:
+                    # documents of several spectra are read again
+                    spectra = DataFileParser(f_obj=files[i]).read_spectra()
+                for id, spectrum in zip(entry_ids(name, len(spectra)), spectra):
+                    writer.append(
+                        spectrum, id=id, metadata=metadata,
+                        replace=existing == 'replace'
+                    )
+            except (IOError, TypeError, ValueError) as e:
+                skipped[name] = str(e)
+
+    return skipped
+
+
+def entry_ids(name, count):
+    """
+    Returns the ids of the spectra read from one file:
+    its name, or `name#1`, `name#2`, ... if it holds
+    several spectra with their own axes.
+
+    Parameters
+    ----------
+    name (str): the file name.\n
+    count (int): the number of spectra.
+
+    Returns
+    ----------
+    (list) one id per spectrum.
+    """
+
+    if count == 1:
+        return [name]
+
+    return [name + '#' + str(i) for i in range(1, count + 1)]
+
+
+def _dtype_code(dtype):
+    """
+    Returns the header code of a value dtype.
+    """
+
+    for code, d in DTYPES.items():
+        if d == dtype:
+            return code
+
+    raise ValueError('Library dtype must be float32 or float64.')
@@ -0,0 +1,204 @@
+#!user/bin/python
+# -*- coding: utf-8 -*-
+"""
+'oceanview.py' contains the reader for Ocean Insight
+(OceanView / SpectraSuite) text exports, whose metadata
+preamble ends at a fixed data marker.
+"""
+
+# import dependencies
+import numpy as np
+
+
+# line opening and optionally closing the data section
+DATA_MARKER = '>>>>>Begin Spectral Data<<<<<'
+END_MARKER = '>>>>>End Spectral Data<<<<<'
+
+
+def _bool(value):
+    return value.strip().lower() == 'true'
+
+
+def _usec(value):
+    return float(value) * 1.0E-6
+
+
+# preamble labels mapped to typed metadata keys
+FIELDS = {
+    'Date': ('date', str),
+    'User': ('user', str),
+    'Spectrometer': ('spectrometer', str),
+    'Spectrometers': ('spectrometer', str),
+    'Trigger mode': ('trigger_mode', int),
+    'Integration Time (sec)': ('integration_time', float),
+    'Integration Time (usec)': ('integration_time', _usec),
+    'Scans to average': ('scans_to_average', int),
+    'Electric dark correction enabled': ('electric_dark_correction', _bool),
+    'Nonlinearity correction enabled': ('nonlinearity_correction', _bool),
+    'Boxcar width': ('boxcar_width', int),
+    'Storing dark spectrum': ('storing_dark_spectrum', _bool),
+    'XAxis mode': ('x_axis_mode', str),
+    'Number of Pixels in Spectrum': ('pixels', int),
+}
+
+
+def has_marker(text):
+    """
+    Returns True if `text` holds the OceanView data marker.
+    """
+    return DATA_MARKER in text
+
+
+def read_metadata(header):
+    """
+    Parses the preamble of an OceanView export into a
+    typed metadata dict. Known labels are converted (see
+    `FIELDS`), other `label: value` lines are kept as
+    strings under their label, and the free text first
+    line is kept as `title`.
+
+    Parameters
+    ----------
+    header (str or list): preamble text, or its lines.
+
+    Returns
+    ----------
+    (dict) the metadata, e.g. `integration_time` in seconds,
+    `scans_to_average`, `pixels` and `spectrometer` serial.
+    """
+
+    lines = header.splitlines() if isinstance(header, str) else header
+    metadata = {}
+
+    for line in lines:
+
+        label, sep, value = line.strip().partition(':')
+        if DATA_MARKER in line or not label:
+            continue
+
+        if not sep:
+            metadata.setdefault('title', label)
+            continue
+
+        key, convert = FIELDS.get(label.strip(), (label.strip(), str))
+        value = value.strip()
+
+        try:
+            metadata[key] = convert(value)
+        except ValueError:
+            metadata[key] = value
+
+    return metadata
+
+
+def split_data(text):
+    """
+    Splits an OceanView export at its data marker.
+
+    Parameters
+    ----------
+    text (str): the full file text.
+
+    Returns
+    ----------
+    `(tuple) (metadata, block)` where `block` is the text of
+    the data rows between the markers.
+    """
+
+    marker = text.find(DATA_MARKER)
+    start = text.find('\n', marker)
+    start = len(text) if start < 0 else start + 1
+
+    end = text.find(END_MARKER, start)
+    end = len(text) if end < 0 else end
+
+    return read_metadata(text[:marker]), text[start:end]
+
+
+def count_rows(block):
+    """
+    Counts the data rows of a block in C, without
+    splitting it into lines.
+    """
+
+    block = block.strip()
+    return block.count('\n') + 1 if block else 0
+
+
+def parse_data(block, cols=2, rows=None, dtype=np.float64):
+    """
+    Converts the whitespace separated data rows in one call.
+    Every row must hold `cols` fields, counted on the raw
+    bytes before converting.
+
+    Parameters
+    ----------
+    block (str): the data rows.\n
+    cols (int): number of columns per row.\n
+    rows (int): number of rows, e.g. the declared pixel count.
+        The output is allocated at this size up front.\n
+    dtype (np.dtype): float32 or float64 output type.
+
+    Returns
+    ----------
+    (np.ndarray) array of shape `(rows, cols)`. ValueError
+    is raised if a row is short, long or not numeric, or the
+    block does not hold `rows` rows.
+    """
+
+    if rows is None:
+        rows = count_rows(block)
+
+    if rows == 0:
+        return np.empty((0, cols), dtype=dtype)
+
+    block = block.strip()
+    if np.any(count_fields(block) != cols):
+        raise ValueError('Data rows must have ' + str(cols) + ' fields.')
+
+    try:
+        values = np.fromstring(block, dtype=dtype, sep=' ')
+    except ValueError:
+        raise ValueError('Data rows must be numeric.')
+
+    if values.size != rows * cols:
+        raise ValueError(
+            'Expected ' + str(rows) + ' data rows, found '
+            + str(values.size // cols) + '.'
+        )
+
+    return values.reshape(rows, cols)
+
+
+def count_fields(block):
+    """
+    Counts the whitespace separated fields of each row of
+    a stripped block, vectorized over its bytes.
+
+    Returns
+    ----------
+    (np.ndarray) one count per row.
+    """
+
+    buf = np.frombuffer(block.encode('latin-1', 'replace'), np.uint8)
+    if not len(buf):
+        return np.zeros(0, dtype=np.intp)
+
+    # fields start after whitespace, or at the start of the block
+    gap = buf <= 32
+    starts = np.flatnonzero(gap[:-1] > gap[1:]) + 1
+    if not gap[0]:
+        starts = np.concatenate(([0], starts))
+
+    ends = np.searchsorted(starts, np.flatnonzero(buf == 10))
+
+    return np.diff(ends, prepend=0, append=len(starts))
+
+
+def count_cols(block):
+    """
+    Number of fields on the first data row.
+    """
+
+    line = block.lstrip().partition('\n')[0]
+    return len(line.split())
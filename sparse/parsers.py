@@ -8,8 +8,27 @@ files.
 
 # import dependencies
 import csv
+import io
+import itertools
+import os
+import struct
+import types
 import numpy as np
 
+# `aio` and `jsonstream` are imported where used, they pull
+# in asyncio and json which most parses never need
+from sparse import channels, inputs, jcamp, oceanview, registry, spa, stats
+from sparse.engine import (
+    iter_delimited, parse_block, parse_block_strict, split_header
+)
+from sparse.results import ParseResult, Spectrum
+
+# bytes read from the end of text files for their last row
+TAIL_BYTES = 4096
+
+# header rows read before giving up on a data row
+MAX_HEADER_ROWS = 1000
+
 
 class DataFileParser():
     """
@@ -18,275 +37,1525 @@ class DataFileParser():
     (Factory Design)
     """
 
-    def __init__(self, f_obj=None, f_type=None, delimiter=',', cols=2):
+    def __init__(self, f_obj=None, f_type=None, delimiter=',', cols=2,
+                 dtype=None, cache=None, channel=None, stats=None):
+        """
+        Initialize parser class.
+
+        Parameters
+        ------------
+        f_obj (obj): file to be read: a path, a bytes, bytearray
+            or memoryview object, or a binary or text file object.
+            Paths, buffers and binary files are read in place
+            through `sparse.inputs`, without temp files.\n
+        f_type (str): type of file to be read. If None, the
+            type is detected from the first bytes of the file.\n
+        delimiter (str): the type of delimiter to be used on\n
+            csv files. `,` is the default.\n
+        cols (int): number of data columns in .csv/.txt files. Two
+            column files return `y` as read, four column files the
+            dark corrected ratio of columns x, dark, reference and
+            sample. Other widths return `y` as a 2-D array of every
+            column after `x`.\n
+        dtype (np.dtype): float32 or float64 type of the returned
+            arrays. If None, each reader keeps its native precision
+            (float64 for text files, float32 for .spa files).\n
+        cache (ParseCache): optional `sparse.cache.ParseCache`. When
+            given, `parse()`, `is_valid()` and `read_data()` are
+            served from it for files already seen with the same
+            options.\n
+            Use `sparse.batch.parse_many()` to read multiple files.\n
+        channel (str): optional derived channel of multi-column
+            files, one of `ratio`, `transmittance` or `absorbance`
+            (see `sparse.channels`). Columns from the fourth on are
+            sample replicates, `y` is 2-D when there are several.\n
+        stats (ParseStats): optional `sparse.stats.ParseStats`
+            recording per-stage timings, bytes read and rows
+            parsed or skipped. Nothing is recorded without it.
+        """
+
+        # initialize file_path class member
+        self.file_obj = inputs.open_input(f_obj)
+        self.file_type = f_type.lower() if f_type else None
+        self.delimiter = delimiter
+        self.cols = cols
+        self.dtype = dtype
+        self.cache = cache
+        self.channel = channel
+        self.stats = stats
+        self.errors = None
+        self.default_message = "No errors found."
+        self.x_data = []
+        self.y_data = []
+        self.metadata = {}
+        self.result = None
+
+    def get_x_data(self):
+        """"""
+        if self.result is not None and self.result.has_data():
+            return self.result.x_data
+        return self.x_data
+
+    def get_y_data(self):
+        """"""
+        if self.result is not None and self.result.has_data():
+            return self.result.y_data
+        return self.y_data
+
+    def get_file_type(self):
+        """
+        Returns the file type, detecting it from the first
+        bytes of the file if it was not given.
+
+        Returns
+        ----------
+        (str) the file type.
+        """
+
+        if self.file_type is None:
+
+            head = self._peek(registry.SNIFF_BYTES)
+            ft = registry.sniff(head)
+
+            if ft is None:
+                raise ValueError('Unable to detect file type.')
+
+            self.file_type = ft
+
+        return self.file_type
+
+    def _peek(self, size):
+        """
+        Returns the leading bytes of the file without
+        consuming it. Non-seekable streams are read into
+        memory first.
+
+        Parameters
+        ----------
+        size (int): number of bytes to return.
+
+        Returns
+        ----------
+        (bytes) the leading bytes.
+        """
+        return self._read_range(0, size)
+
+    def _read_range(self, offset, size):
+        """
+        Returns a range of bytes of the file without
+        consuming it. Non-seekable streams are read into
+        memory first.
+
+        Parameters
+        ----------
+        offset (int): position of the range, negative
+            offsets count from the end of the file.\n
+        size (int): number of bytes to return.
+
+        Returns
+        ----------
+        (bytes) the range, shorter at the end of the file.
+        """
+
+        f = self.file_obj
+
+        if isinstance(f, inputs.BufferReader):
+            buf = f.getbuffer()
+            start = max(offset + len(buf), 0) if offset < 0 else offset
+            return bytes(buf[start:start + size])
+
+        # real files are read raw so that binary
+        # content opened in text mode is not decoded
+        try:
+            fd = f.fileno()
+            if offset < 0:
+                offset = max(offset + os.fstat(fd).st_size, 0)
+            return os.pread(fd, size, offset)
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            pass
+
+        if not f.seekable():
+            data = f.read()
+            self.file_obj = (
+                io.StringIO(data) if isinstance(data, str)
+                else inputs.open_input(data)
+            )
+            return self._read_range(offset, size)
+
+        pos = f.tell()
+        if offset < 0:
+            f.seek(0, io.SEEK_END)
+            offset = max(offset + f.tell(), 0)
+        f.seek(offset)
+        data = f.read(size)
+        f.seek(pos)
+
+        if isinstance(data, str):
+            data = data.encode('utf-8', 'replace')
+
+        return data
+
+    """ reader factory """
+    def read_data(self):
+        """
+        Reads data file and returns the
+        spectral data in a 2-D array-like.
+
+        Returns
+        ----------
+        (callable) the client function that delegates
+        which reader to use based on file type.
+        """
+
+        # serve from a previous parse() or the cache
+        if self.result is not None or self.cache is not None:
+            result = self.parse()
+            if result.has_data():
+                return (result.x_data, result.y_data)
+            if self.cache is not None:
+                raise IOError(result.errors)
+
+        # send type to _get_reader client
+        reader = self._get_reader(self.get_file_type())
+
+        # return the reader
+        return reader()
+
+    def read_spectrum(self):
+        """
+        Reads the data file into a compact `Spectrum`.
+        The evenly spaced wavenumber axis of .spa and .spg
+        files is kept implicit and converted to nanometers
+        only on request; other files drop their axis array
+        when it is evenly spaced.
+
+        Returns
+        ----------
+        (Spectrum) the spectrum, `y` as from `read_data()`.
+        """
+
+        name = registry.lookup(self.get_file_type()).name
+
+        if name not in ('spa', 'spg'):
+            x_data, y_data = self.read_data()
+            return Spectrum.from_arrays(x_data, y_data)
+
+        with self._stage('open'):
+            buf = spa.map_buffer(self.file_obj)
+            directory = spa.read_directory(buf)
+
+        with self._stage('header'):
+            header = spa.read_header(buf, directory)
+            points = header['points']
+
+        with self._stage('convert'):
+            if name == 'spg':
+                y_data = spa.read_series(buf, points, directory)
+            else:
+                y_data = spa.read_spectrum(
+                    buf, points, spa.find_data_offset(buf, directory)
+                )
+
+        if y_data.shape[-1] != points:
+            raise ValueError('Data arrays must have equal length.')
+
+        if self.dtype is not None:
+            with self._stage('units'):
+                y_data = y_data.astype(self.dtype, copy=False)
+
+        self._record(len(buf), y_data.size // max(points, 1))
+
+        return Spectrum(
+            y_data, start=header['max_wv'], stop=header['min_wv'],
+            n=points, unit='cm-1'
+        )
+
+    def read_spectra(self):
+        """
+        Validates and reads every spectrum of the data file.
+        Unlike `parse()`, which keeps the first spectrum of a
+        JSON document, each spectrum of the document is read
+        with its own axis.
+
+        Returns
+        ----------
+        (list) of `(x, y)` tuples, one per spectrum or series.
+        Empty if the file is not valid.
+        """
+
+        # text streams are read again from where parse() started
+        seekable = self.result is None and self.file_obj.seekable()
+        start = self.file_obj.tell() if seekable else None
+
+        result = self.parse()
+
+        if not result.valid or not result.has_data():
+            return []
+
+        count = result.metadata.get('spectra', 1)
+        if count == 1 or np.ndim(result.y_data) != 1:
+            return [(result.x_data, result.y_data)]
+
+        if start is not None:
+            self.file_obj.seek(start)
+        spectra = list(self.iter_data())
+
+        if len(spectra) != count:
+            raise IOError('Unable to read the file again.')
+
+        return spectra
+
+    def _get_reader(self, ft):
+        """
+        Client method delegates which reader to use.
+
+        Parameters
+        ----------
+        ft (str-like): the type of input file.
+        """
+
+        # determine reader to use by ft param
+        fmt = registry.lookup(ft)
+
+        return types.MethodType(fmt.reader, self)
+
+    """ validator factory """
+    def is_valid(self):
+        """
+        Checks data files before uploading
+        to verify contents.
+
+        Returns
+        ---------
+        (bool) True if file is valid format, False otherwise.
+        """
+
+        # serve from a previous parse() or the cache
+        if self.result is not None or self.cache is not None:
+            result = self.parse()
+            self.errors = result.errors
+            return result.valid
+
+        checker = self._get_valid(self.get_file_type())
+
+        return checker()
+
+    def _get_valid(self, ft):
+        """
+        Client method delegates which 'is_valid' method
+        to use based on file type.
+
+        Paremeters
+        -----------
+        ft (str-like): type of input file.
+        """
+        # determine validator to use by ft param
+        fmt = registry.lookup(ft)
+
+        return types.MethodType(fmt.validator, self)
+
+    """ metadata factory """
+    def read_metadata(self):
+        """
+        Reads the metadata of the data file from its
+        header only. The data block is never read, so the
+        cost is dominated by opening the file.
+
+        Returns
+        ----------
+        (dict) the header fields. Where the format records
+        them, `title`, `points` and `x_range`, the first and
+        last `x` as returned by `read_data()`.
+        """
+
+        reader = self._get_metadata(self.get_file_type())
+
+        self.metadata = reader()
+
+        return self.metadata
+
+    def _get_metadata(self, ft):
+        """
+        Client method delegates which metadata reader
+        to use based on file type.
+
+        Parameters
+        ----------
+        ft (str-like): the type of input file.
+        """
+
+        # determine metadata reader to use by ft param
+        fmt = registry.lookup(ft)
+
+        if fmt.metadata is None:
+            raise NotImplementedError(ft)
+
+        return types.MethodType(fmt.metadata, self)
+
+    """ streaming factory """
+    def iter_data(self, block_size=65536):
+        """
+        Reads the data file as a stream of fixed-size
+        blocks so that memory stays bounded for files
+        of any size.
+
+        Parameters
+        ----------
+        block_size (int): number of points per block.
+
+        Returns
+        ----------
+        (generator) yields `(x, y)` tuples of arrays with at
+        most `block_size` points each. JSON documents and
+        .spg series yield one tuple per spectrum instead.
+        """
+
+        streamer = self._get_streamer(self.get_file_type())
+
+        return streamer(block_size)
+
+    def _get_streamer(self, ft):
+        """
+        Client method delegates which streaming reader
+        to use based on file type.
+
+        Parameters
+        ----------
+        ft (str-like): the type of input file.
+        """
+
+        # determine streamer to use by ft param
+        fmt = registry.lookup(ft)
+
+        if fmt.streamer is None:
+            raise NotImplementedError(ft)
+
+        return types.MethodType(fmt.streamer, self)
+
+    def _iter_csv(self, block_size):
+        """
+        Streams CSV formatted files in blocks.
+        """
+
+        blocks = iter_delimited(
+            inputs.text_stream(self.file_obj),
+            delimiter=self.delimiter,
+            cols=self._table_cols(),
+            quotechar='"',
+            block_size=block_size,
+            dtype=self._text_dtype()
+        )
+
+        try:
+            for data in blocks:
+                self._record(rows=len(data))
+                yield self._data_columns(data)
+        except csv.Error as e:
+            raise IOError(e)
+
+    def _iter_txt(self, block_size):
+        """
+        Streams .txt files in blocks. OceanView exports
+        are detected by their data marker, their preamble
+        is read into `metadata` and the data rows are split
+        on whitespace.
+        """
+
+        lines = iter(inputs.text_stream(self.file_obj))
+        delimiter = self.delimiter
+        head = []
+
+        # look for the marker up to the first numeric row
+        for line in lines:
+            if oceanview.DATA_MARKER in line:
+                self.metadata = oceanview.read_metadata(head)
+                delimiter = None
+                head = []
+                break
+            head.append(line)
+            if split_header(line, delimiter, 2)[1] == 0:
+                break
+
+        blocks = iter_delimited(
+            itertools.chain(head, lines),
+            delimiter=delimiter,
+            cols=self._table_cols(),
+            block_size=block_size,
+            dtype=self._text_dtype()
+        )
+
+        for data in blocks:
+            self._record(rows=len(data))
+            yield self._data_columns(data)
+
+    def _iter_json(self, block_size):
+        """
+        Streams a JSON document one spectrum at a time.
+        Only the spectrum being yielded is held in memory,
+        `block_size` is not used.
+        """
+
+        from sparse import jsonstream
+
+        text = inputs.text_stream(self.file_obj)
+
+        for spectrum in jsonstream.iter_spectra(text):
+            yield self._json_columns(spectrum)
+
+    def _iter_spg(self, block_size):
+        """
+        Streams an OMNIC series one spectrum at a time.
+        Rows are views of the mapped file, `block_size`
+        is not used.
+        """
+
+        buf, wv_nums, matrix = self._spg_arrays()
+
+        for spectrum in matrix:
+            self._record(rows=1)
+            yield self._spa_columns(wv_nums, spectrum)
+
+    """ async interface """
+    async def aread_data(self, executor=None):
+        """
+        Awaitable `read_data()`. Async file objects are read
+        without blocking the event loop, file I/O and decoding
+        run on a bounded executor.
+
+        Parameters
+        ----------
+        executor (concurrent.futures.Executor): thread pool to
+            decode on, defaults to the shared pool of `sparse.aio`.
+            Process pools raise TypeError, the parser state is
+            updated in this process.
+
+        Returns
+        ----------
+        `(tuple) (x, y)` as `read_data()`.
+        """
+
+        from sparse import aio
+
+        aio.check_threads(executor)
+        await self._aload()
+        return await aio.run(self.read_data, executor=executor)
+
+    async def ais_valid(self, executor=None):
+        """
+        Awaitable `is_valid()`, see `aread_data()`.
+        """
+
+        from sparse import aio
+
+        aio.check_threads(executor)
+        await self._aload()
+        return await aio.run(self.is_valid, executor=executor)
+
+    async def aparse(self, executor=None):
+        """
+        Awaitable `parse()`, see `aread_data()`.
+        """
+
+        from sparse import aio
+
+        aio.check_threads(executor)
+        await self._aload()
+        return await aio.run(self.parse, executor=executor)
+
+    async def _aload(self):
+        """
+        Reads an async file object (e.g. a web framework
+        upload) into memory so the blocking readers can
+        work on it from an executor thread.
+        """
+
+        from sparse import aio
+
+        if not aio.is_async_reader(self.file_obj):
+            return
+
+        content = await self.file_obj.read()
+
+        if isinstance(content, str):
+            self.file_obj = io.StringIO(content)
+            return
+
+        # bytes are parsed in place, text decoded on demand
+        self.file_obj = inputs.open_input(content)
+
+    """ single pass factory """
+    def parse(self):
+        """
+        Validates and reads the data file in a single
+        pass. The result is cached, later calls to
+        `parse()`, `is_valid()`, `read_data()` and the
+        getters are served from it without touching
+        the file again.
+
+        Returns
+        ----------
+        (ParseResult) the data, validity flag and errors.
+        """
+
+        if self.result is None:
+
+            self.get_file_type()
+
+            if self.cache is not None:
+                self.result = self.cache.parse(self)
+            else:
+                parser = self._get_parser(self.file_type)
+                self.result = parser()
+
+            self.errors = self.result.errors
+            self.metadata = self.result.metadata
+            if self.result.has_data():
+                self.x_data = self.result.x_data
+                self.y_data = self.result.y_data
+
+        return self.result
+
+    def _get_parser(self, ft):
+        """
+        Client method delegates which single pass
+        parser to use based on file type.
+
+        Parameters
+        ----------
+        ft (str-like): the type of input file.
+        """
+
+        # determine parser to use by ft param
+        fmt = registry.lookup(ft)
+
+        if fmt.parser is None:
+            raise NotImplementedError(ft)
+
+        return types.MethodType(fmt.parser, self)
+
+    """ begin client parsers """
+    def _parse_csv(self):
+        """
+        Validates and reads CSV formatted files from
+        a single read of the file object.
+
+        Returns
+        --------
+        (ParseResult) the parse outcome.
+        """
+
+        try:
+            with self._stage('open'):
+                text = inputs.read_text(self.file_obj)
+
+            cols = self._table_cols()
+            with self._stage('header'):
+                header, offset = split_header(text, self.delimiter, cols)
+            block = text[offset:]
+
+            # a clean file converts in one strict call
+            with self._stage('convert'):
+                data = parse_block_strict(
+                    block, self.delimiter, '"', self._text_dtype()
+                )
+            clean = (
+                data is not None
+                and data.shape[1] == cols
+                and all(
+                    len(r) == cols and not _is_float(r[0]) for r in header
+                )
+            )
+
+            if clean:
+                valid = any('wavelength' in r[0].lower() for r in header)
+                errors = (
+                    self.default_message if valid
+                    else 'No wavelength column found.'
+                )
+            else:
+                # irregular rows, fall back to the row checks
+                # for an exact verdict and error message
+                with self._stage('convert'):
+                    data = parse_block(
+                        block, self.delimiter, cols, '"', self._text_dtype()
+                    )
+                valid = self._is_csv_valid(io.StringIO(text))
+                errors = self.errors
+
+        except csv.Error as e:
+            return ParseResult(valid=False, errors=str(e))
+
+        with self._stage('units'):
+            x_data, y_data = self._data_columns(data)
+
+        self._record(len(text), len(data), text)
+
+        return ParseResult(
+            x_data=x_data, y_data=y_data, valid=valid, errors=errors
+        )
+
+    def _parse_jcamp(self):
+        """
+        Validates and reads JCAMP-DX files from a single
+        read of the file object.
+
+        Returns
+        --------
+        (ParseResult) the parse outcome.
+        """
+
+        try:
+            block = self._jcamp_block()
+        except Exception as e:
+            return ParseResult(valid=False, errors=str(e))
+
+        errors = jcamp.check_block(block)
+        valid = errors is None
+
+        with self._stage('units'):
+            x_data, y_data = self._jcamp_columns(block)
+
+        self._record(rows=len(x_data))
+
+        return ParseResult(
+            x_data=x_data,
+            y_data=y_data,
+            valid=valid,
+            errors=self.default_message if valid else errors
+        )
+
+    def _parse_spa(self):
+        """
+        Validates and reads SPA formatted files from
+        a single mapping of the file.
+
+        Returns
+        --------
+        (ParseResult) the parse outcome.
+        """
+
+        try:
+            buf, wv_nums, spectra = self._spa_arrays()
+        except Exception as e:
+            return ParseResult(valid=False, errors=str(e))
+
+        valid = len(wv_nums) == len(spectra)
+        errors = (
+            self.default_message if valid
+            else 'Data arrays must have equal length.'
+        )
+
+        with self._stage('units'):
+            x_data, y_data = self._spa_columns(wv_nums, spectra)
+
+        self._record(len(buf), len(spectra))
+
+        return ParseResult(
+            x_data=x_data, y_data=y_data, valid=valid, errors=errors
+        )
+
+    def _parse_spg(self):
+        """
+        Validates and reads OMNIC series files from a
+        single mapping of the file.
+
+        Returns
+        --------
+        (ParseResult) the parse outcome, `y_data` holds one
+        spectrum per row.
+        """
+
+        try:
+            buf, wv_nums, matrix = self._spg_arrays()
+        except Exception as e:
+            return ParseResult(valid=False, errors=str(e))
+
+        with self._stage('units'):
+            x_data, y_data = self._spa_columns(wv_nums, matrix)
+
+        self._record(len(buf), len(matrix))
+
+        return ParseResult(
+            x_data=x_data,
+            y_data=y_data,
+            valid=True,
+            errors=self.default_message
+        )
+
+    def _parse_json(self):
+        """
+        Validates and reads JSON documents in a single
+        streaming pass. Every spectrum is checked, only
+        the first one is kept, see `read_spectra()`.
+
+        Returns
+        --------
+        (ParseResult) the parse outcome, `metadata` holds the
+        number of `spectra` in the document.
+        """
+
+        from sparse import jsonstream
+
+        first = None
+        errors = None
+        count = 0
+
+        try:
+            with self._stage('convert'):
+                spectra = jsonstream.iter_spectra(
+                    inputs.text_stream(self.file_obj)
+                )
+                for count, spectrum in enumerate(spectra, 1):
+                    if first is None:
+                        first = spectrum
+                    errors = errors or _spectrum_error(count - 1, spectrum)
+        except Exception as e:
+            errors = str(e)
+
+        if first is None:
+            return ParseResult(
+                valid=False, errors=errors or 'No spectrum found.'
+            )
+
+        with self._stage('units'):
+            x_data, y_data = self._json_columns(first)
+
+        self._record(rows=len(x_data))
+
+        return ParseResult(
+            x_data=x_data,
+            y_data=y_data,
+            valid=errors is None,
+            errors=errors or self.default_message,
+            metadata={'spectra': count}
+        )
+
+    def _parse_txt(self):
+        """
+        Validates and reads .txt files from a single
+        read of the file object.
+
+        Returns
+        --------
+        (ParseResult) the parse outcome.
+        """
+
+        try:
+            with self._stage('open'):
+                text = inputs.read_text(self.file_obj)
+        except Exception as e:
+            return ParseResult(valid=False, errors=str(e))
+
+        if oceanview.has_marker(text):
+            data, errors = self._read_oceanview(text)
+            with self._stage('units'):
+                x_data, y_data = self._data_columns(data)
+
+            self._record(len(text), len(data), text)
+
+            return ParseResult(
+                x_data=x_data,
+                y_data=y_data,
+                valid=errors is None,
+                errors=errors or self.default_message,
+                metadata=self.metadata
+            )
+
+        with self._stage('header'):
+            header, offset = split_header(text, self.delimiter, 2)
+        block = text[offset:]
+
+        # a clean file converts in one strict call
+        with self._stage('convert'):
+            data = parse_block_strict(
+                block, self.delimiter, dtype=self._text_dtype()
+            )
+        clean = (
+            data is not None
+            and data.shape[1] >= self._table_cols()
+            and not any(r and _is_float(r[0]) for r in header)
+        )
+
+        if clean:
+            valid = True
+            errors = self.default_message
+        else:
+            # irregular rows, fall back to the row checks
+            # for an exact verdict and error message
+            with self._stage('convert'):
+                data = parse_block(
+                    block, self.delimiter, self._table_cols(),
+                    dtype=self._text_dtype()
+                )
+            valid = self._is_txt_valid(io.StringIO(text))
+            errors = self.errors
+
+        with self._stage('units'):
+            x_data, y_data = self._data_columns(data)
+
+        self._record(len(text), len(data), text)
+
+        return ParseResult(
+            x_data=x_data, y_data=y_data, valid=valid, errors=errors
+        )
+
+    """ begin client readers """
+    def _read_csv(self):
+        """
+        Reads CSV formatted files. Does not
+        accept any input parameters.
+
+        Returns
+        --------
+        `(tuple) (x, y)` where `x` and `y` are arrays with
+        `x` being the wavelength, and `y` being the value
+        at a particular wavelength.
+        """
+
+        # attempt to open the file
+        try:
+
+            with self._stage('open'):
+                text = inputs.read_text(self.file_obj)
+
+            cols = self._table_cols()
+            with self._stage('header'):
+                header, offset = split_header(text, self.delimiter, cols)
+
+            # bulk convert the numeric block
+            with self._stage('convert'):
+                data = parse_block(
+                    text[offset:], self.delimiter, cols, '"',
+                    self._text_dtype()
+                )
+
+        except csv.Error as e:
+
+            # raise IOError if exception occurs
+            # add logging here
+            raise IOError(e)
+
+        with self._stage('units'):
+            x_data, y_data = self._data_columns(data)
+
+        self._record(len(text), len(data), text)
+
+        self.x_data = x_data
+        self.y_data = y_data
+
+        return (x_data, y_data)
+
+    def _read_jcamp(self):
+        """
+        Reads JCAMP-DX files. Compressed XYDATA tables are
+        decoded, and for compound (LINK) files the first
+        block holding a data table is returned.
+
+        Returns
+        --------
+        `(tuple) (x, y)` arrays scaled by the file's
+        `##XFACTOR` and `##YFACTOR`.
+        """
+
+        block = self._jcamp_block()
+
+        with self._stage('units'):
+            x_data, y_data = self._jcamp_columns(block)
+
+        self._record(rows=len(x_data))
+
+        self.x_data = x_data
+        self.y_data = y_data
+
+        return (x_data, y_data)
+
+    def _read_spa(self):
+        """
+        Reads SPC formatted files.
+        """
+
+        buf, wv_nums, spectra = self._spa_arrays()
+
+        with self._stage('units'):
+            x_data, y_data = self._spa_columns(wv_nums, spectra)
+
+        self._record(len(buf), len(spectra))
+
+        self.x_data = x_data
+        self.y_data = y_data
+
+        return (x_data, y_data)
+
+    def _read_spg(self):
+        """
+        Reads OMNIC series files (.spg, or .spa files
+        holding several data blocks).
+
+        Returns
+        --------
+        `(tuple) (x, y)` where `x` is the shared axis in
+        nanometers and `y` a `(n_spectra, points)` matrix.
+        Unless a dtype cast is requested, `y` is a lazy view
+        of the mapped file.
+        """
+
+        buf, wv_nums, matrix = self._spg_arrays()
+
+        with self._stage('units'):
+            x_data, y_data = self._spa_columns(wv_nums, matrix)
+
+        self._record(len(buf), len(matrix))
+
+        self.x_data = x_data
+        self.y_data = y_data
+
+        return (x_data, y_data)
+
+    def _read_json(self):
+        """
+        Reads the first spectrum of a JSON document. The
+        document is read only up to the end of it.
+
+        Returns
+        --------
+        `(tuple) (x, y)` arrays of the first spectrum.
+        """
+
+        from sparse import jsonstream
+
+        with self._stage('convert'):
+            spectra = jsonstream.iter_spectra(
+                inputs.text_stream(self.file_obj)
+            )
+            spectrum = next(spectra, None)
+
+        if spectrum is None:
+            raise ValueError('No spectrum found.')
+
+        with self._stage('units'):
+            x_data, y_data = self._json_columns(spectrum)
+
+        self._record(rows=len(x_data))
+
+        self.x_data = x_data
+        self.y_data = y_data
+
+        return (x_data, y_data)
+
+    def _read_txt(self):
         """
-        Initialize parser class.
+        Reads .txt files. Called by client method.
+        OceanView exports are read from their data
+        marker, and their preamble into `metadata`.
 
-        Parameters
-        ------------
-        f_obj (obj): file object to be read. This can be a
-            io.StringIO object or an open() file object.\n
-        f_type (str): type of file to be read.\n
-        delimiter (str): the type of delimiter to be used on\n
-            csv files. `,` is the default.\n
-        many (bool): read single or multiple files.
+        Returns
+        ----------
+        `(tuple) (x, y)` where `x` and `y` are arrays with
+        `x` being the wavelength, and `y` being the value
+        at a particular wavelength.
         """
 
-        # initialize file_path class member
-        self.file_obj = f_obj
-        self.file_type = f_type.lower()
-        self.delimiter = delimiter
-        self.cols = cols
-        self.errors = None
-        self.default_message = "No errors found."
-        self.x_data = []
-        self.y_data = []
+        with self._stage('open'):
+            text = inputs.read_text(self.file_obj)
 
-    def get_x_data(self):
-        """"""
-        return self.x_data
+        if oceanview.has_marker(text):
+            data, errors = self._read_oceanview(text)
+        else:
+            cols = self._table_cols()
+            with self._stage('header'):
+                header, offset = split_header(text, self.delimiter, cols)
+
+            # bulk convert the numeric block
+            with self._stage('convert'):
+                data = parse_block(
+                    text[offset:], self.delimiter, cols,
+                    dtype=self._text_dtype()
+                )
 
-    def get_y_data(self):
-        """"""
-        return self.y_data
+        with self._stage('units'):
+            x_data, y_data = self._data_columns(data)
 
-    """ reader factory """
-    def read_data(self):
+        self._record(len(text), len(data), text)
+
+        self.x_data = x_data
+        self.y_data = y_data
+
+        return (self.x_data, self.y_data)
+
+    def _read_oceanview(self, text):
         """
-        Reads data file and returns the
-        spectral data in a 2-D array-like.
+        Reads an OceanView export. The preamble is parsed
+        once into `metadata`, and the declared pixel count
+        sizes the output and checks the row count without
+        a per-line pass.
+
+        Parameters
+        ----------
+        text (str): the full file text.
 
         Returns
         ----------
-        (callable) the client function that delegates
-        which reader to use based on file type.
+        `(tuple) (data, errors)` where `data` is the numeric
+        block and `errors` a message, or None if valid.
         """
 
-        # send type to _get_reader client
-        reader = self._get_reader(self.file_type)
+        with self._stage('header'):
+            self.metadata, block = oceanview.split_data(text)
+
+            rows = oceanview.count_rows(block)
+            cols = oceanview.count_cols(block)
+        pixels = self.metadata.get('pixels', rows)
+
+        errors = None
+        if rows != pixels:
+            errors = (
+                'Expected ' + str(pixels) + ' pixels, found '
+                + str(rows) + '.'
+            )
+        elif rows == 0:
+            errors = 'Data arrays must have length > 0.'
+        elif cols < self._table_cols():
+            errors = (
+                'File must contain ' + str(self._table_cols())
+                + ' data columns.'
+            )
 
-        # return the reader
-        return reader()
+        try:
+            with self._stage('convert'):
+                data = oceanview.parse_data(
+                    block, cols, rows, dtype=self._text_dtype()
+                )
+        except ValueError as e:
+            # irregular rows, skip the ones that do not convert
+            with self._stage('convert'):
+                data = parse_block(
+                    block, None, self._table_cols(),
+                    dtype=self._text_dtype()
+                )
+            errors = errors or str(e)
 
-    def _get_reader(self, ft):
+        return data, errors
+
+    def _data_columns(self, data):
         """
-        Client method delegates which reader to use.
+        Computes the x and y arrays of a .csv or .txt file
+        from its numeric columns. Two column files are read
+        as-is, four column files or a requested `channel`
+        are derived from the dark, reference and sample
+        columns (see `sparse.channels`), other widths keep
+        every column after `x`.
 
         Parameters
         ----------
-        ft (str-like): the type of input file.
+        data (np.ndarray): numeric block of shape `(n, cols)`.
+
+        Returns
+        ----------
+        `(tuple) (x, y)` contiguous arrays, `y` is 2-D for
+        several sample or data columns.
         """
 
-        # determine reader to use by ft param
-        if 'csv' in ft:
-            return self._read_csv
-        elif 'jcamp' in ft:
-            return self._read_jcamp
-        elif 'spa' in ft:
-            return self._read_spa
-        elif 'json' in ft:
-            return self._read_json
-        elif 'txt' in ft:
-            return self._read_txt
+        cols = self._table_cols()
+        dtype = self._text_dtype()
+
+        # too few columns were found, the file is invalid
+        if data.shape[1] < cols:
+            return (np.empty(0, dtype=dtype), np.empty(0, dtype=dtype))
+
+        data = data[:, :cols]
+
+        channel = self.channel
+        if channel is None and cols == 4:
+            channel = 'ratio'
+
+        x_data = np.ascontiguousarray(data[:, 0])
+
+        if channel is not None:
+            y_data = channels.derive(data, channel)
+        elif cols == 2:
+            y_data = np.ascontiguousarray(data[:, 1])
         else:
-            raise ValueError(ft)
+            y_data = np.ascontiguousarray(data[:, 1:])
 
-    """ validator factory """
-    def is_valid(self):
+        return (x_data, y_data)
+
+    def _table_cols(self):
         """
-        Checks data files before uploading
-        to verify contents.
+        Returns the number of columns read from text files.
+        """
+        return max(self.cols, 2)
+
+    def _spa_columns(self, wv_nums, spectra):
+        """
+        Scales the .spa wavenumber axis to nanometers and
+        casts both arrays to the requested dtype.
+
+        Parameters
+        ----------
+        wv_nums (np.ndarray): float32 wavenumber axis.\n
+        spectra (np.ndarray): float32 spectrum view.
 
         Returns
-        ---------
-        (bool) True if file is valid format, False otherwise.
+        ----------
+        `(tuple) (x, y)` arrays, `y` stays a zero-copy view
+        unless a different dtype was requested.
         """
 
-        checker = self._get_valid(self.file_type)
+        # scale wv numbers to nanometers
+        x_data = 1.0E7 / wv_nums
 
-        return checker()
+        if self.dtype is None:
+            return (x_data, spectra)
 
-    def _get_valid(self, ft):
-        """
-        Client method delegates which 'is_valid' method
-        to use based on file type.
+        return (
+            x_data.astype(self.dtype, copy=False),
+            spectra.astype(self.dtype, copy=False)
+        )
 
-        Paremeters
-        -----------
-        ft (str-like): type of input file.
+    def _jcamp_block(self):
+        """
+        Reads the file object and decodes its first
+        JCAMP-DX block holding a data table.
         """
-        # determine reader to use by ft param
-        if 'csv' in ft:
-            return self._is_csv_valid
-        elif 'jcamp' in ft:
-            return self._is_jcamp_valid
-        elif 'spa' in ft:
-            return self._is_spa_valid
-        elif 'json' in ft:
-            return self._is_json_valid
-        elif 'txt' in ft:
-            return self._is_txt_valid
-        else:
-            raise ValueError(ft)
 
-    """ begin client readers """
-    def _read_csv(self):
+        with self._stage('open'):
+            text = inputs.read_text(self.file_obj, encoding='latin-1')
+            if not isinstance(text, str):
+                text = bytes(text).decode('latin-1')
+
+        self._record(len(text))
+
+        with self._stage('convert'):
+            return jcamp.read_jcamp(text)
+
+    def _spa_arrays(self):
         """
-        Reads CSV formatted files. Does not
-        accept any input parameters.
+        Maps a .spa file once and decodes its header.
 
         Returns
-        --------
-        `(tuple) (x, y)` where `x` and `y` are arrays with
-        `x` being the wavelength, and `y` being the value
-        at a particular wavelength.
+        ----------
+        `(tuple) (buf, wv_nums, spectra)` the mapped buffer,
+        the float32 wavenumber axis and a zero-copy view of
+        the spectrum.
         """
 
-        x_data = []  # store wavelength values
-        y_data = []  # store y-values
+        with self._stage('open'):
+            buf = spa.map_buffer(self.file_obj)
+            directory = spa.read_directory(buf)
+            data_pos = spa.find_data_offset(buf, directory)
 
-        # attempt to open the file
-        try:
+        with self._stage('header'):
+            header = spa.read_header(buf, directory)
+            wv_nums = spa.wavenumbers(header)
 
-            # define the csv reader
-            rdr = csv.reader(self.file_obj, delimiter=self.delimiter)
+        with self._stage('convert'):
+            spectra = spa.read_spectrum(buf, header['points'], data_pos)
 
-            # iterate rows
-            for r in rdr:
-                try:
-                    x_data.append(float(r[0]))
-                    y_data.append(float(r[1]))
-                except:
-                    pass
+        return buf, wv_nums, spectra
 
-        except csv.Error as e:
+    def _jcamp_columns(self, block):
+        """
+        Casts the decoded JCAMP-DX arrays to the requested dtype.
+        """
 
-            # raise IOError if exception occurs
-            # add logging here
-            raise IOError(e)
+        dtype = self._text_dtype()
 
-        self.x_data = x_data
-        self.y_data = y_data
+        return (
+            block['x'].astype(dtype, copy=False),
+            block['y'].astype(dtype, copy=False)
+        )
 
-        return (x_data, y_data)
+    def _json_columns(self, spectrum):
+        """
+        Casts the arrays of a JSON spectrum to the requested dtype.
+        """
 
-    def _read_jcamp(self):
+        dtype = self._text_dtype()
+
+        return (
+            spectrum['x'].astype(dtype, copy=False),
+            spectrum['y'].astype(dtype, copy=False)
+        )
+
+    def _text_dtype(self):
         """
-        Reads jcamp formatted files.
+        Returns the dtype used by the text readers.
         """
-        raise NotImplementedError
+        return np.float64 if self.dtype is None else self.dtype
 
-    def _read_spa(self):
+    def _spg_arrays(self):
         """
-        Reads SPC formatted files.
+        Maps an OMNIC series once and decodes its header
+        and data blocks.
+
+        Returns
+        ----------
+        `(tuple) (buf, wv_nums, matrix)` the mapped buffer,
+        the float32 wavenumber axis and the float32 matrix of
+        spectra.
         """
 
-        f = self.file_obj
+        with self._stage('open'):
+            buf = spa.map_buffer(self.file_obj)
+            directory = spa.read_directory(buf)
 
-        # see lerkoah/spa-on-python on github for explanation #
-        # https://github.com/lerkoah/spa-on-python.git #
+        with self._stage('header'):
+            header = spa.read_header(buf, directory)
+            wv_nums = spa.wavenumbers(header)
 
-        f.seek(564)
-        points = np.fromfile(f, np.int32, 1)[0]
-        print('Points: ', points)
+        with self._stage('convert'):
+            matrix = spa.read_series(buf, header['points'], directory)
 
-        f.seek(30)
-        titles = np.fromfile(f, np.uint8, 255)
-        titles = ''.join([chr(x) for x in titles if x != 0])
-        print('Titles: ', titles)
+        return buf, wv_nums, matrix
 
+    def _stage(self, name):
+        """
+        Returns the context manager timing stage `name`,
+        a shared no-op when no stats are recorded.
+        """
 
-        f.seek(576)
-        max_wv = np.fromfile(f, np.single, 1)[0]
-        min_wv = np.fromfile(f, np.single, 1)[0]
-        wv_nums = np.flip(np.linspace(min_wv, max_wv, points))
-        print('Wavenumbers: ', wv_nums)
+        if self.stats is None:
+            return stats.NULL_STAGE
 
-        f.seek(288)
-        flag = 0
-        while flag != 3:
-            flag = np.fromfile(f, np.uint16, 1)
+        return self.stats.stage(name)
 
-        data_pos = np.fromfile(f, np.uint16, 1)
+    def _record(self, nbytes=0, rows=0, text=None):
+        """
+        Updates the counters of `stats`, if any.
 
-        f.seek(data_pos[0])
+        Parameters
+        ----------
+        nbytes (int): bytes read, characters for text files.\n
+        rows (int): data rows parsed.\n
+        text (str): optional file text, its non-blank lines
+            that were not parsed are counted as skipped.
+        """
 
-        spectra = np.fromfile(f, np.single, points)
-        print('Spectra: ', spectra)
+        if self.stats is None:
+            return
 
-        # scale wv numbers to nanometers
-        wv_nums = [1.0E7/x for x in wv_nums]
+        if nbytes:
+            self.stats.count('bytes_read', nbytes)
+        if rows:
+            self.stats.count('rows_parsed', rows)
+        if text is not None:
+            self.stats.count('rows_skipped', stats.count_lines(text) - rows)
 
+    """ begin client metadata readers """
+    def _csv_metadata(self):
+        """
+        Reads the header rows, first and last data rows
+        of a CSV file.
 
-        self.x_data = wv_nums
-        self.y_data = spectra
+        Returns
+        ----------
+        (dict) with `header` rows, `columns` and `x_range`.
+        """
 
-        return (wv_nums, spectra)
+        return self._text_metadata(self.delimiter)
 
-    def _read_json(self):
+    def _txt_metadata(self):
         """
-        Reads JSON formatted files.
+        Reads the preamble of OceanView exports, or the
+        header, first and last data rows of other .txt files.
+
+        Returns
+        ----------
+        (dict) the typed OceanView fields with `points`, or
+        `header` rows and `columns`, and `x_range`.
         """
-        raise NotImplementedError
 
-    def _read_txt(self):
+        return self._text_metadata(self.delimiter, marker=True)
+
+    def _text_metadata(self, delimiter, marker=False):
         """
-        Reads .txt files. Called by client method.
+        Reads text rows up to the first data row, and the
+        last data row from the end of the file.
+        """
+
+        with self._stage('open'):
+            # taken first, non-seekable streams are buffered by it
+            tail = self._read_range(-TAIL_BYTES, TAIL_BYTES)
+            lines = tail.decode('utf-8', 'replace').splitlines()
+
+            # the first line of a partial tail may be cut
+            if len(tail) == TAIL_BYTES:
+                lines = lines[1:]
+
+        with self._stage('header'):
+            header = []
+            first = None
+
+            rows = inputs.text_stream(self.file_obj, errors='replace')
+
+            for line in itertools.islice(rows, MAX_HEADER_ROWS):
+                if isinstance(line, bytes):
+                    line = line.decode('utf-8', 'replace')
+                if marker and oceanview.DATA_MARKER in line:
+                    delimiter = None
+                    first = next(rows, None)
+                    break
+                if split_header(line, delimiter, 2)[1] == 0:
+                    first = line
+                    break
+                header.append(line.rstrip('\r\n'))
+
+        if delimiter is None and marker:
+            metadata = oceanview.read_metadata(header)
+            if 'pixels' in metadata:
+                metadata['points'] = metadata['pixels']
+        else:
+            metadata = {'header': [_split(r, delimiter) for r in header]}
+
+        if isinstance(first, bytes):
+            first = first.decode('utf-8', 'replace')
+
+        if first is not None:
+            row = _split(first, delimiter)
+            metadata['columns'] = len(row)
+
+            last = row
+            for line in reversed(lines):
+                fields = _split(line, delimiter)
+                if fields and _is_float(fields[0]):
+                    last = fields
+                    break
+
+            metadata['x_range'] = (float(row[0]), float(last[0]))
+
+        self._record(len(''.join(header)), 0)
+
+        return metadata
+
+    def _spa_metadata(self):
+        """
+        Reads the title, point count and range of a .spa
+        or .spg file from its fixed header fields and block
+        directory, and the acquisition history block.
 
         Returns
         ----------
-        `(tuple) (x, y)` where `x` and `y` are arrays with
-        `x` being the wavelength, and `y` being the value
-        at a particular wavelength.
+        (dict) with `title`, `points`, `x_range` in nanometers,
+        `wavenumber_range`, the number of `spectra`, the count
+        of each directory block type and the `history` text.
         """
 
-        col_1 = []
-        col_2 = []
-        col_3 = []
-        col_4 = []
+        try:
+            with self._stage('open'):
+                head = self._peek(spa.HEAD_BYTES)
+                # large directories, and header blocks listed
+                # after them, take a second read
+                for _ in range(2):
+                    size = spa.head_size(head)
+                    if size <= len(head):
+                        break
+                    head = self._peek(size)
+
+            with self._stage('header'):
+                directory = spa.read_directory(head)
+                header = spa.read_header(head, directory)
+        except struct.error:
+            raise ValueError('File too short for an .spa header.')
+
+        max_wv = float(header['max_wv'])
+        min_wv = float(header['min_wv'])
+
+        metadata = {
+            'title': header['title'],
+            'points': header['points'],
+            'x_range': (
+                1.0E7 / max_wv if max_wv else float('inf'),
+                1.0E7 / min_wv if min_wv else float('inf')
+            ),
+            'wavenumber_range': (max_wv, min_wv),
+            'spectra': len(directory.get(spa.DATA_BLOCK, ())),
+            'blocks': {k: len(v) for k, v in directory.items()}
+        }
+
+        # the history block is read on its own
+        if spa.HISTORY_BLOCK in directory:
+            with self._stage('open'):
+                offset, size = directory[spa.HISTORY_BLOCK][0]
+                raw = self._read_range(offset, size)
+            metadata['history'] = (
+                raw.replace(b'\x00', b'').decode('latin-1')
+            )
+
+        self._record(len(head))
+
+        return metadata
+
+    def _jcamp_metadata(self):
+        """
+        Reads the labelled records of a JCAMP-DX file up
+        to its first data table.
+
+        Returns
+        ----------
+        (dict) with `title`, `points`, `x_range`, `x_units`,
+        `y_units` and every `labels` value.
+        """
 
-        rows = self.file_obj.readlines()
+        with self._stage('header'):
+            lines = []
 
-        for i, r in enumerate(rows):
+            for line in inputs.text_stream(self.file_obj, 'latin-1'):
+                if isinstance(line, bytes):
+                    line = line.decode('latin-1')
+                label = line.strip()[2:].partition('=')[0]
+                if jcamp.normalize_label(label) in jcamp.DATA_LABELS:
+                    break
+                lines.append(line)
 
-            r_strip = r.strip('\n')
-            r_split = r_strip.split(self.delimiter)
+            labels = jcamp.read_labels(''.join(lines))
 
-            try:
-                col_1.append(float(r_split[0]))
-                col_2.append(float(r_split[1]))
+        metadata = {'title': labels['TITLE'], 'labels': labels}
 
-                # read more columns if > 2
-                if self.cols == 4:
-                    col_3.append(float(r_split[2]))
-                    col_4.append(float(r_split[3]))
+        if 'NPOINTS' in labels:
+            metadata['points'] = int(float(labels['NPOINTS']))
+        if 'FIRSTX' in labels and 'LASTX' in labels:
+            metadata['x_range'] = (
+                float(labels['FIRSTX']), float(labels['LASTX'])
+            )
+        for key in ('XUNITS', 'YUNITS'):
+            if key in labels:
+                metadata[key[0].lower() + '_units'] = labels[key]
 
-            except:
-                pass
+        self._record(len(''.join(lines)))
 
-        if self.cols == 2:
-            self.x_data = col_1
-            self.y_data = col_2
+        return metadata
 
-        elif self.cols == 4:
+    def _json_metadata(self):
+        """
+        Reads the members of a JSON document, skipping its
+        data arrays without converting them.
 
-            self.x_data = col_1
+        Returns
+        ----------
+        (dict) the scalar members of the root object, the
+        number of `spectra` and the scalar `members` of each
+        spectrum, see `sparse.jsonstream.read_metadata()`.
+        """
 
-            col_2 = np.asarray(col_2)
-            col_3 = np.asarray(col_3)
-            col_4 = np.asarray(col_4)
+        from sparse import jsonstream
 
-            y_vals = (col_4 - col_2) / (col_3 - col_2)
-            self.y_data = y_vals.tolist()
+        with self._stage('header'):
+            metadata = jsonstream.read_metadata(
+                inputs.text_stream(self.file_obj)
+            )
 
-        return (self.x_data, self.y_data)
+        return metadata
 
     """ begin client validators """
-    def _is_csv_valid(self):
+    def _is_csv_valid(self, f_obj=None):
         """
         Check format of .csv and determine
-        if valid or not. Does not accept any
-        input parameters.
+        if valid or not.
+
+        Parameters
+        -----------
+        f_obj (obj): optional file object to check in
+            place of the parser's file object.
 
         Returns
         -----------
@@ -295,6 +1564,7 @@ class DataFileParser():
 
         self.errors = self.default_message
 
+        cols = self._table_cols()
         header = {}
         x_data = []
         y_data = []
@@ -303,15 +1573,18 @@ class DataFileParser():
         try:
 
             # define the csv reader
-            rdr = csv.reader(self.file_obj, delimiter=self.delimiter)
+            rdr = csv.reader(
+                inputs.text_stream(self.file_obj if f_obj is None else f_obj),
+                delimiter=self.delimiter
+            )
 
             # iterate rows
             for i, row in enumerate(rdr):
 
-                # check if any rows have more/less than 2 columns
-                if len(row) != 2:
+                # check if any rows have more/less than cols columns
+                if len(row) != cols:
                     self.errors = (
-                        'File must contain 2 data columns.'
+                        'File must contain ' + str(cols) + ' data columns.'
                         + 'Error at line ' + str(i+1) + ' of file.'
                     )
                     return False
@@ -358,8 +1631,28 @@ class DataFileParser():
 
     def _is_jcamp_valid(self):
         """
+        Determines if a JCAMP-DX file is valid. The first
+        data block must carry the `##JCAMP-DX` and `##END`
+        labels, and its decoded table must match the
+        `##NPOINTS` label.
+
+        Returns
+        -----------
+        (bool) True if valid, False otherwise.
         """
-        raise NotImplementedError
+
+        self.errors = self.default_message
+
+        try:
+            errors = jcamp.check_block(self._jcamp_block())
+        except Exception as e:
+            errors = str(e)
+
+        if errors is not None:
+            self.errors = errors
+            return False
+
+        return True
 
     def _is_spa_valid(self):
         """
@@ -371,39 +1664,41 @@ class DataFileParser():
         (bool) True if valid, False otherwise.
         """
 
-        f = self.file_obj
-
-        # see lerkoah/spa-on-python on github for explanation #
-        # https://github.com/lerkoah/spa-on-python.git #
-
         try:
-            f.seek(564)
-            points = np.fromfile(f, np.int32, 1)[0]
+            buf = spa.map_buffer(self.file_obj)
+            directory = spa.read_directory(buf)
+            header = spa.read_header(buf, directory)
 
-            f.seek(30)
-            titles = np.fromfile(f, np.uint8, 255)
-            titles = ''.join([chr(x) for x in titles if x != 0])
+            wv_nums = spa.wavenumbers(header)
 
-            f.seek(576)
-            max_wv = np.fromfile(f, np.single, 1)[0]
-            min_wv = np.fromfile(f, np.single, 1)[0]
-            wv_nums = np.flip(np.linspace(min_wv, max_wv, points))
+            data_pos = spa.find_data_offset(buf, directory)
+            spectra = spa.read_spectrum(buf, header['points'], data_pos)
 
-            f.seek(288)
-            flag = 0
-            while flag != 3:
-                flag = np.fromfile(f, np.uint16, 1)
+            if len(wv_nums) != len(spectra):
+                self.errors = 'Data arrays must have equal length.'
+                return False
 
-            data_pos = np.fromfile(f, np.uint16, 1)
+        except Exception as e:
+            self.errors = str(e)
+            return False
 
-            f.seek(data_pos[0])
+        return True
 
-            spectra = np.fromfile(f, np.single, points)
+    def _is_spg_valid(self):
+        """
+        Determines if an OMNIC series file is valid. Every
+        data block must hold the number of points declared
+        by the header.
 
-            if len(wv_nums) != len(spectra):
-                self.errors = 'Data arrays must have equal length.'
-                return False
+        Returns
+        -----------
+        (bool) True if valid, False otherwise.
+        """
+
+        self.errors = self.default_message
 
+        try:
+            self._spg_arrays()
         except Exception as e:
             self.errors = str(e)
             return False
@@ -412,13 +1707,51 @@ class DataFileParser():
 
     def _is_json_valid(self):
         """
+        Determines if a JSON document is valid. The whole
+        document is streamed, it must be well formed and
+        hold at least one spectrum, and every spectrum
+        must have equal, non-empty x and y arrays.
+
+        Returns
+        -----------
+        (bool) True if valid, False otherwise.
         """
-        raise NotImplementedError
 
-    def _is_txt_valid(self):
+        from sparse import jsonstream
+
+        self.errors = self.default_message
+        count = 0
+
+        try:
+            spectra = jsonstream.iter_spectra(
+                inputs.text_stream(self.file_obj)
+            )
+            for i, spectrum in enumerate(spectra):
+                count += 1
+                errors = _spectrum_error(i, spectrum)
+                if errors is not None:
+                    self.errors = errors
+                    return False
+        except Exception as e:
+            self.errors = str(e)
+            return False
+
+        if count == 0:
+            self.errors = 'No spectrum found.'
+            return False
+
+        return True
+
+    def _is_txt_valid(self, f_obj=None):
         """
         Checks the format of a .txt file to ensure
-        it is valid. Does not accept any input parameters.
+        it is valid. OceanView exports are checked
+        against their declared pixel count.
+
+        Parameters
+        ------------
+        f_obj (obj): optional file object to check in
+            place of the parser's file object.
 
         Returns
         ------------
@@ -432,7 +1765,17 @@ class DataFileParser():
         y_data = []
 
         try:
-            rows = self.file_obj.readlines()
+            f_obj = self.file_obj if f_obj is None else f_obj
+            text = inputs.read_text(f_obj)
+
+            if oceanview.has_marker(text):
+                data, errors = self._read_oceanview(text)
+                if errors is not None:
+                    self.errors = errors
+                    return False
+                return True
+
+            rows = io.StringIO(text).readlines()
 
             for i, r in enumerate(rows):
 
@@ -463,3 +1806,104 @@ class DataFileParser():
             return False
 
         return True
+
+
+def _is_float(value):
+    """
+    Returns True if `value` converts to float.
+    """
+    try:
+        float(value)
+        return True
+    except ValueError:
+        return False
+
+
+def _split(line, delimiter):
+    """
+    Splits a text row into its fields, on whitespace
+    if `delimiter` is None.
+    """
+
+    if delimiter is None:
+        return line.split()
+
+    return next(csv.reader([line.strip()], delimiter=delimiter), [])
+
+
+def _spectrum_error(index, spectrum):
+    """
+    Returns the error message of an invalid JSON spectrum.
+    """
+
+    from sparse import jsonstream
+
+    errors = jsonstream.check_spectrum(spectrum)
+    if errors is not None:
+        errors += ' Error in spectrum ' + str(index + 1) + '.'
+
+    return errors
+
+
+# register the built-in formats
+registry.register(
+    'csv',
+    reader=DataFileParser._read_csv,
+    validator=DataFileParser._is_csv_valid,
+    parser=DataFileParser._parse_csv,
+    streamer=DataFileParser._iter_csv,
+    sniffer=registry.sniff_csv,
+    metadata=DataFileParser._csv_metadata,
+    extensions=('.csv',),
+    priority=10
+)
+registry.register(
+    'jcamp',
+    reader=DataFileParser._read_jcamp,
+    validator=DataFileParser._is_jcamp_valid,
+    parser=DataFileParser._parse_jcamp,
+    sniffer=registry.sniff_jcamp,
+    metadata=DataFileParser._jcamp_metadata,
+    extensions=('.jdx', '.dx', '.jcm')
+)
+registry.register(
+    'spa',
+    reader=DataFileParser._read_spa,
+    validator=DataFileParser._is_spa_valid,
+    parser=DataFileParser._parse_spa,
+    sniffer=registry.sniff_spa,
+    extensions=('.spa',),
+    binary=True,
+    metadata=DataFileParser._spa_metadata
+)
+registry.register(
+    'spg',
+    reader=DataFileParser._read_spg,
+    validator=DataFileParser._is_spg_valid,
+    parser=DataFileParser._parse_spg,
+    streamer=DataFileParser._iter_spg,
+    extensions=('.spg',),
+    binary=True,
+    metadata=DataFileParser._spa_metadata
+)
+registry.register(
+    'json',
+    reader=DataFileParser._read_json,
+    validator=DataFileParser._is_json_valid,
+    parser=DataFileParser._parse_json,
+    streamer=DataFileParser._iter_json,
+    sniffer=registry.sniff_json,
+    extensions=('.json',),
+    metadata=DataFileParser._json_metadata
+)
+registry.register(
+    'txt',
+    reader=DataFileParser._read_txt,
+    validator=DataFileParser._is_txt_valid,
+    parser=DataFileParser._parse_txt,
+    streamer=DataFileParser._iter_txt,
+    sniffer=registry.sniff_txt,
+    metadata=DataFileParser._txt_metadata,
+    extensions=('.txt',),
+    priority=20
+)
@@ -0,0 +1,260 @@
+#!user/bin/python
+# -*- coding: utf-8 -*-
+"""
+'registry.py' contains the format registry used by
+`DataFileParser` to dispatch readers and validators,
+and the sniffers used to detect a file's format from
+its first bytes.
+"""
+
+# import dependencies
+import os
+import re
+
+
+# number of leading bytes handed to the sniffers
+SNIFF_BYTES = 512
+
+# registered formats by name, in registration order
+FORMATS = {}
+
+# type strings and extensions resolved to format names
+_ALIASES = {}
+
+# formats with a sniffer, by priority
+_SNIFF_ORDER = []
+
+# first line that starts like a number
+_NUMERIC_LINE = re.compile(rb'^[ \t]*[-+.]?\d[^\r\n]*', re.MULTILINE)
+
+
+class Format():
+    """
+    A registered file format.
+    """
+
+    def __init__(self, name, reader, validator, parser=None,
+                 streamer=None, sniffer=None, extensions=(), priority=0,
+                 binary=False, metadata=None):
+        """
+        Initialize format class.
+
+        Parameters
+        ------------
+        name (str): format name, e.g. `csv`.\n
+        reader (callable): `reader(parser)` returns `(x, y)`.\n
+        validator (callable): `validator(parser)` returns a bool
+            and sets `parser.errors`.\n
+        parser (callable): optional `parser(parser)` returning a
+            `ParseResult` in a single pass.\n
+        streamer (callable): optional `streamer(parser, block_size)`
+            generator of `(x, y)` blocks.\n
+        sniffer (callable): optional `sniffer(head)` returning True
+            if the leading bytes `head` belong to this format.\n
+        extensions (tuple): file extensions of the format.\n
+        priority (int): sniffing order, lower runs first. Formats
+            with a strong signature should sniff before generic
+            delimited text.\n
+        binary (bool): True if files of the format are read from
+            bytes rather than text.\n
+        metadata (callable): optional `metadata(parser)` returning
+            the header fields of a file as a dict, without reading
+            its data.
+        """
+
+        self.name = name
+        self.reader = reader
+        self.validator = validator
+        self.parser = parser
+        self.streamer = streamer
+        self.sniffer = sniffer
+        self.extensions = tuple(extensions)
+        self.priority = priority
+        self.binary = binary
+        self.metadata = metadata
+
+
+def register(name, reader, validator, parser=None, streamer=None,
+             sniffer=None, extensions=(), priority=0, binary=False,
+             metadata=None):
+    """
+    Registers a file format, replacing any format of
+    the same name.
+
+    Parameters
+    ----------
+    See `Format`.
+
+    Returns
+    ----------
+    (Format) the registered format.
+    """
+
+    fmt = Format(
+        name, reader, validator, parser, streamer, sniffer, extensions,
+        priority, binary, metadata
+    )
+    FORMATS[name] = fmt
+
+    _SNIFF_ORDER[:] = sorted(
+        (f for f in FORMATS.values() if f.sniffer is not None),
+        key=lambda f: f.priority
+    )
+
+    _ALIASES[name] = name
+    for ext in fmt.extensions:
+        _ALIASES[ext.lower().lstrip('.')] = name
+
+    return fmt
+
+
+def unregister(name):
+    """
+    Removes a registered format and its aliases.
+
+    Parameters
+    ----------
+    name (str): the format name.
+    """
+
+    FORMATS.pop(name, None)
+
+    for alias in [a for a, n in _ALIASES.items() if n == name]:
+        del _ALIASES[alias]
+
+    _SNIFF_ORDER[:] = [f for f in _SNIFF_ORDER if f.name != name]
+
+
+def lookup(ft):
+    """
+    Resolves a type string to its format. Names and
+    extensions (`csv`, `.SPA`) resolve with a single
+    dict lookup; other strings fall back to matching
+    a registered name inside the string.
+
+    Parameters
+    ----------
+    ft (str-like): the type of input file.
+
+    Returns
+    ----------
+    (Format) the registered format.
+    """
+
+    name = _ALIASES.get(ft.lower().lstrip('.'))
+
+    if name is None:
+        for n in FORMATS:
+            if n in ft:
+                name = n
+                break
+        else:
+            raise ValueError(ft)
+
+    return FORMATS[name]
+
+
+def is_binary(ft):
+    """
+    Returns True if `ft` resolves to a binary format.
+    Unknown or missing types are treated as text.
+
+    Parameters
+    ----------
+    ft (str-like): the type of input file, or None.
+
+    Returns
+    ----------
+    (bool) True if the format reads bytes.
+    """
+
+    if not ft:
+        return False
+
+    try:
+        return lookup(ft).binary
+    except ValueError:
+        return False
+
+
+def is_supported(path):
+    """
+    Returns True if a registered format reads files
+    with the extension of `path`.
+
+    Parameters
+    ----------
+    path (str-like): a file path or name.
+
+    Returns
+    ----------
+    (bool) True if the extension is registered.
+    """
+
+    ext = os.path.splitext(os.fspath(path))[1].lower().lstrip('.')
+
+    return ext in _ALIASES
+
+
+def sniff(head):
+    """
+    Detects the format of a file from its leading bytes.
+    Sniffers are tried in priority order.
+
+    Parameters
+    ----------
+    head (bytes): the first `SNIFF_BYTES` bytes of the file.
+
+    Returns
+    ----------
+    (str) the detected format name, or None.
+    """
+
+    for fmt in _SNIFF_ORDER:
+        if fmt.sniffer(head):
+            return fmt.name
+
+    return None
+
+
+""" begin built-in sniffers """
+def sniff_spa(head):
+    """
+    OMNIC files open with a fixed signature.
+    """
+    return head.startswith(b'Spectral Data File')
+
+
+def sniff_jcamp(head):
+    """
+    JCAMP-DX files open with labelled data records.
+    """
+    return head.lstrip().startswith(b'##')
+
+
+def sniff_json(head):
+    """
+    JSON documents open with an object or array.
+    """
+    return head.lstrip()[:1] in (b'{', b'[')
+
+
+def sniff_csv(head):
+    """
+    Comma separated numeric rows.
+    """
+    line = _NUMERIC_LINE.search(head)
+    return line is not None and b',' in line.group()
+
+
+def sniff_txt(head):
+    """
+    Tab or space separated numeric rows, or an
+    OceanView data marker.
+    """
+
+    if b'>>>>>Begin Spectral Data<<<<<' in head:
+        return True
+
+    line = _NUMERIC_LINE.search(head)
+    return line is not None and len(line.group().split()) >= 2
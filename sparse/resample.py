@@ -0,0 +1,162 @@
+#!user/bin/python
+# -*- coding: utf-8 -*-
+"""
+'resample.py' contains the batched resampling used to
+interpolate spectra read on different axes onto one
+common wavelength grid.
+"""
+
+# import dependencies
+import numpy as np
+
+
+METHODS = ('linear', 'cubic')
+
+
+def resample(spectra, grid, method='linear', fill=np.nan):
+    """
+    Interpolates many spectra onto a common grid in one
+    vectorized pass. The spectra are concatenated and each
+    one is shifted past the previous along the axis, so a
+    single `searchsorted` locates every grid point in every
+    spectrum.
+
+    Parameters
+    ----------
+    spectra (iterable): `(x, y)` tuples as returned by
+        `read_data()`, `Spectrum` objects, or `ParseResult`
+        objects. Axes may be ascending, descending (e.g. .spa
+        output) or unordered. 2-D `y` values of a shared axis
+        (.spg series, multi-column files) give one row each.\n
+    grid (array-like): target axis, in the unit of the inputs.\n
+    method (str): `linear`, or `cubic` for a piecewise cubic
+        Hermite curve through each point with three-point
+        slopes.\n
+    fill (float): value of grid points outside a spectrum's
+        axis, and of results without data.
+
+    Returns
+    ----------
+    (np.ndarray) float64 matrix of shape `(n_rows, len(grid))`.
+    """
+
+    if method not in METHODS:
+        raise ValueError(method)
+
+    grid = np.asarray(grid, dtype=np.float64)
+    if grid.ndim != 1:
+        raise ValueError('Grid must be 1-D.')
+
+    rows = [r for s in spectra for r in _rows(s)]
+    out = np.full((len(rows), len(grid)), fill, dtype=np.float64)
+
+    # single point spectra cannot be interpolated
+    keep = [i for i, (x, y) in enumerate(rows) if len(x) > 1]
+    if not keep or not len(grid):
+        return out
+
+    lengths = np.array([len(rows[i][0]) for i in keep])
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    x = np.concatenate([rows[i][0] for i in keep])
+    y = np.concatenate([rows[i][1] for i in keep])
+    n = len(keep)
+
+    # shift each spectrum past the previous one
+    low = min(x.min(), grid.min())
+    span = max(x.max(), grid.max()) - low + 1.0
+    offset = np.arange(n) * span
+    key = x - low + np.repeat(offset, lengths)
+    target = (grid - low)[None, :] + offset[:, None]
+
+    first = starts[:, None]
+    last = (starts + lengths - 1)[:, None]
+
+    # left neighbour of every grid point, within its spectrum
+    i = np.searchsorted(key, target, side='right') - 1
+    i = np.clip(i, first, last - 1)
+
+    inside = (target >= key[first]) & (target <= key[last])
+
+    x0 = key[i]
+    h = key[i + 1] - x0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = (target - x0) / h
+
+    if method == 'linear':
+        values = y[i] + t * (y[i + 1] - y[i])
+    else:
+        m = _slopes(key, y, starts, lengths)
+        t2 = t * t
+        t3 = t2 * t
+        values = (
+            (2 * t3 - 3 * t2 + 1) * y[i]
+            + (t3 - 2 * t2 + t) * h * m[i]
+            + (3 * t2 - 2 * t3) * y[i + 1]
+            + (t3 - t2) * h * m[i + 1]
+        )
+
+    out[keep] = np.where(inside, values, fill)
+
+    return out
+
+
+def _rows(spectrum):
+    """
+    Returns the `(x, y)` rows of one input, each with a
+    float64 ascending axis.
+    """
+
+    if hasattr(spectrum, 'x_data'):
+        x, y = spectrum.x_data, spectrum.y_data
+        if x is None or y is None:
+            return [(np.empty(0), np.empty(0))]
+    else:
+        x, y = spectrum
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    # column layouts of multi-column files
+    if y.ndim == 2 and y.shape[1] != len(x):
+        y = y.T
+
+    if y.shape[-1] != len(x):
+        raise ValueError('Data arrays must have equal length.')
+
+    # descending axes are reversed, others sorted
+    if len(x) > 1:
+        step = np.diff(x)
+        if (step < 0).all():
+            x, y = x[::-1], y[..., ::-1]
+        elif not (step >= 0).all():
+            order = np.argsort(x, kind='stable')
+            x, y = x[order], y[..., order]
+
+    if y.ndim == 1:
+        return [(x, y)]
+
+    return [(x, row) for row in y]
+
+
+def _slopes(x, y, starts, lengths):
+    """
+    Three-point slopes of every point of the concatenated
+    spectra, one-sided at the ends of each spectrum.
+    """
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        h = np.diff(x)
+        d = np.diff(y) / h
+
+        hl = np.concatenate(([np.nan], h))
+        dl = np.concatenate(([np.nan], d))
+        hr = np.concatenate((h, [np.nan]))
+        dr = np.concatenate((d, [np.nan]))
+
+        m = (hr * dl + hl * dr) / (hl + hr)
+
+    ends = starts + lengths - 1
+    m[starts] = dr[starts]
+    m[ends] = dl[ends]
+
+    return m
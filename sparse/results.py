@@ -0,0 +1,213 @@
+#!user/bin/python
+# -*- coding: utf-8 -*-
+"""
+'results.py' contains the result types returned
+by the sparse parsers.
+"""
+
+# import dependencies
+import numpy as np
+
+
+class ParseResult():
+    """
+    Outcome of a single validate-and-read pass
+    over a data file.
+    """
+
+    def __init__(self, x_data=None, y_data=None, valid=False, errors=None,
+                 metadata=None):
+        """
+        Initialize result class.
+
+        Parameters
+        ------------
+        x_data (array-like): wavelength values, or None if
+            the file could not be read.\n
+        y_data (array-like): values at each wavelength, or None
+            if the file could not be read.\n
+        valid (bool): True if the file passed validation.\n
+        errors (str): validation message.\n
+        metadata (dict): header fields read from the file, e.g.
+            the typed preamble of OceanView exports.
+        """
+
+        self.x_data = x_data
+        self.y_data = y_data
+        self.valid = valid
+        self.errors = errors
+        self.metadata = {} if metadata is None else metadata
+
+    def has_data(self):
+        """
+        Returns True if data was extracted from the file.
+        """
+        return self.x_data is not None and self.y_data is not None
+
+
+class Spectrum():
+    """
+    Compact spectrum. Evenly spaced axes are held
+    implicitly as `(start, stop, n)` and only built on
+    request, so a spectrum costs a single array. The axis
+    is converted between nanometers and wavenumbers when
+    it is asked for, never stored twice.
+    """
+
+    __slots__ = ('y', 'unit', '_x', '_start', '_stop', '_n')
+
+    def __init__(self, y, x=None, start=None, stop=None, n=None,
+                 unit='nm'):
+        """
+        Initialize spectrum class.
+
+        Parameters
+        ------------
+        y (np.ndarray): values, 1-D, or 2-D as returned by the
+            readers (e.g. one row per spectrum of a series).\n
+        x (np.ndarray): explicit axis, or None for a linear axis
+            given by `start` and `stop`.\n
+        start (float): first axis value of a linear axis.\n
+        stop (float): last axis value of a linear axis.\n
+        n (int): number of axis points, the last dimension of
+            `y` by default.\n
+        unit (str): unit of the stored axis, `nm` or `cm-1`.
+        """
+
+        if unit not in ('nm', 'cm-1'):
+            raise ValueError('Unit must be nm or cm-1.')
+
+        self.y = y
+        self.unit = unit
+        self._x = x
+        self._start = start
+        self._stop = stop
+
+        if n is None:
+            n = len(x) if x is not None else np.shape(y)[-1]
+        self._n = n
+
+    @classmethod
+    def from_arrays(cls, x, y, unit='nm'):
+        """
+        Builds a spectrum from reader output, dropping
+        the axis array if it is evenly spaced in its unit
+        or, like .spa axes, in the reciprocal unit.
+
+        Parameters
+        ----------
+        x (np.ndarray): the axis.\n
+        y (np.ndarray): the values.\n
+        unit (str): unit of `x`, `nm` or `cm-1`.
+
+        Returns
+        ----------
+        (Spectrum) the spectrum.
+        """
+
+        x = np.asarray(x)
+
+        if len(x) < 2 or x.dtype.kind != 'f':
+            return cls(y, x=x, unit=unit)
+
+        if _is_linear(x):
+            return cls(y, start=x[0], stop=x[-1], n=len(x), unit=unit)
+
+        # nm axes of evenly spaced wavenumbers
+        if x.all():
+            other = 'cm-1' if unit == 'nm' else 'nm'
+            inverse = 1.0E7 / x
+            if _is_linear(inverse, 16):
+                return cls(
+                    y, start=inverse[0], stop=inverse[-1], n=len(x),
+                    unit=other
+                )
+
+        return cls(y, x=x, unit=unit)
+
+    def __len__(self):
+        return self._n
+
+    def __iter__(self):
+        """
+        Unpacks as `(x, y)` in nanometers, like `read_data()`.
+        """
+        return iter((self.nanometers(), self.y))
+
+    def is_linear(self):
+        """
+        Returns True if the axis is held implicitly.
+        """
+        return self._x is None
+
+    def limits(self):
+        """
+        Returns `(start, stop)`, the first and last values
+        of the axis in its stored unit.
+        """
+
+        if self._x is not None:
+            return self._x[0], self._x[-1]
+
+        return self._start, self._stop
+
+    def axis(self):
+        """
+        Returns the axis in its stored unit, building
+        it if it is implicit.
+        """
+
+        if self._x is not None:
+            return self._x
+
+        # descending axes are built from their low end, like
+        # the wavenumbers of `sparse.spa`
+        if self._start > self._stop:
+            return np.flip(np.linspace(self._stop, self._start, self._n))
+
+        return np.linspace(self._start, self._stop, self._n)
+
+    def nanometers(self):
+        """
+        Returns the axis in nanometers.
+        """
+
+        if self.unit == 'nm':
+            return self.axis()
+
+        return 1.0E7 / self.axis()
+
+    def wavenumbers(self):
+        """
+        Returns the axis in wavenumbers (cm-1).
+        """
+
+        if self.unit == 'cm-1':
+            return self.axis()
+
+        return 1.0E7 / self.axis()
+
+    @property
+    def nbytes(self):
+        """
+        Bytes held by the spectrum arrays.
+        """
+
+        size = np.asarray(self.y).nbytes
+        if self._x is not None:
+            size += self._x.nbytes
+
+        return size
+
+
+def _is_linear(x, ulps=4):
+    """
+    Returns True if `x` matches an evenly spaced axis
+    to within `ulps` units in the last place.
+    """
+
+    linear = np.linspace(x[0], x[-1], len(x))
+    scale = max(abs(x[0]), abs(x[-1]))
+    tol = ulps * np.finfo(x.dtype).eps * scale
+
+    return bool(np.all(np.abs(linear - x) <= tol))
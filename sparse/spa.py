@@ -0,0 +1,397 @@
+#!user/bin/python
+# -*- coding: utf-8 -*-
+"""
+'spa.py' contains the binary backend used to decode
+Thermo OMNIC .spa files and .spg series directly from
+a memory mapping or an in-memory buffer.
+"""
+
+# see lerkoah/spa-on-python on github for explanation #
+# https://github.com/lerkoah/spa-on-python.git #
+
+# import dependencies
+import io
+import mmap
+import struct
+import numpy as np
+
+
+# title (30)
+HEADER_OFFSET = 30
+TITLE = struct.Struct('<255s')
+
+# points (+4), max/min wavenumber (+16, +20) of the header block
+HEADER_FIELDS = struct.Struct('<4xi8xff')
+
+# header block of files whose directory does not list it
+HEADER_BLOCK_OFFSET = 560
+
+# the block directory holds the declared number of
+# 16-byte entries starting at offset 304
+BLOCK_COUNT_OFFSET = 294
+DIRECTORY_OFFSET = 304
+
+# leading bytes read first, enough for the header and a
+# directory of 256 blocks, see `head_size()` for larger ones
+HEAD_BYTES = DIRECTORY_OFFSET + 16 * 256
+DIRECTORY = np.dtype({
+    'names': ['key', 'offset', 'size'],
+    'formats': ['u1', '<u4', '<u4'],
+    'offsets': [0, 2, 6],
+    'itemsize': 16
+})
+
+# directory keys of the known block types
+HEADER_BLOCK = 2
+DATA_BLOCK = 3
+HISTORY_BLOCK = 27
+SAMPLE_IFG_BLOCK = 102
+BACKGROUND_IFG_BLOCK = 103
+
+
+def map_buffer(source):
+    """
+    Returns a read-only buffer over the contents of an
+    .spa source without copying it where possible.
+
+    Parameters
+    ----------
+    source (obj): an open file object, a path, or a
+        bytes/bytearray/memoryview/io.BytesIO object.
+
+    Returns
+    ----------
+    (buffer) a mmap.mmap or memoryview over the file contents.
+    """
+
+    # in-memory buffers are used as-is
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return memoryview(source)
+
+    # io.BytesIO and sparse.inputs.BufferReader
+    if hasattr(source, 'getbuffer'):
+        return source.getbuffer()
+
+    # paths are opened and mapped, the mapping
+    # stays valid after the file is closed
+    if isinstance(source, str) or hasattr(source, '__fspath__'):
+        with open(source, 'rb') as f:
+            return map_buffer(f)
+
+    # real OS files are mapped once
+    try:
+        return mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+        pass
+
+    # any other file-like is read into memory,
+    # from the start where the stream allows it
+    try:
+        source.seek(0)
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        pass
+
+    data = source.read()
+
+    if isinstance(data, str):
+        raise TypeError('.spa files must be opened in binary mode.')
+
+    return memoryview(data)
+
+
+def read_header(buf, directory=None):
+    """
+    Decodes the title and the header block fields. The
+    header block is found through the directory, as the
+    fixed offset of small files is overwritten by the
+    directory of series with more than 16 blocks.
+
+    Parameters
+    ----------
+    buf (buffer): buffer returned by `map_buffer()`.\n
+    directory (dict): optional index returned by
+        `read_directory()`, read from `buf` if omitted.
+
+    Returns
+    ----------
+    (dict) with keys `title`, `points`, `max_wv` and `min_wv`.
+    """
+
+    if directory is None:
+        directory = read_directory(buf)
+
+    title = TITLE.unpack_from(buf, HEADER_OFFSET)[0]
+    points, max_wv, min_wv = HEADER_FIELDS.unpack_from(
+        buf, header_offset(directory)
+    )
+
+    return {
+        'title': title.replace(b'\x00', b'').decode('latin-1'),
+        'points': points,
+        'max_wv': np.float32(max_wv),
+        'min_wv': np.float32(min_wv)
+    }
+
+
+def header_offset(directory):
+    """
+    Returns the offset of the header block, listed in the
+    directory or at `HEADER_BLOCK_OFFSET`.
+    """
+
+    blocks = directory.get(HEADER_BLOCK)
+
+    return blocks[0][0] if blocks else HEADER_BLOCK_OFFSET
+
+
+def head_size(head):
+    """
+    Returns the number of leading bytes holding the full
+    directory and the header block of a file.
+
+    Parameters
+    ----------
+    head (buffer): leading bytes of the file, at least up
+        to the block count.
+
+    Returns
+    ----------
+    (int) the size, at least `HEAD_BYTES`.
+    """
+
+    nblocks = struct.unpack_from('<H', head, BLOCK_COUNT_OFFSET)[0]
+    size = max(HEAD_BYTES, DIRECTORY_OFFSET + DIRECTORY.itemsize * nblocks)
+
+    # the header block is listed within the directory
+    if len(head) >= size:
+        offset = header_offset(read_directory(head[:size]))
+        size = max(size, offset + HEADER_FIELDS.size)
+
+    return size
+
+
+def read_directory(buf):
+    """
+    Reads the block directory into an index of block
+    types. The table is decoded in a single call and is
+    bounded by the block count and the end of the buffer,
+    so truncated files cannot stall it.
+
+    Parameters
+    ----------
+    buf (buffer): buffer returned by `map_buffer()`.
+
+    Returns
+    ----------
+    (dict) mapping each block key to a list of
+    `(offset, size)` tuples in directory order.
+    """
+
+    if len(buf) < DIRECTORY_OFFSET:
+        raise ValueError('File too short for an .spa directory.')
+
+    nblocks = struct.unpack_from('<H', buf, BLOCK_COUNT_OFFSET)[0]
+    nblocks = min(
+        nblocks, (len(buf) - DIRECTORY_OFFSET) // DIRECTORY.itemsize
+    )
+
+    table = np.frombuffer(
+        buf, DIRECTORY, count=nblocks, offset=DIRECTORY_OFFSET
+    )
+
+    # an empty entry terminates the table
+    empty = np.flatnonzero(table['key'] == 0)
+    if len(empty):
+        table = table[:empty[0]]
+
+    directory = {}
+    for key, offset, size in table.tolist():
+        directory.setdefault(key, []).append((offset, size))
+
+    return directory
+
+
+def block_bytes(buf, directory, key, index=0):
+    """
+    Returns a zero-copy view of a directory block.
+
+    Parameters
+    ----------
+    buf (buffer): buffer returned by `map_buffer()`.\n
+    directory (dict): index returned by `read_directory()`.\n
+    key (int): the block type, e.g. `HISTORY_BLOCK`.\n
+    index (int): which block to return if the key repeats.
+
+    Returns
+    ----------
+    (memoryview) the block contents, truncated at the end
+    of the buffer.
+    """
+
+    try:
+        offset, size = directory[key][index]
+    except (KeyError, IndexError):
+        raise KeyError('No block ' + str(key) + ' in .spa file.')
+
+    return memoryview(buf)[offset:offset + size]
+
+
+def block_array(buf, directory, key, index=0):
+    """
+    Returns a float32 block (spectrum, interferogram) as
+    a zero-copy view.
+
+    Parameters
+    ----------
+    buf (buffer): buffer returned by `map_buffer()`.\n
+    directory (dict): index returned by `read_directory()`.\n
+    key (int): the block type, e.g. `SAMPLE_IFG_BLOCK`.\n
+    index (int): which block to return if the key repeats.
+
+    Returns
+    ----------
+    (np.ndarray) float32 view of the block.
+    """
+
+    block = block_bytes(buf, directory, key, index)
+
+    return np.frombuffer(block[:len(block) // 4 * 4], '<f4')
+
+
+def read_history(buf, directory):
+    """
+    Decodes the acquisition history text block.
+
+    Parameters
+    ----------
+    buf (buffer): buffer returned by `map_buffer()`.\n
+    directory (dict): index returned by `read_directory()`.
+
+    Returns
+    ----------
+    (str) the history text.
+    """
+
+    raw = bytes(block_bytes(buf, directory, HISTORY_BLOCK))
+
+    return raw.replace(b'\x00', b'').decode('latin-1')
+
+
+def find_data_offset(buf, directory=None):
+    """
+    Finds the byte offset of the spectrum from the
+    block directory.
+
+    Parameters
+    ----------
+    buf (buffer): buffer returned by `map_buffer()`.\n
+    directory (dict): optional index returned by
+        `read_directory()`, read from `buf` if omitted.
+
+    Returns
+    ----------
+    (int) byte offset of the spectral data.
+    """
+
+    if directory is None:
+        directory = read_directory(buf)
+
+    if DATA_BLOCK not in directory:
+        raise ValueError('No data block found in .spa file.')
+
+    return directory[DATA_BLOCK][0][0]
+
+
+def read_spectrum(buf, points, offset):
+    """
+    Returns the spectrum as a zero-copy float32 view into
+    `buf`. The view is truncated if the buffer ends early.
+
+    Parameters
+    ----------
+    buf (buffer): buffer returned by `map_buffer()`.\n
+    points (int): number of points in the spectrum.\n
+    offset (int): byte offset of the spectral data.
+
+    Returns
+    ----------
+    (np.ndarray) float32 view of the spectrum.
+    """
+
+    count = min(points, max(len(buf) - offset, 0) // 4)
+
+    return np.frombuffer(buf, '<f4', count=count, offset=offset)
+
+
+def read_series(buf, points, directory=None):
+    """
+    Returns every spectrum of an OMNIC series (.spg, or a
+    time-series .spa holding several data blocks) as one
+    float32 matrix of shape `(n_spectra, points)`.
+
+    Data blocks spaced at a constant stride, the layout
+    written by OMNIC, are returned as a single strided
+    view of `buf`: nothing is copied and each row is only
+    read from the mapping when it is accessed. Other
+    layouts are gathered into a new array with one bulk
+    index instead of a per-spectrum loop.
+
+    Parameters
+    ----------
+    buf (buffer): buffer returned by `map_buffer()`.\n
+    points (int): number of points per spectrum.\n
+    directory (dict): optional index returned by
+        `read_directory()`, read from `buf` if omitted.
+
+    Returns
+    ----------
+    (np.ndarray) float32 matrix, read-only when it is a
+    view of a mapping.
+    """
+
+    if directory is None:
+        directory = read_directory(buf)
+
+    if DATA_BLOCK not in directory:
+        raise ValueError('No data block found in .spa file.')
+
+    offsets = np.array([o for o, s in directory[DATA_BLOCK]], dtype=np.int64)
+    size = 4 * points
+
+    if offsets.max() + size > len(buf):
+        raise ValueError('Data block exceeds the end of the .spa file.')
+
+    steps = np.diff(offsets)
+    stride = int(steps[0]) if len(steps) else size
+
+    # one view over the whole data region
+    if (steps == stride).all() and stride >= size:
+        return np.ndarray(
+            (len(offsets), points), '<f4', buffer=buf,
+            offset=int(offsets[0]), strides=(stride, 4)
+        )
+
+    # irregular layout, gather every block at once
+    flat = np.frombuffer(buf, np.uint8)
+    index = offsets[:, None] + np.arange(size)
+
+    return flat[index].view('<f4')
+
+
+def wavenumbers(header):
+    """
+    Builds the wavenumber axis described by the header,
+    ordered from the first to the last recorded point.
+
+    Parameters
+    ----------
+    header (dict): header returned by `read_header()`.
+
+    Returns
+    ----------
+    (np.ndarray) float32 wavenumber array.
+    """
+
+    return np.flip(
+        np.linspace(header['min_wv'], header['max_wv'], header['points'])
+    )
@@ -0,0 +1,120 @@
+#!user/bin/python
+# -*- coding: utf-8 -*-
+"""
+'stats.py' contains the opt-in instrumentation used
+to time the stages of a parse and count the data read.
+"""
+
+# import dependencies
+import contextlib
+import threading
+import time
+
+
+# stages timed by the parsers
+STAGES = ('open', 'header', 'convert', 'units')
+
+# counters updated by the parsers
+COUNTERS = ('bytes_read', 'rows_parsed', 'rows_skipped')
+
+# shared no-op stage of parsers without stats
+NULL_STAGE = contextlib.nullcontext()
+
+
+class ParseStats():
+    """
+    Per-stage timings and counters of one or more parses.
+    Pass an instance as the `stats` option of a parser
+    to enable it; parsers without one skip all timing.
+
+    Stages
+    ----------
+    open: reading, mapping or seeking the file.\n
+    header: decoding header rows and fields.\n
+    convert: converting the numeric data.\n
+    units: unit conversion, derived channels and dtype casts.
+    """
+
+    def __init__(self, callback=None):
+        """
+        Initialize stats class.
+
+        Parameters
+        ------------
+        callback (callable): optional `callback(name, value)`
+            called on every record, with the stage name and its
+            seconds, or the counter name and its increment.
+            Used to forward the figures to a metrics system.
+        """
+
+        self.callback = callback
+        self.timings = dict.fromkeys(STAGES, 0.0)
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """
+        Context manager timing the enclosed block as
+        stage `name`.
+        """
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def add_time(self, name, seconds):
+        """
+        Adds `seconds` to the total time of stage `name`.
+        """
+
+        with self._lock:
+            self.timings[name] = self.timings.get(name, 0.0) + seconds
+
+        if self.callback is not None:
+            self.callback(name, seconds)
+
+    def count(self, name, value):
+        """
+        Adds `value` to the counter `name`.
+        """
+
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+        if self.callback is not None:
+            self.callback(name, value)
+
+    def as_dict(self):
+        """
+        Returns the timings in seconds and the counters.
+
+        Returns
+        ----------
+        (dict) with the `timings` and `counters` dicts.
+        """
+
+        with self._lock:
+            return {
+                'timings': dict(self.timings),
+                'counters': dict(self.counters)
+            }
+
+    def reset(self):
+        """
+        Clears the timings and counters.
+        """
+
+        with self._lock:
+            self.timings = dict.fromkeys(STAGES, 0.0)
+            self.counters = dict.fromkeys(COUNTERS, 0)
+
+
+def count_lines(text):
+    """
+    Returns the number of non-blank lines of `text`.
+    """
+
+    return sum(1 for line in text.splitlines() if line.strip())
@@ -2,14 +2,20 @@
 Utility functions used in the sparse package.
 """
 
-import plotly.graph_objects as go
 import numpy as np
 
 
 def show_plot(x, y, title=None, x_title=None, y_title=None):
     """
-    Plotly wrapper.
+    Plotly wrapper. Plotly is imported on first use, it
+    is an optional dependency and slow to import.
     """
+
+    try:
+        import plotly.graph_objects as go
+    except ImportError as e:
+        raise ImportError('show_plot() requires plotly.') from e
+
     fig = go.Figure()
 
     # add reference spectrum
@@ -0,0 +1,197 @@
+#!user/bin/python
+# -*- coding: utf-8 -*-
+"""
+Test class for the asyncio interface.
+"""
+# import external packages
+import asyncio
+import io
+import unittest
+from concurrent import futures
+from pathlib import Path
+import sys
+import os
+from numpy import testing as nptest
+
+
+# import package
+from sparse import aio
+from sparse.batch import aparse_many
+from sparse.parsers import DataFileParser
+
+
+class AsyncUpload():
+    """
+    Stand-in for a web framework upload with an async read().
+    """
+
+    def __init__(self, content, filename=None):
+        self.content = content
+        self.filename = filename
+
+    async def read(self):
+        await asyncio.sleep(0)
+        return self.content
+
+
+class TestAio(unittest.TestCase):
+
+    # set up the test case
+    @classmethod
+    def setUpClass(cls):
+        """
+        Setup the test class and initialize test variables
+        and expected test results.
+        """
+
+        sys.stdout.write('\nSetting up test class... ')
+
+        # path to parent directory
+        cls.data_dir = Path(__file__).resolve().parent.parent
+
+        # get the data files
+        cls.csv_file = os.path.join(
+            cls.data_dir, 'test_input' + os.sep + 'dow_moe_rev5_cal_001.csv'
+        )
+        cls.spa_file = os.path.join(
+            cls.data_dir, 'test_input' + os.sep + 'NBK-026_1.SPA'
+        )
+
+        with open(cls.csv_file) as df:
+            cls.exp_wv, cls.exp_vals = DataFileParser(
+                f_obj=df, f_type='csv'
+            ).read_data()
+
+        sys.stdout.write('SUCCESS ')
+
+    def test_aread_data(self):
+        """
+        Test the awaitable parser methods.
+        """
+
+        sys.stdout.write('\n\nTesting aread_data()...\n')
+
+        async def main():
+
+            with open(self.csv_file) as df:
+                test_wv, test_vals = await DataFileParser(
+                    f_obj=df, f_type='csv'
+                ).aread_data()
+
+            nptest.assert_array_equal(test_wv, self.exp_wv)
+            nptest.assert_array_equal(test_vals, self.exp_vals)
+
+            # async uploads, type detected from the content
+            with open(self.csv_file, 'rb') as df:
+                upload = AsyncUpload(df.read())
+            self.assertEqual(await DataFileParser(f_obj=upload).ais_valid(), True)
+
+            with open(self.spa_file, 'rb') as df:
+                upload = AsyncUpload(df.read())
+            result = await DataFileParser(f_obj=upload).aparse()
+            self.assertEqual(result.valid, True)
+
+            # parser state cannot be updated from another process
+            with futures.ProcessPoolExecutor(max_workers=1) as pool:
+                with self.assertRaises(TypeError):
+                    await DataFileParser(f_obj=self.csv_file).aparse(pool)
+
+        asyncio.run(main())
+
+        with futures.ProcessPoolExecutor(max_workers=1) as pool:
+            with self.assertRaises(TypeError):
+                aio.set_executor(pool)
+
+        sys.stdout.write('\n PASSED')
+
+    def test_aparse_many(self):
+        """
+        Test the async batch function and its concurrency limit.
+        """
+
+        sys.stdout.write('\n\nTesting aparse_many()...\n')
+
+        async def main():
+
+            with open(self.csv_file, 'rb') as df:
+                content = df.read()
+
+            sources = [
+                self.csv_file,
+                (self.spa_file, 'spa'),
+                'missing.csv',
+                AsyncUpload(content, 'upload.csv'),
+                (io.StringIO(content.decode('utf-8')), 'csv')
+            ]
+
+            results = [
+                r async for r in aparse_many(sources, limit=2, ordered=True)
+            ]
+
+            self.assertEqual([i for i, r in results], [0, 1, 2, 3, 4])
+            self.assertEqual(
+                [r.valid for i, r in results], [True, True, False, True, True]
+            )
+            nptest.assert_array_equal(results[3][1].y_data, self.exp_vals)
+
+            # unordered results cover every item
+            results = aparse_many([self.csv_file] * 6, executor='process')
+            self.assertEqual(
+                sorted([i async for i, r in results]), [0, 1, 2, 3, 4, 5]
+            )
+
+        asyncio.run(main())
+
+        sys.stdout.write('\n PASSED')
+
+    def test_cancel(self):
+        """
+        Test that cancelling a batch stops the remaining files.
+        """
+
+        sys.stdout.write('\n\nTesting aparse_many() cancellation...\n')
+
+        started = []
+
+        class SlowUpload(AsyncUpload):
+            async def read(self):
+                started.append(self)
+                await asyncio.sleep(10)
+                return self.content
+
+        async def main():
+
+            pool = futures.ThreadPoolExecutor(max_workers=2)
+            sources = [SlowUpload(b'1.0,2.0\n') for i in range(10)]
+
+            async def consume():
+                return [r async for r in aparse_many(
+                    sources, executor=pool, limit=3
+                )]
+
+            task = asyncio.ensure_future(consume())
+            await asyncio.sleep(0.1)
+
+            # the limit holds the other uploads back
+            self.assertEqual(len(started), 3)
+
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+            await asyncio.sleep(0.1)
+            self.assertEqual(len(started), 3)
+
+            pool.shutdown()
+
+        asyncio.run(main())
+
+        sys.stdout.write('\n PASSED')
+
+    @classmethod
+    def tearDownClass(cls):
+
+        sys.stdout.write('\nRunning teardown procedure... SUCCESS')
+
+if __name__=='__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+#!user/bin/python
+# -*- coding: utf-8 -*-
+"""
+Test class for batch parsing.
+"""
+# import external packages
+import io
+import unittest
+from pathlib import Path
+import sys
+import os
+from numpy import testing as nptest
+
+
+# import package
+from sparse.batch import parse_many
+from sparse.parsers import DataFileParser
+
+class TestBatch(unittest.TestCase):
+
+    # set up the test case
+    @classmethod
+    def setUpClass(cls):
+        """
+        Setup the test class and initialize test variables
+        and expected test results.
+        """
+
+        sys.stdout.write('\nSetting up test class... ')
+
+        # path to parent directory
+        cls.data_dir = Path(__file__).resolve().parent.parent
+
+        # get the data files
+        cls.csv_file = os.path.join(
+            cls.data_dir, 'test_input' + os.sep + 'dow_moe_rev5_cal_001.csv'
+        )
+        cls.spa_file = os.path.join(
+            cls.data_dir, 'test_input' + os.sep + 'NBK-026_1.SPA'
+        )
+
+        sys.stdout.write('SUCCESS ')
+
+    def test_parse_many(self):
+        """
+        Test parse_many() on thread and process pools.
+        """
+
+        sys.stdout.write('\n\nTesting parse_many()...\n')
+
+        with open(self.csv_file) as df:
+            test_csv = DataFileParser(f_obj=df, f_type='csv')
+            exp_wv, exp_vals = test_csv.read_data()
+
+        for executor in ('thread', 'process'):
+
+            sources = [
+                self.csv_file,
+                (self.spa_file, 'spa'),
+                'missing.csv',
+                (io.StringIO('wavelength,value\n1.0,2.0\n'), 'csv')
+            ]
+
+            results = list(parse_many(sources, executor=executor, chunksize=2))
+
+            # results come back in order with per-file errors
+            self.assertEqual([i for i, r in results], [0, 1, 2, 3])
+            self.assertEqual(
+                [r.valid for i, r in results], [True, True, False, True]
+            )
+            self.assertIsNone(results[2][1].x_data)
+            nptest.assert_array_equal(results[0][1].x_data, exp_wv)
+            nptest.assert_array_equal(results[0][1].y_data, exp_vals)
+
+            # unordered results cover every item
+            results = parse_many(
+                [self.csv_file] * 5, executor=executor, ordered=False
+            )
+            self.assertEqual(sorted(i for i, r in results), [0, 1, 2, 3, 4])
+
+        with self.assertRaises(ValueError):
+            list(parse_many([self.csv_file], chunksize=0))
+
+        sys.stdout.write('\n PASSED')
+
+    @classmethod
+    def tearDownClass(cls):
+
+        sys.stdout.write('\nRunning teardown procedure... SUCCESS')
+
+if __name__=='__main__':
+    unittest.main()
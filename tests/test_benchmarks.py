@@ -0,0 +1,91 @@
+#!user/bin/python
+# -*- coding: utf-8 -*-
+"""
+Test class for the benchmark suite.
+"""
+# import external packages
+import tempfile
+import unittest
+import sys
+
+
+# import package
+from benchmarks import generators, run
+
+class TestBenchmarks(unittest.TestCase):
+
+    # set up the test case
+    @classmethod
+    def setUpClass(cls):
+        """
+        Setup the test class and initialize test variables
+        and expected test results.
+        """
+
+        sys.stdout.write('\nSetting up test class... ')
+
+        cls.workdir = tempfile.TemporaryDirectory()
+
+        sys.stdout.write('SUCCESS ')
+
+    def test_run(self):
+        """
+        Test that every generated format reads back in every mode.
+        """
+
+        sys.stdout.write('\n\nTesting benchmarks.run()...\n')
+
+        results = run.run(sizes=[500], repeat=1, workdir=self.workdir.name)
+
+        # iter_data is only skipped by formats without a streaming reader
+        cases = {(r['format'], r['mode']) for r in results}
+        for fmt in generators.FORMATS:
+            for mode in run.MODES:
+                if mode != 'iter_data':
+                    self.assertIn((fmt, mode), cases)
+
+        for r in results:
+            self.assertEqual(r['points'], 500)
+            self.assertGreater(r['points_per_s'], 0)
+            self.assertGreater(r['peak_bytes'], 0)
+
+        # a report compares against itself
+        report = {'results': results}
+        table = run.compare(report, report).splitlines()
+        self.assertEqual(len(table), len(results) + 1)
+        self.assertTrue(all(line.endswith('1.00x') for line in table[1:]))
+
+        sys.stdout.write('\n PASSED')
+
+    def test_generate(self):
+        """
+        Test that generated files are checked and invalid
+        files written again.
+        """
+
+        sys.stdout.write('\n\nTesting benchmarks.generate()...\n')
+
+        for fmt in generators.FORMATS:
+            run.check(fmt, run.generate(fmt, 100, self.workdir.name))
+
+        path = run.generate('jcamp', 200, self.workdir.name)
+        with open(path, 'w') as f:
+            f.write('##TITLE= stale\n##FIRSTX= np.float64(400.0)\n')
+
+        with self.assertRaises(ValueError):
+            run.check('jcamp', path)
+
+        self.assertEqual(run.generate('jcamp', 200, self.workdir.name), path)
+        run.check('jcamp', path)
+
+        sys.stdout.write('\n PASSED')
+
+    @classmethod
+    def tearDownClass(cls):
+
+        cls.workdir.cleanup()
+
+        sys.stdout.write('\nRunning teardown procedure... SUCCESS')
+
+if __name__=='__main__':
+    unittest.main()
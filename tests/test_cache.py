@@ -0,0 +1,129 @@
+#!user/bin/python
+# -*- coding: utf-8 -*-
+"""
+Test class for the parse cache.
+"""
+# import external packages
+import io
+import unittest
+from pathlib import Path
+import sys
+import os
+import tempfile
+import numpy as np
+from numpy import testing as nptest
+
+
+# import package
+from sparse.cache import ParseCache
+from sparse.parsers import DataFileParser
+
+class TestParseCache(unittest.TestCase):
+
+    # set up the test case
+    @classmethod
+    def setUpClass(cls):
+        """
+        Setup the test class and initialize test variables
+        and expected test results.
+        """
+
+        sys.stdout.write('\nSetting up test class... ')
+
+        # path to parent directory
+        cls.data_dir = Path(__file__).resolve().parent.parent
+
+        # get the data files
+        cls.csv_file = os.path.join(
+            cls.data_dir, 'test_input' + os.sep + 'dow_moe_rev5_cal_001.csv'
+        )
+        cls.spa_file = os.path.join(
+            cls.data_dir, 'test_input' + os.sep + 'NBK-026_1.SPA'
+        )
+
+        sys.stdout.write('SUCCESS ')
+
+    def test_cache_hit(self):
+        """
+        Test repeat parses of identical files are served
+        from the in-memory tier.
+        """
+
+        sys.stdout.write('\n\nTesting ParseCache hits...\n')
+
+        cache = ParseCache()
+
+        with open(self.csv_file) as df:
+            test_csv = DataFileParser(f_obj=df, f_type='csv')
+            exp_wv, exp_vals = test_csv.read_data()
+
+        # validate, then read the same upload twice
+        with open(self.csv_file) as df:
+            test_csv = DataFileParser(f_obj=df, f_type='csv', cache=cache)
+            self.assertEqual(test_csv.is_valid(), True)
+            test_wv, test_vals = test_csv.read_data()
+
+        with open(self.csv_file) as df:
+            test_csv = DataFileParser(f_obj=df, f_type='csv', cache=cache)
+            again_wv, again_vals = test_csv.read_data()
+
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertIs(again_wv, test_wv)
+        self.assertFalse(again_wv.flags['WRITEABLE'])
+        nptest.assert_array_equal(test_wv, exp_wv)
+        nptest.assert_array_equal(test_vals, exp_vals)
+
+        # different options are a different entry
+        with open(self.csv_file) as df:
+            DataFileParser(
+                f_obj=df, f_type='csv', cache=cache, dtype=np.float32
+            ).parse()
+        self.assertEqual(len(cache), 2)
+
+        sys.stdout.write('\n PASSED')
+
+    def test_cache_eviction(self):
+        """
+        Test size based eviction and the on-disk tier.
+        """
+
+        sys.stdout.write('\n\nTesting ParseCache eviction...\n')
+
+        with tempfile.TemporaryDirectory() as tmp:
+
+            # room for a single spectrum in memory
+            cache = ParseCache(max_bytes=50200, directory=tmp)
+
+            with open(self.spa_file, 'rb') as df:
+                test_spa = DataFileParser(f_obj=df, f_type='spa', cache=cache)
+                exp = test_spa.parse()
+
+            DataFileParser(
+                f_obj=io.StringIO('wavelength,value\n1.0,2.0\n'),
+                f_type='csv',
+                cache=cache
+            ).parse()
+
+            self.assertEqual(len(cache), 1)
+            self.assertLessEqual(cache.nbytes, cache.max_bytes)
+
+            # a fresh cache on the same directory is warm
+            cache = ParseCache(directory=tmp)
+            with open(self.spa_file, 'rb') as df:
+                test_spa = DataFileParser(f_obj=df, f_type='spa', cache=cache)
+                result = test_spa.parse()
+
+            self.assertEqual(cache.hits, 1)
+            self.assertEqual(result.valid, exp.valid)
+            nptest.assert_array_equal(result.x_data, exp.x_data)
+            nptest.assert_array_equal(result.y_data, exp.y_data)
+
+        sys.stdout.write('\n PASSED')
+
+    @classmethod
+    def tearDownClass(cls):
+
+        sys.stdout.write('\nRunning teardown procedure... SUCCESS')
+
+if __name__=='__main__':
+    unittest.main()
@@ -0,0 +1,202 @@
+#!user/bin/python
+# -*- coding: utf-8 -*-
+"""
+Test class for the command line tool.
+"""
+# import external packages
+import contextlib
+import io
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+import os
+import numpy as np
+from numpy import testing as nptest
+
+
+# import package
+from sparse import cli
+from sparse.library import SpectralLibrary
+from sparse.parsers import DataFileParser
+
+class TestCli(unittest.TestCase):
+
+    # set up the test case
+    @classmethod
+    def setUpClass(cls):
+        """
+        Setup the test class and initialize test variables
+        and expected test results.
+        """
+
+        sys.stdout.write('\nSetting up test class... ')
+
+        # path to parent directory
+        cls.data_dir = Path(__file__).resolve().parent.parent
+        cls.input_dir = os.path.join(cls.data_dir, 'test_input')
+
+        cls.workdir = tempfile.TemporaryDirectory()
+
+        # test files plus a broken one in a sub directory
+        cls.source = os.path.join(cls.workdir.name, 'source')
+        shutil.copytree(cls.input_dir, cls.source)
+        os.mkdir(os.path.join(cls.source, 'sub'))
+        with open(os.path.join(cls.source, 'sub', 'broken.spa'), 'wb') as f:
+            f.write(b'not a spectrum')
+
+        sys.stdout.write('SUCCESS ')
+
+    def _main(self, *argv):
+        """
+        Runs the tool, returns its exit status and stdout.
+        """
+
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            status = cli.main(list(argv) + ['-q'])
+
+        return status, out.getvalue()
+
+    def test_validate(self):
+        """
+        Test validating a directory with a JSON report.
+        """
+
+        sys.stdout.write('\n\nTesting sparse validate...\n')
+
+        status, out = self._main(
+            'validate', self.source, '--report', '-', '-j', '2'
+        )
+        report = json.loads(out)
+
+        self.assertEqual(status, 1)
+        self.assertEqual(report['files'], 6)
+        self.assertEqual(report['failed'], 1)
+
+        failed = [r for r in report['results'] if r['error']]
+        self.assertEqual(failed[0]['name'], 'sub/broken.spa')
+
+        # glob patterns and single files
+        status, out = self._main(
+            'summary', os.path.join(self.source, '**', '*.[cC][sS][vV]'),
+            os.path.join(self.source, 'NBK-026_1.SPA')
+        )
+        self.assertEqual(status, 0)
+        rows = out.splitlines()
+        self.assertEqual(len(rows), 3)
+        self.assertTrue(rows[2].startswith('NBK-026_1.SPA\tspa\tTrue\t6224'))
+
+        # every spectrum of a JSON document is counted
+        status, out = self._main(
+            'summary', os.path.join(self.source, 'lims_export.json')
+        )
+        self.assertEqual(
+            out.splitlines()[1].split('\t'),
+            ['lims_export.json', 'json', 'True', '10', '3', '400.0', '402.0', '']
+        )
+
+        # no input files
+        status, out = self._main('validate', '--pattern', '*.xyz', self.source)
+        self.assertEqual(status, 2)
+
+        # counts must be positive
+        for option in ('-j', '--chunksize'):
+            for value in ('0', '-1', 'x'):
+                with contextlib.redirect_stderr(io.StringIO()) as err:
+                    with self.assertRaises(SystemExit) as cm:
+                        self._main('validate', self.source, option, value)
+                self.assertEqual(cm.exception.code, 2)
+                self.assertIn('must be a positive integer', err.getvalue())
+
+        sys.stdout.write('\n PASSED')
+
+    def test_convert(self):
+        """
+        Test converting a directory to per-file outputs.
+        """
+
+        sys.stdout.write('\n\nTesting sparse convert...\n')
+
+        with open(os.path.join(self.source, 'NBK-026_1.SPA'), 'rb') as df:
+            exp_wv, exp_vals = DataFileParser(
+                f_obj=df, f_type='spa'
+            ).read_data()
+
+        for to in ('csv', 'npy', 'npz'):
+
+            output = os.path.join(self.workdir.name, to)
+            report_file = os.path.join(self.workdir.name, to + '.json')
+
+            status, out = self._main(
+                'convert', self.source, '--to', to, '-o', output, '-j', '1',
+                '--report', report_file
+            )
+            self.assertEqual(status, 1)
+            self.assertEqual(out, '')
+
+            with open(report_file) as f:
+                report = json.load(f)
+            self.assertEqual(report['succeeded'], 5)
+            self.assertFalse(os.path.exists(os.path.join(output, 'sub')))
+
+            path = os.path.join(output, 'NBK-026_1.' + to)
+            if to == 'csv':
+                data = np.loadtxt(path, delimiter=',', skiprows=1)
+            elif to == 'npy':
+                data = np.load(path)
+            else:
+                with np.load(path) as npz:
+                    data = np.column_stack((npz['x'], npz['y']))
+
+            nptest.assert_allclose(data[:, 0], exp_wv, rtol=1e-9)
+            nptest.assert_allclose(data[:, 1], exp_vals, rtol=1e-9)
+
+            # one output per spectrum of a JSON document
+            outputs = [
+                r['output'] for r in report['results']
+                if r['name'] == 'lims_export.json'
+            ][0]
+            self.assertEqual(
+                [os.path.basename(p) for p in outputs],
+                ['lims_export_' + str(i) + '.' + to for i in (1, 2, 3)]
+            )
+            self.assertFalse(
+                os.path.exists(os.path.join(output, 'lims_export.' + to))
+            )
+
+        sys.stdout.write('\n PASSED')
+
+    def test_library(self):
+        """
+        Test converting a directory to a library file.
+        """
+
+        sys.stdout.write('\n\nTesting sparse convert --to library...\n')
+
+        path = os.path.join(self.workdir.name, 'out', 'all.spl')
+
+        status, out = self._main('convert', self.source, '-o', path)
+        self.assertEqual(status, 1)
+
+        with SpectralLibrary(path) as lib:
+            self.assertEqual(len(lib), 7)
+            self.assertEqual(len(lib['lims_export.json#3']), 2)
+            self.assertEqual(
+                lib.metadata('dow_moe_rev5_cal_001.csv')['source'],
+                'dow_moe_rev5_cal_001.csv'
+            )
+
+        sys.stdout.write('\n PASSED')
+
+    @classmethod
+    def tearDownClass(cls):
+
+        cls.workdir.cleanup()
+
+        sys.stdout.write('\nRunning teardown procedure... SUCCESS')
+
+if __name__=='__main__':
+    unittest.main()
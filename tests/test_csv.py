@@ -14,6 +14,8 @@ import sys
 import os
 import pathlib
 import json
+import csv
+import io
 
 
 # import package
@@ -101,6 +103,47 @@ class TestReadCsv(unittest.TestCase):
 
         sys.stdout.write('\n PASSED')
 
+    def test_read_csv_values(self):
+        """
+        Test the bulk _read_csv() engine against a row by row
+        conversion of the same file.
+        """
+
+        sys.stdout.write('\n\nTesting _read_csv() values...\n')
+
+        # build the expected arrays one row at a time
+        exp_wv = []
+        exp_vals = []
+        with open(self.data_file) as df:
+            for r in csv.reader(df):
+                try:
+                    exp_wv.append(float(r[0]))
+                    exp_vals.append(float(r[1]))
+                except ValueError:
+                    pass
+
+        with open(self.data_file) as df:
+            test_csv = DataFileParser(f_obj=df, f_type='.csv')
+            test_wv, test_vals = test_csv._read_csv()
+
+        nptest.assert_array_equal(test_wv, exp_wv)
+        nptest.assert_array_equal(test_vals, exp_vals)
+        self.assertTrue(test_wv.flags['C_CONTIGUOUS'])
+        self.assertEqual(test_vals.dtype, np.float64)
+
+        # rows that fail to convert are skipped
+        f_obj = io.StringIO(
+            'wavelength(nm),value\n1.0,2.0\nbad,row\n\n3.0,4.0\n'
+        )
+        test_wv, test_vals = DataFileParser(
+            f_obj=f_obj, f_type='csv'
+        )._read_csv()
+
+        nptest.assert_array_equal(test_wv, [1.0, 3.0])
+        nptest.assert_array_equal(test_vals, [2.0, 4.0])
+
+        sys.stdout.write('\n PASSED')
+
     def test_is_valid(self):
         """
         Test is_valid() method for csv files.
@@ -158,6 +201,151 @@ class TestReadCsv(unittest.TestCase):
 
         sys.stdout.write('\n PASSED')
 
+    def test_parse(self):
+        """
+        Test the single pass parse() method for csv files.
+        """
+
+        sys.stdout.write('\n\nTesting parse()...\n')
+
+        # read the expected data with the reader
+        with open(self.data_file) as df:
+            exp_wv, exp_vals = DataFileParser(
+                f_obj=df, f_type='csv'
+            )._read_csv()
+
+        # parse once, the file is closed afterwards
+        with open(self.data_file) as df:
+            test_csv = DataFileParser(f_obj=df, f_type='csv')
+            result = test_csv.parse()
+
+        self.assertEqual(result.valid, True)
+        self.assertEqual(result.errors, test_csv.default_message)
+        nptest.assert_array_equal(result.x_data, exp_wv)
+        nptest.assert_array_equal(result.y_data, exp_vals)
+
+        # later calls are served from the cached result
+        self.assertIs(test_csv.parse(), result)
+        self.assertEqual(test_csv.is_valid(), True)
+        test_wv, test_vals = test_csv.read_data()
+        self.assertIs(test_wv, result.x_data)
+        self.assertIs(test_csv.get_y_data(), result.y_data)
+
+        sys.stdout.write('\n PASSED')
+
+    def test_iter_data(self):
+        """
+        Test the streaming iter_data() method for csv files.
+        """
+
+        sys.stdout.write('\n\nTesting iter_data()...\n')
+
+        with open(self.data_file) as df:
+            test_csv = DataFileParser(f_obj=df, f_type='csv')
+            exp_wv, exp_vals = test_csv.read_data()
+
+        with open(self.data_file) as df:
+            test_csv = DataFileParser(f_obj=df, f_type='csv')
+            blocks = list(test_csv.iter_data(block_size=50))
+
+        # every block but the last is full
+        sizes = [len(x) for x, y in blocks]
+        self.assertTrue(all(n == 50 for n in sizes[:-1]))
+        self.assertTrue(0 < sizes[-1] <= 50)
+
+        nptest.assert_array_equal(
+            np.concatenate([x for x, y in blocks]), exp_wv
+        )
+        nptest.assert_array_equal(
+            np.concatenate([y for x, y in blocks]), exp_vals
+        )
+
+        sys.stdout.write('\n PASSED')
+
+    def test_read_data_dtype(self):
+        """
+        Test the dtype option of read_data() for csv files.
+        """
+
+        sys.stdout.write('\n\nTesting read_data() dtype...\n')
+
+        with open(self.data_file) as df:
+            exp_wv, exp_vals = DataFileParser(
+                f_obj=df, f_type='csv'
+            ).read_data()
+
+        for dtype in (np.float32, np.float64):
+
+            with open(self.data_file) as df:
+                test_csv = DataFileParser(f_obj=df, f_type='csv', dtype=dtype)
+                test_wv, test_vals = test_csv.read_data()
+
+            # arrays of the requested dtype, no lists
+            self.assertIsInstance(test_wv, np.ndarray)
+            self.assertEqual(test_wv.dtype, dtype)
+            self.assertEqual(test_vals.dtype, dtype)
+            self.assertTrue(test_wv.flags['C_CONTIGUOUS'])
+            nptest.assert_allclose(test_wv, exp_wv, rtol=1e-6)
+            nptest.assert_allclose(test_vals, exp_vals, rtol=1e-6)
+
+        sys.stdout.write('\n PASSED')
+
+    def test_columns(self):
+        """
+        Test multi-column csv files.
+        """
+
+        sys.stdout.write('\n\nTesting multi-column csv...\n')
+
+        text = (
+            'Wavelength,Dark,Reference,Sample\n'
+            '500.0,1.0,11.0,2.0\n'
+            '501.0,2.0,102.0,12.0\n'
+        )
+
+        # four columns return the dark corrected ratio
+        test_csv = DataFileParser(f_obj=io.StringIO(text), f_type='csv', cols=4)
+        result = test_csv.parse()
+        self.assertEqual(result.valid, True)
+        nptest.assert_allclose(result.y_data, [0.1, 0.1])
+
+        blocks = list(DataFileParser(
+            f_obj=io.StringIO(text), f_type='csv', cols=4,
+            channel='absorbance'
+        ).iter_data(block_size=1))
+        nptest.assert_allclose(
+            np.concatenate([y for x, y in blocks]), [1.0, 1.0]
+        )
+
+        # the column count is still enforced
+        test_csv = DataFileParser(f_obj=io.StringIO(text), f_type='csv')
+        self.assertEqual(test_csv.is_valid(), False)
+        self.assertEqual(
+            test_csv.errors,
+            'File must contain 2 data columns.Error at line 1 of file.'
+        )
+
+        sys.stdout.write('\n PASSED')
+
+    def test_read_metadata(self):
+        """
+        Test header-only metadata of csv files.
+        """
+
+        sys.stdout.write('\n\nTesting read_metadata()...\n')
+
+        with open(self.data_file) as df:
+            test_csv = DataFileParser(f_obj=df, f_type='csv')
+            metadata = test_csv.read_metadata()
+
+        self.assertEqual(metadata, {
+            'header': [['wavelength(nm)', 'value']],
+            'columns': 2,
+            'x_range': (1650.0, 2050.0)
+        })
+
+        sys.stdout.write('\n PASSED')
+
     @classmethod
     def tearDownClass(cls):
 
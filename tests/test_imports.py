@@ -0,0 +1,132 @@
+#!user/bin/python
+# -*- coding: utf-8 -*-
+"""
+Test class for package import time.
+"""
+# import external packages
+import subprocess
+import unittest
+from pathlib import Path
+import sys
+import os
+
+
+# modules workers import to parse, convert or index files
+PUBLIC = (
+    'sparse.parsers', 'sparse.results', 'sparse.registry',
+    'sparse.resample', 'sparse.library', 'sparse.cache', 'sparse.utils',
+    'sparse.batch', 'sparse.cli', 'sparse.index'
+)
+
+# loaded on first use only
+LAZY = ('asyncio', 'plotly', 'sparse.aio', 'sparse.jsonstream')
+
+# import time of each public module, numpy excluded
+BUDGET_MS = 25
+
+class TestImports(unittest.TestCase):
+
+    # set up the test case
+    @classmethod
+    def setUpClass(cls):
+        """
+        Setup the test class and initialize test variables
+        and expected test results.
+        """
+
+        sys.stdout.write('\nSetting up test class... ')
+
+        # path to parent directory
+        cls.data_dir = Path(__file__).resolve().parent.parent
+
+        # bytecode is written so compiling is not timed
+        cls.env = dict(os.environ)
+        cls.env.pop('PYTHONDONTWRITEBYTECODE', None)
+        cls.env['PYTHONPATH'] = str(cls.data_dir)
+
+        cls._run('import ' + ', '.join(PUBLIC))
+
+        sys.stdout.write('SUCCESS ')
+
+    @classmethod
+    def _run(cls, code, *args):
+        """
+        Runs `code` in a fresh interpreter and returns
+        its stderr.
+        """
+
+        out = subprocess.run(
+            [sys.executable, *args, '-c', code], env=cls.env,
+            capture_output=True, text=True, check=True
+        )
+
+        return out.stderr
+
+    def test_budget(self):
+        """
+        Test the import time of the public modules.
+        """
+
+        sys.stdout.write('\n\nTesting import time...\n')
+
+        for module in PUBLIC:
+
+            # best of three, numpy is imported first
+            times = []
+            for _ in range(3):
+                log = self._run('import numpy; import ' + module, '-X', 'importtime')
+                times.append(_cumulative_us(log, module) / 1000.0)
+
+            sys.stdout.write(module + ': ' + '%.1f' % min(times) + ' ms\n')
+            self.assertLess(min(times), BUDGET_MS, module)
+
+        sys.stdout.write('\n PASSED')
+
+    def test_lazy(self):
+        """
+        Test that optional dependencies are not imported.
+        """
+
+        sys.stdout.write('\n\nTesting lazy imports...\n')
+
+        log = self._run(
+            'import sys; import ' + ', '.join(PUBLIC) + '\n'
+            'sys.stderr.write(" ".join(m for m in '
+            + repr(LAZY) + ' if m in sys.modules))'
+        )
+        self.assertEqual(log, '')
+
+        # plotly is only needed to plot
+        log = self._run(
+            'import sys; sys.modules["plotly"] = None\n'
+            'from sparse.utils import show_plot\n'
+            'try:\n'
+            '    show_plot([1], [1])\n'
+            'except ImportError as e:\n'
+            '    sys.stderr.write(str(e))'
+        )
+        self.assertEqual(log, 'show_plot() requires plotly.')
+
+        sys.stdout.write('\n PASSED')
+
+    @classmethod
+    def tearDownClass(cls):
+
+        sys.stdout.write('\nRunning teardown procedure... SUCCESS')
+
+
+def _cumulative_us(log, module):
+    """
+    Returns the cumulative import time of a module from
+    `-X importtime` output.
+    """
+
+    for line in log.splitlines():
+        fields = line.split('|')
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1])
+
+    raise AssertionError(module + ' not imported.')
+
+if __name__=='__main__':
+    unittest.main()
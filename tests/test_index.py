@@ -0,0 +1,199 @@
+#!user/bin/python
+# -*- coding: utf-8 -*-
+"""
+Test class for the metadata index.
+"""
+# import external packages
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from pathlib import Path
+import sys
+import os
+
+
+# import package
+from sparse.index import SpectralIndex, _hash
+
+class TestIndex(unittest.TestCase):
+
+    # set up the test case
+    @classmethod
+    def setUpClass(cls):
+        """
+        Setup the test class and initialize test variables
+        and expected test results.
+        """
+
+        sys.stdout.write('\nSetting up test class... ')
+
+        # path to parent directory
+        cls.data_dir = Path(__file__).resolve().parent.parent
+        cls.input_dir = os.path.join(cls.data_dir, 'test_input')
+
+        cls.workdir = tempfile.TemporaryDirectory()
+
+        sys.stdout.write('SUCCESS ')
+
+    def test_search(self):
+        """
+        Test indexing a directory and searching it.
+        """
+
+        sys.stdout.write('\n\nTesting SpectralIndex.search()...\n')
+
+        source = os.path.join(self.workdir.name, 'search')
+        shutil.copytree(self.input_dir, source)
+
+        with SpectralIndex(os.path.join(self.workdir.name, 'search.db')) as ix:
+
+            counts = ix.refresh(source)
+            self.assertEqual(counts['added'], 5)
+            self.assertEqual(counts['failed'], 0)
+            self.assertEqual(len(ix), 5)
+
+            # OceanView spectrometer serial and range in nm
+            rows = ix.search(instrument='FLMN02631', covers=(1000, 1100))
+            self.assertEqual(len(rows), 1)
+            self.assertTrue(rows[0]['path'].endswith('Avocado1.txt'))
+            self.assertEqual(rows[0]['date'], '2021-04-05T10:31:23')
+            self.assertEqual(rows[0]['metadata']['pixels'], 128)
+
+            self.assertEqual(
+                ix.search(instrument='FLMN02631', covers=(1650, 1700)), []
+            )
+
+            # .spa and .csv both span 1650-1700 nm
+            rows = ix.search(covers=(1700, 1650))
+            self.assertEqual(
+                sorted(r['format'] for r in rows), ['csv', 'spa']
+            )
+
+            self.assertEqual(len(ix.search(title='nbk-026')), 1)
+            self.assertEqual(ix.search(title='%'), [])
+            self.assertEqual(len(ix.search(format='jcamp')), 1)
+
+            # JSON rows hold the document members
+            rows = ix.search(format='json')
+            self.assertEqual(rows[0]['metadata']['spectra'], 3)
+            self.assertEqual(rows[0]['metadata']['export'], 'LIMS')
+
+        sys.stdout.write('\n PASSED')
+
+    def test_refresh(self):
+        """
+        Test that a refresh only re-reads changed files.
+        """
+
+        sys.stdout.write('\n\nTesting SpectralIndex.refresh()...\n')
+
+        source = os.path.join(self.workdir.name, 'refresh')
+        shutil.copytree(self.input_dir, source)
+        path = os.path.join(self.workdir.name, 'refresh.db')
+
+        with SpectralIndex(path) as ix:
+            ix.refresh(source)
+
+        # the index persists between sessions
+        with SpectralIndex(path) as ix:
+
+            self.assertEqual(ix.refresh(source)['unchanged'], 5)
+
+            # touched files are hashed but not re-read
+            os.utime(os.path.join(source, 'NBK-026_1.SPA'))
+
+            csv = os.path.join(source, 'dow_moe_rev5_cal_001.csv')
+            with open(csv, 'a') as f:
+                f.write('2100.0,0.5\n')
+
+            os.remove(os.path.join(source, 'link_difdup.jdx'))
+
+            with open(os.path.join(source, 'broken.spa'), 'wb') as f:
+                f.write(b'not a spectrum')
+
+            counts = ix.refresh(source)
+            self.assertEqual(counts, {
+                'added': 1, 'updated': 1, 'unchanged': 3,
+                'removed': 1, 'failed': 1
+            })
+
+            rows = ix.search(format='csv')
+            self.assertEqual(rows[0]['x_max'], 2100.0)
+            self.assertEqual(ix.search(format='jcamp'), [])
+
+            broken = ix.search(format='spa')
+            self.assertEqual(len(broken), 2)
+            self.assertIsNotNone(
+                [r for r in broken if r['path'].endswith('broken.spa')][0]['error']
+            )
+
+        sys.stdout.write('\n PASSED')
+
+    def test_pattern(self):
+        """
+        Test that a pattern refresh leaves other files indexed.
+        """
+
+        sys.stdout.write('\n\nTesting SpectralIndex.refresh() pattern...\n')
+
+        source = os.path.join(self.workdir.name, 'pattern')
+        shutil.copytree(self.input_dir, source)
+
+        with SpectralIndex(os.path.join(self.workdir.name, 'pattern.db')) as ix:
+
+            ix.refresh(source)
+
+            os.remove(os.path.join(source, 'NBK-026_1.SPA'))
+            counts = ix.refresh(source, pattern='*.SPA')
+            self.assertEqual(counts['removed'], 1)
+            self.assertEqual(len(ix), 4)
+
+            # files not matching are neither read nor removed
+            os.remove(os.path.join(source, 'lims_export.json'))
+            counts = ix.refresh(source, pattern='*.csv')
+            self.assertEqual(counts['removed'], 0)
+            self.assertEqual(counts['unchanged'], 1)
+            self.assertEqual(len(ix), 4)
+
+        sys.stdout.write('\n PASSED')
+
+    def test_read_error(self):
+        """
+        Test that a file failing to read does not abort
+        the refresh.
+        """
+
+        sys.stdout.write('\n\nTesting SpectralIndex.refresh() errors...\n')
+
+        source = os.path.join(self.workdir.name, 'errors')
+        shutil.copytree(self.input_dir, source)
+        gone = os.path.join(source, 'NBK-026_1.SPA')
+
+        def vanish(path):
+            # the file is removed between the walk and the read
+            if path == gone:
+                os.remove(path)
+            return _hash(path)
+
+        with SpectralIndex(os.path.join(self.workdir.name, 'errors.db')) as ix:
+
+            with mock.patch('sparse.index._hash', vanish):
+                counts = ix.refresh(source)
+
+            self.assertEqual(counts['added'], 4)
+            self.assertEqual(counts['failed'], 1)
+            self.assertEqual(len(ix), 4)
+            self.assertEqual(ix.search(format='spa'), [])
+
+        sys.stdout.write('\n PASSED')
+
+    @classmethod
+    def tearDownClass(cls):
+
+        cls.workdir.cleanup()
+
+        sys.stdout.write('\nRunning teardown procedure... SUCCESS')
+
+if __name__=='__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+#!user/bin/python
+# -*- coding: utf-8 -*-
+"""
+Test class for the parser input layer.
+"""
+# import external packages
+import io
+import unittest
+from pathlib import Path
+import sys
+import os
+import numpy as np
+from numpy import testing as nptest
+
+
+# import package
+from sparse import inputs
+from sparse.parsers import DataFileParser
+
+class TestInputs(unittest.TestCase):
+
+    # set up the test case
+    @classmethod
+    def setUpClass(cls):
+        """
+        Setup the test class and initialize test variables
+        and expected test results.
+        """
+
+        sys.stdout.write('\nSetting up test class... ')
+
+        # path to parent directory
+        cls.data_dir = Path(__file__).resolve().parent.parent
+        cls.input_dir = os.path.join(cls.data_dir, 'test_input')
+
+        cls.files = {
+            'csv': 'dow_moe_rev5_cal_001.csv',
+            'txt': 'Absorbance_10-31-23-609_Avocado1.txt',
+            'spa': 'NBK-026_1.SPA',
+            'json': 'lims_export.json',
+            'jcamp': 'link_difdup.jdx'
+        }
+
+        sys.stdout.write('SUCCESS ')
+
+    def _sources(self, path):
+        """
+        Yields every supported input type of a file.
+        """
+
+        with open(path, 'rb') as f:
+            raw = f.read()
+
+        yield 'str', path
+        yield 'Path', Path(path)
+        yield 'bytes', raw
+        yield 'bytearray', bytearray(raw)
+        yield 'memoryview', memoryview(raw)
+        yield 'BytesIO', io.BytesIO(raw)
+        yield 'buffered', io.BufferedReader(io.BytesIO(raw))
+
+        with open(path, 'rb') as f:
+            yield 'binary file', f
+
+    def test_sources(self):
+        """
+        Test that every input type reads the same data.
+        """
+
+        sys.stdout.write('\n\nTesting input types...\n')
+
+        for f_type, name in self.files.items():
+
+            path = os.path.join(self.input_dir, name)
+
+            with open(path, 'rb' if f_type == 'spa' else 'r') as df:
+                exp_x, exp_y = DataFileParser(
+                    f_obj=df, f_type=f_type
+                ).read_data()
+
+            for kind, source in self._sources(path):
+                with self.subTest(f_type=f_type, kind=kind):
+
+                    parser = DataFileParser(f_obj=source, f_type=f_type)
+                    self.assertTrue(parser.is_valid(), parser.errors)
+
+                    # the type is detected from the buffer too
+                    result = DataFileParser(f_obj=source).parse()
+                    self.assertTrue(result.valid, result.errors)
+
+                    test_x, test_y = DataFileParser(
+                        f_obj=source, f_type=f_type
+                    ).read_data()
+                    nptest.assert_array_equal(test_x, exp_x)
+                    nptest.assert_array_equal(test_y, exp_y)
+
+        sys.stdout.write('\n PASSED')
+
+    def test_zero_copy(self):
+        """
+        Test that buffers are read in place.
+        """
+
+        sys.stdout.write('\n\nTesting zero-copy buffers...\n')
+
+        path = os.path.join(self.input_dir, self.files['spa'])
+        with open(path, 'rb') as f:
+            raw = bytearray(f.read())
+
+        # .spa values are views of the caller's buffer
+        x, y = DataFileParser(f_obj=memoryview(raw), f_type='spa').read_data()
+        self.assertTrue(np.shares_memory(y, np.frombuffer(raw, np.uint8)))
+
+        # paths are mapped, not read
+        reader = inputs.open_input(path)
+        self.assertEqual(len(reader), os.path.getsize(path))
+        self.assertEqual(reader.name, path)
+        self.assertEqual(reader.read(4), bytes(raw[:4]))
+        self.assertEqual(reader.tell(), 4)
+
+        # text is decoded from the buffer with universal newlines
+        reader = inputs.open_input(b'a,b\r\n1,2\r3,4\n')
+        self.assertEqual(inputs.read_text(reader), 'a,b\n1,2\n3,4\n')
+        self.assertEqual(
+            list(inputs.text_stream(reader)), ['a,b\n', '1,2\n', '3,4\n']
+        )
+        self.assertEqual(reader.tell(), 0)
+
+        # text streams are used as given
+        text = io.StringIO('wavelength,value\n1,2\n')
+        self.assertIs(inputs.open_input(text), text)
+
+        sys.stdout.write('\n PASSED')
+
+    @classmethod
+    def tearDownClass(cls):
+
+        sys.stdout.write('\nRunning teardown procedure... SUCCESS')
+
+if __name__=='__main__':
+    unittest.main()
@@ -0,0 +1,237 @@
+#!user/bin/python
+# -*- coding: utf-8 -*-
+"""
+Test class for JCAMP-DX files.
+"""
+# import external packages
+import io
+import unittest
+from pathlib import Path
+import sys
+import os
+import numpy as np
+from numpy import testing as nptest
+
+
+# import package
+from sparse import jcamp
+from sparse.parsers import DataFileParser
+
+class TestJcamp(unittest.TestCase):
+
+    # set up the test case
+    @classmethod
+    def setUpClass(cls):
+        """
+        Setup the test class and initialize test variables
+        and expected test results.
+        """
+
+        sys.stdout.write('\nSetting up test class... ')
+
+        # path to parent directory
+        cls.data_dir = Path(__file__).resolve().parent.parent
+
+        # get the data file
+        cls.data_file = os.path.join(
+            cls.data_dir, 'test_input' + os.sep + 'link_difdup.jdx'
+        )
+
+        # expected values of the first (DIFDUP) block
+        cls.exp_x = np.arange(1000.0, 1007.0)
+        cls.exp_y = np.array([100, 102, 105, 105, 105, 103, 90]) * 0.001
+
+        sys.stdout.write('SUCCESS ')
+
+    def test_read_jcamp(self):
+        """
+        Test reading of .jdx file.
+        """
+
+        sys.stdout.write('\n\nTesting _read_jcamp()...\n')
+
+        with open(self.data_file) as df:
+            test_jcamp = DataFileParser(f_obj=df, f_type='jcamp')
+            x_data, y_data = test_jcamp.read_data()
+
+        nptest.assert_array_equal(x_data, self.exp_x)
+        nptest.assert_allclose(y_data, self.exp_y)
+
+        # dtype is honoured on binary file objects
+        with open(self.data_file, 'rb') as df:
+            test_jcamp = DataFileParser(f_obj=df, dtype=np.float32)
+            x_data, y_data = test_jcamp.read_data()
+
+        self.assertEqual(y_data.dtype, np.float32)
+        nptest.assert_allclose(y_data, self.exp_y, rtol=1e-6)
+
+        sys.stdout.write('\n PASSED')
+
+    def test_is_jcamp_valid(self):
+        """
+        Test validation of .jdx files.
+        """
+
+        sys.stdout.write('\n\nTesting _is_jcamp_valid()...\n')
+
+        with open(self.data_file) as df:
+            text = df.read()
+
+        test_jcamp = DataFileParser(f_obj=io.StringIO(text), f_type='jcamp')
+        self.assertEqual(test_jcamp.is_valid(), True)
+        self.assertEqual(test_jcamp.errors, test_jcamp.default_message)
+
+        # point count does not match ##NPOINTS
+        bad = text.replace('##NPOINTS= 7', '##NPOINTS= 8')
+        test_jcamp = DataFileParser(f_obj=io.StringIO(bad), f_type='jcamp')
+        self.assertEqual(test_jcamp.is_valid(), False)
+        self.assertEqual(test_jcamp.errors, 'Expected 8 points, found 7.')
+
+        # no data table at all
+        test_jcamp = DataFileParser(
+            f_obj=io.StringIO('##TITLE= empty\n##JCAMP-DX= 5.0\n##END=\n'),
+            f_type='jcamp'
+        )
+        self.assertEqual(test_jcamp.is_valid(), False)
+
+        sys.stdout.write('\n PASSED')
+
+    def test_parse(self):
+        """
+        Test single pass parse() of .jdx file.
+        """
+
+        sys.stdout.write('\n\nTesting parse()...\n')
+
+        with open(self.data_file) as df:
+            result = DataFileParser(f_obj=df, f_type='jcamp').parse()
+
+        self.assertEqual(result.valid, True)
+        nptest.assert_array_equal(result.x_data, self.exp_x)
+        nptest.assert_allclose(result.y_data, self.exp_y)
+
+        sys.stdout.write('\n PASSED')
+
+    def test_link_blocks(self):
+        """
+        Test every block of a compound (LINK) file is read.
+        """
+
+        sys.stdout.write('\n\nTesting read_blocks()...\n')
+
+        with open(self.data_file) as df:
+            blocks = jcamp.read_blocks(df.read())
+
+        self.assertEqual(
+            [b['TITLE'] for b in blocks],
+            ['DIFDUP spectrum', 'Peak list',
+             'Link file with compressed and point tables']
+        )
+        self.assertEqual(blocks[2]['BLOCKS'], '2')
+        nptest.assert_array_equal(blocks[1]['x'], [1002.0, 1004.0, 1006.0])
+        nptest.assert_allclose(blocks[1]['y'], [0.105, 0.105, 0.09])
+
+        sys.stdout.write('\n PASSED')
+
+    def test_read_metadata(self):
+        """
+        Test header-only metadata of JCAMP-DX files.
+        """
+
+        sys.stdout.write('\n\nTesting read_metadata()...\n')
+
+        with open(self.data_file) as df:
+            test_jdx = DataFileParser(f_obj=df, f_type='jcamp')
+            metadata = test_jdx.read_metadata()
+
+        self.assertEqual(metadata['title'], 'DIFDUP spectrum')
+        self.assertEqual(metadata['points'], len(self.exp_x))
+        self.assertEqual(
+            metadata['x_range'], (self.exp_x[0], self.exp_x[-1])
+        )
+        self.assertEqual(metadata['x_units'], '1/CM')
+        self.assertEqual(metadata['labels']['YFACTOR'], '0.001')
+
+        # JSON documents report their members only
+        test_json = DataFileParser(f_obj=io.StringIO('{}'), f_type='json')
+        self.assertEqual(
+            test_json.read_metadata(), {'spectra': 0, 'members': []}
+        )
+
+        sys.stdout.write('\n PASSED')
+
+    def test_decode_xydata(self):
+        """
+        Test decoding of the AFFN, PAC, SQZ, DIF and DUP forms.
+        """
+
+        sys.stdout.write('\n\nTesting decode_xydata()...\n')
+
+        tables = {
+            '1 10 20 -30\n4 40': [10, 20, -30, 40],
+            '1+10+20-30\n4+40': [10, 20, -30, 40],
+            '1 1.5E-3 2e2': [1.5e-3, 200],
+            '1 1.E3-2.5e+1': [1000, -25],
+            '100E23E45': [523, 545],
+            '100E23e45': [523, -545],
+            '1A0B0c0\n4D0': [10, 20, -30, 40],
+            '1A0J0j0\n3A0K0': [10, 20, 10, 30],
+            '1A0T%V': [10, 10, 10, 10, 10, 10],
+        }
+
+        for table, exp in tables.items():
+            line_x, y = jcamp.decode_xydata(table)
+            nptest.assert_allclose(y, exp, err_msg=table)
+
+        # round trip of a long DIFDUP encoded spectrum
+        rng = np.random.default_rng(0)
+        exp = np.cumsum(rng.integers(-500, 500, 20000))
+        exp[100:200] = exp[100]
+
+        line_x, y = jcamp.decode_xydata(_encode_difdup(exp))
+        nptest.assert_array_equal(y, exp)
+
+        sys.stdout.write('\n PASSED')
+
+    @classmethod
+    def tearDownClass(cls):
+
+        sys.stdout.write('\nRunning teardown procedure... SUCCESS')
+
+
+def _encode_difdup(y, per_line=10):
+    """
+    Reference DIFDUP encoder, each line repeats the last
+    value of the previous line as its y-check.
+    """
+
+    def pseudo(v, table):
+        s = str(abs(int(v)))
+        return table[int(s[0]) + (10 if v < 0 else 0)] + s[1:]
+
+    sqz = '@ABCDEFGHI@abcdefghi'
+    dif = '%JKLMNOPQR%jklmnopqr'
+    dup = 'STUVWXYZs'
+
+    lines = []
+    for i in range(0, len(y) - 1, per_line - 1):
+        seg = y[i:i + per_line]
+        toks = [pseudo(seg[0], sqz)]
+
+        # runs of equal differences are written once plus a DUP count
+        diffs = list(np.diff(seg))
+        while diffs:
+            run = 1
+            while run < len(diffs) and diffs[run] == diffs[0]:
+                run += 1
+            toks.append(pseudo(diffs[0], dif))
+            if run > 1:
+                toks.append(pseudo(run, ' ' + dup))
+            diffs = diffs[run:]
+
+        lines.append(str(i) + ''.join(toks))
+
+    return '\n'.join(lines)
+
+if __name__=='__main__':
+    unittest.main()
@@ -0,0 +1,239 @@
+#!user/bin/python
+# -*- coding: utf-8 -*-
+"""
+Test class for JSON files.
+"""
+# import external packages
+import io
+import json
+import unittest
+from pathlib import Path
+import sys
+import os
+import numpy as np
+from numpy import testing as nptest
+
+
+# import package
+from sparse import jsonstream
+from sparse.parsers import DataFileParser
+
+class TestJson(unittest.TestCase):
+
+    # set up the test case
+    @classmethod
+    def setUpClass(cls):
+        """
+        Setup the test class and initialize test variables
+        and expected test results.
+        """
+
+        sys.stdout.write('\nSetting up test class... ')
+
+        # path to parent directory
+        cls.data_dir = Path(__file__).resolve().parent.parent
+
+        # get the data file
+        cls.data_file = os.path.join(
+            cls.data_dir, 'test_input' + os.sep + 'lims_export.json'
+        )
+
+        # expected values of the first spectrum
+        cls.exp_x = np.array([400.0, 400.5, 401.0, 401.5, 402.0])
+        cls.exp_y = np.array([0.125, 0.131, 0.140, 0.152, 0.149])
+
+        sys.stdout.write('SUCCESS ')
+
+    def test_read_json(self):
+        """
+        Test reading of .json file.
+        """
+
+        sys.stdout.write('\n\nTesting _read_json()...\n')
+
+        with open(self.data_file) as df:
+            test_json = DataFileParser(f_obj=df, f_type='json')
+            x_data, y_data = test_json.read_data()
+
+        nptest.assert_array_equal(x_data, self.exp_x)
+        nptest.assert_array_equal(y_data, self.exp_y)
+
+        sys.stdout.write('\n PASSED')
+
+    def test_is_json_valid(self):
+        """
+        Test validation of .json files.
+        """
+
+        sys.stdout.write('\n\nTesting _is_json_valid()...\n')
+
+        with open(self.data_file, 'rb') as df:
+            test_json = DataFileParser(f_obj=df)
+            self.assertEqual(test_json.is_valid(), True)
+            self.assertEqual(test_json.errors, test_json.default_message)
+
+        invalid = {
+            '{"x": [1, 2], "y": [1]}':
+                'Data arrays must have equal length. Error in spectrum 1.',
+            '{"x": [1], "y": [1]}, {"x": [2]}':
+                'Extra data after JSON document at character 20.',
+            '{"x": [1, "a"], "y": [1, 2]}':
+                'Non-numeric value in data array before character 14.',
+            '{"spectra": []}': 'No spectrum found.',
+        }
+
+        for doc, errors in invalid.items():
+            test_json = DataFileParser(f_obj=io.StringIO(doc), f_type='json')
+            self.assertEqual(test_json.is_valid(), False)
+            self.assertEqual(test_json.errors, errors)
+
+        sys.stdout.write('\n PASSED')
+
+    def test_iter_data(self):
+        """
+        Test streaming of every spectrum of a .json file.
+        """
+
+        sys.stdout.write('\n\nTesting iter_data()...\n')
+
+        with open(self.data_file) as df:
+            spectra = list(DataFileParser(f_obj=df, f_type='json').iter_data())
+
+        self.assertEqual([len(x) for x, y in spectra], [5, 3, 2])
+        nptest.assert_array_equal(spectra[1][1], [0.225, 0.231, 0.240])
+        nptest.assert_array_equal(spectra[2][1], [1.5e-3, -2e-3])
+
+        # results do not depend on the read size
+        with open(self.data_file) as df:
+            text = df.read()
+
+        for chunk_size in (1, 7, 64):
+            spectra = jsonstream.iter_spectra(io.StringIO(text), chunk_size)
+            first = next(spectra)
+            self.assertEqual(first['id'], 'S-001')
+            nptest.assert_array_equal(first['y'], self.exp_y)
+            self.assertEqual(len(list(spectra)), 2)
+
+        sys.stdout.write('\n PASSED')
+
+    def test_parse(self):
+        """
+        Test single pass parse() of .json file.
+        """
+
+        sys.stdout.write('\n\nTesting parse()...\n')
+
+        with open(self.data_file) as df:
+            result = DataFileParser(
+                f_obj=df, f_type='json', dtype=np.float32
+            ).parse()
+
+        self.assertEqual(result.valid, True)
+        self.assertEqual(result.y_data.dtype, np.float32)
+        nptest.assert_allclose(result.y_data, self.exp_y, rtol=1e-6)
+
+        # a later invalid spectrum invalidates the document
+        doc = '[{"x": [1], "y": [2]}, {"x": [1], "y": []}]'
+        result = DataFileParser(f_obj=io.StringIO(doc), f_type='json').parse()
+        self.assertEqual(result.valid, False)
+        nptest.assert_array_equal(result.y_data, [2.0])
+
+        sys.stdout.write('\n PASSED')
+
+    def test_read_spectra(self):
+        """
+        Test reading every spectrum of a .json file.
+        """
+
+        sys.stdout.write('\n\nTesting read_spectra()...\n')
+
+        with open(self.data_file) as df:
+            parser = DataFileParser(f_obj=df, f_type='json')
+            spectra = parser.read_spectra()
+
+        self.assertEqual(parser.metadata['spectra'], 3)
+        self.assertEqual([len(x) for x, y in spectra], [5, 3, 2])
+        nptest.assert_array_equal(spectra[0][1], self.exp_y)
+        nptest.assert_array_equal(spectra[2][1], [1.5e-3, -2e-3])
+
+        # invalid documents hold no spectra
+        doc = '[{"x": [1], "y": [2]}, {"x": [1], "y": []}]'
+        parser = DataFileParser(f_obj=io.StringIO(doc), f_type='json')
+        self.assertEqual(parser.read_spectra(), [])
+
+        sys.stdout.write('\n PASSED')
+
+    def test_read_metadata(self):
+        """
+        Test header-only metadata of .json files.
+        """
+
+        sys.stdout.write('\n\nTesting read_metadata()...\n')
+
+        with open(self.data_file, 'rb') as df:
+            metadata = DataFileParser(f_obj=df).read_metadata()
+
+        self.assertEqual(metadata['export'], 'LIMS')
+        self.assertEqual(metadata['version'], 2)
+        self.assertEqual(metadata['spectra'], 3)
+        self.assertEqual(
+            [m['id'] for m in metadata['members']], ['S-001', 'S-002', 'S-003']
+        )
+
+        # data arrays are skipped, not converted
+        doc = json.dumps(
+            {'title': 'T', 'x': [1, 'a'], 'y': [1, 2]}, indent=2
+        )
+        for chunk_size in (1, 64):
+            metadata = jsonstream.read_metadata(io.StringIO(doc), chunk_size)
+            self.assertEqual(metadata['title'], 'T')
+            self.assertEqual(metadata['spectra'], 1)
+            self.assertEqual(metadata['members'], [{'title': 'T'}])
+
+        sys.stdout.write('\n PASSED')
+
+    def test_wrappers(self):
+        """
+        Test data keys holding lists of spectra or other
+        values rather than numbers.
+        """
+
+        sys.stdout.write('\n\nTesting wrapper keys...\n')
+
+        spectrum = '{"x": [1, 2], "y": [3, 4]}'
+        docs = [
+            '{"data": [' + spectrum + ']}',
+            '{"points": [' + spectrum + ']}',
+            '{"values": [' + spectrum + ']}',
+            '{"xy": [[1, 3], [2, 4]]}',
+            '{"xy": [[1, 3], [2, 4] ]}',
+            json.dumps({'id': 'S-001', 'xy': [[1, 3], [2, 4]]}, indent=2),
+            json.dumps({'spectra': [{'xy': [[1, 3], [2, 4]]}]}, indent=4),
+            '{"x": [1, 2], "y": [3, 4], "meta": {"values": ["a", "b"]}}',
+            '{"x": [1, 2], "y": [3, 4], "data": []}',
+            '{"x": [1, 2], "y": [3, 4], "intensity": [9, 9]}',
+            '{"data": [1, 2], "x": [1, 2], "y": [3, 4]}'
+        ]
+
+        for doc in docs:
+            for chunk_size in (1, 64):
+                with self.subTest(doc=doc, chunk_size=chunk_size):
+                    spectra = list(
+                        jsonstream.iter_spectra(io.StringIO(doc), chunk_size)
+                    )
+                    self.assertEqual(len(spectra), 1)
+                    nptest.assert_array_equal(spectra[0]['x'], [1.0, 2.0])
+                    nptest.assert_array_equal(spectra[0]['y'], [3.0, 4.0])
+
+            parser = DataFileParser(f_obj=io.StringIO(doc), f_type='json')
+            self.assertTrue(parser.is_valid(), parser.errors)
+
+        sys.stdout.write('\n PASSED')
+
+    @classmethod
+    def tearDownClass(cls):
+
+        sys.stdout.write('\nRunning teardown procedure... SUCCESS')
+
+if __name__=='__main__':
+    unittest.main()
@@ -0,0 +1,183 @@
+#!user/bin/python
+# -*- coding: utf-8 -*-
+"""
+Test class for spectral library files.
+"""
+# import external packages
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+import os
+import numpy as np
+from numpy import testing as nptest
+
+
+# import package
+from sparse.library import LibraryWriter, SpectralLibrary, build_library
+from sparse.parsers import DataFileParser
+
+class TestLibrary(unittest.TestCase):
+
+    # set up the test case
+    @classmethod
+    def setUpClass(cls):
+        """
+        Setup the test class and initialize test variables
+        and expected test results.
+        """
+
+        sys.stdout.write('\nSetting up test class... ')
+
+        # path to parent directory
+        cls.data_dir = Path(__file__).resolve().parent.parent
+        cls.input_dir = os.path.join(cls.data_dir, 'test_input')
+
+        cls.workdir = tempfile.TemporaryDirectory()
+
+        sys.stdout.write('SUCCESS ')
+
+    def test_build_library(self):
+        """
+        Test building a library from a directory of files.
+        """
+
+        sys.stdout.write('\n\nTesting build_library()...\n')
+
+        source = os.path.join(self.workdir.name, 'source')
+        shutil.copytree(self.input_dir, source)
+        with open(os.path.join(source, 'empty.csv'), 'w') as f:
+            f.write('wavelength,value\n')
+
+        path = os.path.join(self.workdir.name, 'build.spl')
+        skipped = build_library(source, path, executor='thread')
+
+        self.assertEqual(list(skipped), ['empty.csv'])
+
+        with open(os.path.join(source, 'NBK-026_1.SPA'), 'rb') as df:
+            exp_wv, exp_vals = DataFileParser(
+                f_obj=df, f_type='spa'
+            ).read_data()
+
+        with SpectralLibrary(path) as lib:
+
+            self.assertEqual(len(lib), 7)
+            self.assertIn('dow_moe_rev5_cal_001.csv', lib.ids)
+
+            # every spectrum of a JSON document is stored
+            self.assertEqual(
+                [len(lib['lims_export.json#' + str(i)]) for i in (1, 2, 3)],
+                [5, 3, 2]
+            )
+            nptest.assert_allclose(
+                lib['lims_export.json#3'].y, [1.5e-3, -2e-3], rtol=1e-6
+            )
+
+            # the .spa axis is stored implicitly, the values as a view
+            spectrum = lib['NBK-026_1.SPA']
+            self.assertTrue(spectrum.is_linear())
+            self.assertFalse(spectrum.y.flags['OWNDATA'])
+            test_wv, test_vals = spectrum
+            nptest.assert_allclose(test_wv, exp_wv, rtol=1e-6)
+            nptest.assert_array_equal(test_vals, exp_vals)
+
+            # OceanView metadata is kept
+            meta = lib.metadata('Absorbance_10-31-23-609_Avocado1.txt')
+            self.assertEqual(
+                meta['source'], 'Absorbance_10-31-23-609_Avocado1.txt'
+            )
+            self.assertIn('pixels', meta)
+
+        # rebuilding into the library
+        skipped = build_library(source, path, executor='thread')
+        self.assertIn('Duplicate id', skipped['NBK-026_1.SPA'])
+
+        skipped = build_library(
+            source, path, executor='thread', existing='skip'
+        )
+        self.assertEqual(list(skipped), ['empty.csv'])
+
+        skipped = build_library(
+            source, path, executor='thread', existing='replace'
+        )
+        self.assertEqual(list(skipped), ['empty.csv'])
+
+        with SpectralLibrary(path) as lib:
+            self.assertEqual(len(lib), 7)
+            nptest.assert_array_equal(lib['NBK-026_1.SPA'].y, exp_vals)
+
+        with self.assertRaises(ValueError):
+            build_library(source, path, existing='append')
+
+        sys.stdout.write('\n PASSED')
+
+    def test_append(self):
+        """
+        Test appending to a library and reading slices.
+        """
+
+        sys.stdout.write('\n\nTesting LibraryWriter.append()...\n')
+
+        path = os.path.join(self.workdir.name, 'append.spl')
+        x = np.linspace(400.0, 800.0, 50)
+        uneven = np.sort(np.random.default_rng(0).uniform(400, 800, 50))
+
+        with LibraryWriter(path, dtype=np.float64) as writer:
+            for i in range(3):
+                writer.append((x, x * i), metadata={'i': i})
+
+        # appending keeps the existing records
+        with LibraryWriter(path) as writer:
+            self.assertEqual(writer.append((uneven, x), id='uneven'), 3)
+            with self.assertRaises(ValueError):
+                writer.append((x, x), id='uneven')
+
+        with SpectralLibrary(path) as lib:
+
+            self.assertEqual(lib.ids, ['0', '1', '2', 'uneven'])
+            self.assertEqual(lib.metadata(2), {'i': 2})
+            self.assertEqual(lib.metadata('uneven'), {})
+
+            # consecutive records are one strided view
+            matrix = lib[:3]
+            self.assertEqual(matrix.shape, (3, 50))
+            self.assertFalse(matrix.flags['OWNDATA'])
+            nptest.assert_array_equal(matrix[2], x * 2)
+
+            spectrum = lib['uneven']
+            self.assertFalse(spectrum.is_linear())
+            nptest.assert_array_equal(spectrum.nanometers(), uneven)
+            nptest.assert_array_equal(lib[-1].y, x)
+
+        # replaced records keep their row
+        with LibraryWriter(path) as writer:
+            self.assertEqual(
+                writer.append((x, x * 5), id='1', replace=True), 1
+            )
+
+        with SpectralLibrary(path) as lib:
+            self.assertEqual(len(lib), 4)
+            self.assertEqual(lib.metadata(1), {})
+            nptest.assert_array_equal(lib[1].y, x * 5)
+
+        # incomplete files are rejected
+        with open(path, 'rb') as f:
+            raw = f.read()
+        broken = os.path.join(self.workdir.name, 'broken.spl')
+        with open(broken, 'wb') as f:
+            f.write(raw[:-8])
+        with self.assertRaises(ValueError):
+            SpectralLibrary(broken)
+
+        sys.stdout.write('\n PASSED')
+
+    @classmethod
+    def tearDownClass(cls):
+
+        cls.workdir.cleanup()
+
+        sys.stdout.write('\nRunning teardown procedure... SUCCESS')
+
+if __name__=='__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+#!user/bin/python
+# -*- coding: utf-8 -*-
+"""
+Test class for the format registry.
+"""
+# import external packages
+import io
+import unittest
+from pathlib import Path
+import sys
+import os
+import numpy as np
+
+
+# import package
+from sparse import registry
+from sparse.parsers import DataFileParser
+from sparse.results import ParseResult
+
+class TestRegistry(unittest.TestCase):
+
+    # set up the test case
+    @classmethod
+    def setUpClass(cls):
+        """
+        Setup the test class and initialize test variables
+        and expected test results.
+        """
+
+        sys.stdout.write('\nSetting up test class... ')
+
+        # path to parent directory
+        cls.data_dir = Path(__file__).resolve().parent.parent
+
+        # data files and their expected types
+        cls.data_files = {
+            'dow_moe_rev5_cal_001.csv': 'csv',
+            'NBK-026_1.SPA': 'spa',
+            'Absorbance_10-31-23-609_Avocado1.txt': 'txt',
+            'link_difdup.jdx': 'jcamp',
+            'lims_export.json': 'json'
+        }
+
+        sys.stdout.write('SUCCESS ')
+
+    def test_detect_type(self):
+        """
+        Test the file type is detected when f_type is omitted.
+        """
+
+        sys.stdout.write('\n\nTesting get_file_type()...\n')
+
+        for name, ft in self.data_files.items():
+
+            data_file = os.path.join(self.data_dir, 'test_input', name)
+
+            # binary and text file objects
+            for mode in ('rb', 'r'):
+                with open(data_file, mode) as df:
+                    test_parser = DataFileParser(f_obj=df)
+                    self.assertEqual(test_parser.get_file_type(), ft)
+
+                    # detection does not consume the file
+                    if mode == 'r' and ft == 'csv':
+                        self.assertEqual(test_parser.is_valid(), True)
+
+        # in-memory uploads
+        self.assertEqual(
+            DataFileParser(f_obj=io.StringIO('{"x": []}')).get_file_type(),
+            'json'
+        )
+        self.assertEqual(
+            DataFileParser(f_obj=b'##TITLE=test\n').get_file_type(),
+            'jcamp'
+        )
+        with self.assertRaises(ValueError):
+            DataFileParser(f_obj=io.StringIO('no data')).get_file_type()
+
+        # explicit type strings resolve as before
+        for ft in ('.CSV', 'text/csv', 'Avocado1.txt', '.spa'):
+            self.assertIn(registry.lookup(ft).name, ft.lower())
+
+        sys.stdout.write('\n PASSED')
+
+    def test_register(self):
+        """
+        Test registering a custom format.
+        """
+
+        sys.stdout.write('\n\nTesting registry.register()...\n')
+
+        def read_xy(parser):
+            data = np.loadtxt(parser.file_obj, delimiter=';', ndmin=2)
+            return (data[:, 0], data[:, 1])
+
+        def is_xy_valid(parser):
+            parser.errors = parser.default_message
+            return True
+
+        def parse_xy(parser):
+            x_data, y_data = read_xy(parser)
+            return ParseResult(x_data, y_data, True, parser.default_message)
+
+        registry.register(
+            'xy',
+            reader=read_xy,
+            validator=is_xy_valid,
+            parser=parse_xy,
+            sniffer=lambda head: head.startswith(b'#xy'),
+            extensions=('.xy',)
+        )
+
+        try:
+            test_parser = DataFileParser(
+                f_obj=io.StringIO('1;2\n3;4\n'), f_type='.XY'
+            )
+            test_wv, test_vals = test_parser.read_data()
+            self.assertEqual(list(test_vals), [2.0, 4.0])
+
+            test_parser = DataFileParser(f_obj=io.StringIO('#xy\n1;2\n'))
+            self.assertEqual(test_parser.get_file_type(), 'xy')
+            self.assertEqual(test_parser.parse().valid, True)
+        finally:
+            registry.unregister('xy')
+
+        with self.assertRaises(ValueError):
+            registry.lookup('xy')
+
+        sys.stdout.write('\n PASSED')
+
+    @classmethod
+    def tearDownClass(cls):
+
+        sys.stdout.write('\nRunning teardown procedure... SUCCESS')
+
+if __name__=='__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+#!user/bin/python
+# -*- coding: utf-8 -*-
+"""
+Test class for batched resampling.
+"""
+# import external packages
+import unittest
+from pathlib import Path
+import sys
+import os
+import numpy as np
+from numpy import testing as nptest
+
+
+# import package
+from sparse.parsers import DataFileParser
+from sparse.resample import resample
+from sparse.results import ParseResult
+
+class TestResample(unittest.TestCase):
+
+    # set up the test case
+    @classmethod
+    def setUpClass(cls):
+        """
+        Setup the test class and initialize test variables
+        and expected test results.
+        """
+
+        sys.stdout.write('\nSetting up test class... ')
+
+        # path to parent directory
+        cls.data_dir = Path(__file__).resolve().parent.parent
+
+        # get the data files
+        cls.csv_file = os.path.join(
+            cls.data_dir, 'test_input' + os.sep + 'dow_moe_rev5_cal_001.csv'
+        )
+        cls.spa_file = os.path.join(
+            cls.data_dir, 'test_input' + os.sep + 'NBK-026_1.SPA'
+        )
+
+        sys.stdout.write('SUCCESS ')
+
+    def test_linear(self):
+        """
+        Test linear resampling against np.interp.
+        """
+
+        sys.stdout.write('\n\nTesting resample() linear...\n')
+
+        rng = np.random.default_rng(0)
+        grid = np.linspace(380.0, 2600.0, 500)
+
+        spectra = []
+        for i in range(20):
+            x = np.sort(rng.uniform(400.0, 2500.0, rng.integers(2, 200)))
+            x = x[::-1] if i % 2 else x
+            spectra.append((x, np.sin(x / 100.0)))
+
+        test = resample(spectra, grid)
+
+        self.assertEqual(test.shape, (20, 500))
+        for row, (x, y) in zip(test, spectra):
+            x = np.sort(x)
+            exp = np.interp(grid, x, np.sin(x / 100.0))
+            exp[(grid < x[0]) | (grid > x[-1])] = np.nan
+            nptest.assert_allclose(row, exp, rtol=1e-9, atol=1e-9)
+
+        sys.stdout.write('\n PASSED')
+
+    def test_cubic(self):
+        """
+        Test cubic resampling of a smooth curve.
+        """
+
+        sys.stdout.write('\n\nTesting resample() cubic...\n')
+
+        x = np.linspace(400.0, 2500.0, 400)
+        grid = np.linspace(400.0, 2500.0, 1000)
+
+        linear, cubic = (
+            resample([(x[::-1], np.sin(x[::-1] / 100.0))], grid, method)[0]
+            for method in ('linear', 'cubic')
+        )
+
+        exp = np.sin(grid / 100.0)
+        self.assertLess(
+            np.abs(cubic - exp).max(), np.abs(linear - exp).max() / 2
+        )
+
+        # nodes are reproduced exactly
+        nptest.assert_allclose(
+            resample([(x, np.sin(x / 100.0))], x, 'cubic')[0],
+            np.sin(x / 100.0), rtol=1e-12
+        )
+
+        with self.assertRaises(ValueError):
+            resample([(x, x)], grid, 'nearest')
+
+        sys.stdout.write('\n PASSED')
+
+    def test_parsed(self):
+        """
+        Test resampling parsed files onto one grid.
+        """
+
+        sys.stdout.write('\n\nTesting resample() of parsed files...\n')
+
+        with open(self.csv_file) as df:
+            csv_x, csv_y = DataFileParser(f_obj=df, f_type='csv').read_data()
+
+        with open(self.spa_file, 'rb') as df:
+            spectrum = DataFileParser(f_obj=df, f_type='spa').read_spectrum()
+
+        grid = np.linspace(csv_x.min(), csv_x.max(), 50)
+
+        test = resample(
+            [(csv_x, csv_y), spectrum, ParseResult(valid=False)], grid
+        )
+
+        self.assertEqual(test.shape, (3, 50))
+        nptest.assert_allclose(test[0], np.interp(grid, csv_x, csv_y))
+
+        # the .spa axis, decreasing in wavenumbers
+        spa_x, spa_y = spectrum
+        order = np.argsort(spa_x)
+        inside = (grid >= spa_x.min()) & (grid <= spa_x.max())
+        nptest.assert_allclose(
+            test[1][inside],
+            np.interp(grid[inside], spa_x[order], spa_y[order]),
+            rtol=1e-6
+        )
+
+        # results without data are filled
+        self.assertTrue(np.isnan(test[2]).all())
+
+        sys.stdout.write('\n PASSED')
+
+    @classmethod
+    def tearDownClass(cls):
+
+        sys.stdout.write('\nRunning teardown procedure... SUCCESS')
+
+if __name__=='__main__':
+    unittest.main()
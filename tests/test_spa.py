@@ -14,10 +14,16 @@ import sys
 import os
 import pathlib
 import json
+import io
+import struct
+import tempfile
 
 
 # import package
+from benchmarks import generators
+from sparse import spa
 from sparse.parsers import DataFileParser
+from sparse.results import Spectrum
 from sparse.utils import show_plot
 
 class TestReadSpa(unittest.TestCase):
@@ -101,6 +107,16 @@ class TestReadSpa(unittest.TestCase):
         self.assertGreater(len(test_vals), 0)
         self.assertEqual(len(test_wv), len(test_vals))
 
+        # the axis is built from the header as the original reader did
+        with open(self.data_file, 'rb') as df:
+            df.seek(564)
+            points = np.fromfile(df, np.int32, 1)[0]
+            df.seek(576)
+            max_wv, min_wv = np.fromfile(df, np.single, 2)
+        nptest.assert_array_equal(
+            test_wv, 1.0E7 / np.flip(np.linspace(min_wv, max_wv, points))
+        )
+
         # plot results for visual check
         #show_plot(test_wv, test_vals)
 
@@ -108,6 +124,205 @@ class TestReadSpa(unittest.TestCase):
 
 
 
+    def test_read_spa_buffer(self):
+        """
+        Test _read_spa() on in-memory uploads.
+        """
+
+        sys.stdout.write('\n\nTesting _read_spa() from buffers...\n')
+
+        with open(self.data_file, 'rb') as df:
+            exp_wv, exp_vals = DataFileParser(f_obj=df, f_type='spa')._read_spa()
+            df.seek(0)
+            raw = df.read()
+
+        for f_obj in (io.BytesIO(raw), raw, memoryview(raw)):
+
+            test_spa = DataFileParser(f_obj=f_obj, f_type='spa')
+            test_wv, test_vals = test_spa._read_spa()
+
+            nptest.assert_array_equal(test_wv, exp_wv)
+            nptest.assert_array_equal(test_vals, exp_vals)
+
+            # spectrum is a view into the buffer, not a copy
+            self.assertFalse(test_vals.flags['OWNDATA'])
+
+        # truncated uploads are rejected
+        test_spa = DataFileParser(f_obj=io.BytesIO(raw[:2000]), f_type='spa')
+        self.assertEqual(test_spa.is_valid(), False)
+
+        sys.stdout.write('\n PASSED')
+
+
+    def test_spa_directory(self):
+        """
+        Test the bounded block directory index.
+        """
+
+        sys.stdout.write('\n\nTesting spa.read_directory()...\n')
+
+        buf = spa.map_buffer(self.data_file)
+        directory = spa.read_directory(buf)
+
+        # data block matches the header point count
+        header = spa.read_header(buf)
+        self.assertEqual(
+            directory[spa.DATA_BLOCK], [(1288, 4 * header['points'])]
+        )
+        self.assertEqual(len(directory[130]), 2)
+
+        # interferograms and history by lookup
+        ifg = spa.block_array(buf, directory, spa.SAMPLE_IFG_BLOCK)
+        bkg = spa.block_array(buf, directory, spa.BACKGROUND_IFG_BLOCK)
+        self.assertEqual(len(ifg), 8192)
+        self.assertEqual(len(bkg), 8192)
+        self.assertTrue(
+            spa.read_history(buf, directory).startswith('Collect Sample')
+        )
+
+        # truncated files return instead of scanning forever
+        raw = bytes(buf)
+        for n in (296, 400, 1300):
+            test_spa = DataFileParser(f_obj=raw[:n], f_type='spa')
+            self.assertEqual(test_spa.is_valid(), False)
+
+        sys.stdout.write('\n PASSED')
+
+
+    def test_read_series(self):
+        """
+        Test reading OMNIC series into a single matrix.
+        """
+
+        sys.stdout.write('\n\nTesting _read_spg()...\n')
+
+        with open(self.data_file, 'rb') as df:
+            raw = df.read()
+
+        header = spa.read_header(raw)
+        exp_wv, exp_vals = DataFileParser(f_obj=raw, f_type='spa').read_data()
+        exp = np.stack([exp_vals * (i + 1) for i in range(5)])
+
+        # evenly spaced blocks are a single view of the buffer
+        series = _series(raw, exp, [0, 0, 0, 0])
+        test_wv, test_vals = DataFileParser(
+            f_obj=series, f_type='spg'
+        ).read_data()
+
+        nptest.assert_array_equal(test_wv, exp_wv)
+        nptest.assert_array_equal(test_vals, exp)
+        self.assertFalse(test_vals.flags['OWNDATA'])
+
+        # irregular blocks are gathered into a copy
+        series = _series(raw, exp, [0, 12, 4, 0])
+        test_vals = spa.read_series(series, header['points'])
+        nptest.assert_array_equal(test_vals, exp)
+
+        # files are mapped, rows stream one at a time
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'kinetics.spg')
+            with open(path, 'wb') as f:
+                f.write(series)
+
+            with open(path, 'rb') as df:
+                test_spa = DataFileParser(f_obj=df, f_type='.SPG')
+                self.assertEqual(test_spa.is_valid(), True)
+                df.seek(0)
+                rows = [y for x, y in test_spa.iter_data()]
+
+            nptest.assert_array_equal(np.stack(rows), exp)
+
+        # truncated series are rejected
+        test_spa = DataFileParser(f_obj=series[:-4], f_type='spg')
+        self.assertEqual(test_spa.is_valid(), False)
+
+        # long directories are read in full and overlap the fixed
+        # header offsets, the header block is found through them
+        series = generators.make_spg(50, spectra=600)
+        self.assertEqual(spa.read_header(series)['points'], 50)
+
+        result = DataFileParser(f_obj=series, f_type='spg').parse()
+        self.assertEqual(result.valid, True)
+        self.assertEqual(result.y_data.shape, (600, 50))
+
+        metadata = DataFileParser(f_obj=series, f_type='spg').read_metadata()
+        self.assertEqual(metadata['spectra'], 600)
+        self.assertEqual(metadata['points'], 50)
+        self.assertAlmostEqual(metadata['x_range'][0], 400.0, places=3)
+
+        sys.stdout.write('\n PASSED')
+
+
+    def test_read_spectrum(self):
+        """
+        Test the compact Spectrum result with an implicit axis.
+        """
+
+        sys.stdout.write('\n\nTesting read_spectrum()...\n')
+
+        with open(self.data_file, 'rb') as df:
+            raw = df.read()
+
+        exp_wv, exp_vals = DataFileParser(f_obj=raw, f_type='spa').read_data()
+
+        spectrum = DataFileParser(f_obj=raw, f_type='spa').read_spectrum()
+
+        # only the values are held, the axis is built on request
+        self.assertTrue(spectrum.is_linear())
+        self.assertFalse(hasattr(spectrum, '__dict__'))
+        self.assertEqual(spectrum.nbytes, exp_vals.nbytes)
+        self.assertEqual(len(spectrum), len(exp_vals))
+
+        test_wv, test_vals = spectrum
+        nptest.assert_array_equal(test_wv, exp_wv)
+        nptest.assert_array_equal(test_vals, exp_vals)
+        nptest.assert_array_equal(
+            spectrum.wavenumbers(), spa.wavenumbers(spa.read_header(raw))
+        )
+
+        # series share one implicit axis
+        series = _series(raw, np.stack([exp_vals] * 3), [0, 0])
+        spectrum = DataFileParser(f_obj=series, f_type='spg').read_spectrum()
+        self.assertEqual(spectrum.y.shape, (3, len(exp_vals)))
+        nptest.assert_array_equal(spectrum.nanometers(), exp_wv)
+
+        # uneven axes are kept as arrays
+        x = np.array([400.0, 401.0, 403.0])
+        spectrum = Spectrum.from_arrays(x, np.ones(3))
+        self.assertFalse(spectrum.is_linear())
+        nptest.assert_array_equal(spectrum.wavenumbers(), 1.0E7 / x)
+
+        sys.stdout.write('\n PASSED')
+
+
+    def test_read_metadata(self):
+        """
+        Test header-only metadata of .spa files.
+        """
+
+        sys.stdout.write('\n\nTesting read_metadata()...\n')
+
+        with open(self.data_file, 'rb') as df:
+            raw = df.read()
+
+        exp_wv, exp_vals = DataFileParser(f_obj=raw, f_type='spa').read_data()
+
+        # the data block starts at 1288 and is never read
+        for f_obj in (raw, io.BytesIO(raw[:1288])):
+            test_spa = DataFileParser(f_obj=f_obj, f_type='spa')
+            metadata = test_spa.read_metadata()
+
+            self.assertEqual(metadata['title'], 'NBK-026_1')
+            self.assertEqual(metadata['points'], len(exp_vals))
+            self.assertEqual(metadata['spectra'], 1)
+            nptest.assert_allclose(
+                metadata['x_range'], (exp_wv[0], exp_wv[-1]), rtol=1e-6
+            )
+            self.assertTrue(metadata['history'].startswith('Collect Sample'))
+
+        sys.stdout.write('\n PASSED')
+
+
     def test_is_valid(self):
         """
         Test is_valid() method for spa files.
@@ -166,6 +381,66 @@ class TestReadSpa(unittest.TestCase):
         sys.stdout.write('\n PASSED')
 
 
+    def test_parse(self):
+        """
+        Test the single pass parse() method for spa files.
+        """
+
+        sys.stdout.write('\n\nTesting parse()...\n')
+
+        # read the expected data with the reader
+        with open(self.data_file, 'rb') as df:
+            exp_wv, exp_vals = DataFileParser(
+                f_obj=df, f_type='spa'
+            )._read_spa()
+
+        # parse once, the file is closed afterwards
+        with open(self.data_file, 'rb') as df:
+            test_spa = DataFileParser(f_obj=df, f_type='spa')
+            result = test_spa.parse()
+
+        self.assertEqual(result.valid, True)
+        self.assertEqual(result.errors, test_spa.default_message)
+        nptest.assert_array_equal(result.x_data, exp_wv)
+        nptest.assert_array_equal(result.y_data, exp_vals)
+
+        # later calls are served from the cached result
+        self.assertIs(test_spa.parse(), result)
+        self.assertEqual(test_spa.is_valid(), True)
+        test_wv, test_vals = test_spa.read_data()
+        self.assertIs(test_wv, result.x_data)
+        self.assertIs(test_spa.get_y_data(), result.y_data)
+
+        sys.stdout.write('\n PASSED')
+
+    def test_read_data_dtype(self):
+        """
+        Test the dtype option of read_data() for spa files.
+        """
+
+        sys.stdout.write('\n\nTesting read_data() dtype...\n')
+
+        with open(self.data_file, 'rb') as df:
+            exp_wv, exp_vals = DataFileParser(
+                f_obj=df, f_type='spa'
+            ).read_data()
+
+        for dtype in (np.float32, np.float64):
+
+            with open(self.data_file, 'rb') as df:
+                test_spa = DataFileParser(f_obj=df, f_type='spa', dtype=dtype)
+                test_wv, test_vals = test_spa.read_data()
+
+            # arrays of the requested dtype, no lists
+            self.assertIsInstance(test_wv, np.ndarray)
+            self.assertEqual(test_wv.dtype, dtype)
+            self.assertEqual(test_vals.dtype, dtype)
+            self.assertTrue(test_wv.flags['C_CONTIGUOUS'])
+            nptest.assert_allclose(test_wv, exp_wv, rtol=1e-6)
+            nptest.assert_allclose(test_vals, exp_vals, rtol=1e-6)
+
+        sys.stdout.write('\n PASSED')
+
     @classmethod
     def tearDownClass(cls):
 
@@ -173,5 +448,33 @@ class TestReadSpa(unittest.TestCase):
 
         sys.stdout.close()
 
+
+def _series(raw, spectra, gaps, start=1024):
+    """
+    Builds an OMNIC series from the header of `raw` and the
+    rows of `spectra`, with `gaps` extra bytes between blocks.
+    """
+
+    size = spectra.shape[1] * 4
+    buf = bytearray(raw[:start])
+    buf[spa.DIRECTORY_OFFSET:spa.HEADER_OFFSET + 534] = bytes(
+        spa.HEADER_OFFSET + 534 - spa.DIRECTORY_OFFSET
+    )
+
+    offsets = []
+    for row, gap in zip(spectra, [0] + list(gaps)):
+        buf += bytes(gap)
+        offsets.append(len(buf))
+        buf += row.astype('<f4').tobytes()
+
+    struct.pack_into('<H', buf, spa.BLOCK_COUNT_OFFSET, len(offsets))
+    for i, offset in enumerate(offsets):
+        struct.pack_into(
+            '<BxII', buf, spa.DIRECTORY_OFFSET + 16 * i, spa.DATA_BLOCK,
+            offset, size
+        )
+
+    return bytes(buf)
+
 if __name__=='__main__':
     unittest.main()
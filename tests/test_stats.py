@@ -0,0 +1,111 @@
+#!user/bin/python
+# -*- coding: utf-8 -*-
+"""
+Test class for parse instrumentation.
+"""
+# import external packages
+import contextlib
+import io
+import unittest
+from pathlib import Path
+import sys
+import os
+from numpy import testing as nptest
+
+
+# import package
+from sparse.parsers import DataFileParser
+from sparse.stats import ParseStats, STAGES
+
+class TestStats(unittest.TestCase):
+
+    # set up the test case
+    @classmethod
+    def setUpClass(cls):
+        """
+        Setup the test class and initialize test variables
+        and expected test results.
+        """
+
+        sys.stdout.write('\nSetting up test class... ')
+
+        # path to parent directory
+        cls.data_dir = Path(__file__).resolve().parent.parent
+
+        # get the data files
+        cls.csv_file = os.path.join(
+            cls.data_dir, 'test_input' + os.sep + 'dow_moe_rev5_cal_001.csv'
+        )
+        cls.spa_file = os.path.join(
+            cls.data_dir, 'test_input' + os.sep + 'NBK-026_1.SPA'
+        )
+
+        sys.stdout.write('SUCCESS ')
+
+    def test_text_stats(self):
+        """
+        Test the stages and counters recorded for text files.
+        """
+
+        sys.stdout.write('\n\nTesting text file stats...\n')
+
+        text = 'Wavelength,Value\n1.0,2.0\nbad,row\n\n3.0,4.0\n'
+
+        for method in ('read_data', 'parse'):
+
+            records = []
+            stats = ParseStats(callback=lambda n, v: records.append(n))
+            parser = DataFileParser(
+                f_obj=io.StringIO(text), f_type='csv', stats=stats
+            )
+            getattr(parser, method)()
+
+            result = stats.as_dict()
+            self.assertEqual(result['counters'], {
+                'bytes_read': len(text), 'rows_parsed': 2, 'rows_skipped': 2
+            })
+            for name in STAGES:
+                self.assertGreater(result['timings'][name], 0.0)
+                self.assertIn(name, records)
+
+            stats.reset()
+            self.assertEqual(stats.as_dict()['counters']['rows_parsed'], 0)
+
+        sys.stdout.write('\n PASSED')
+
+    def test_spa_stats(self):
+        """
+        Test that .spa files record their stats and print nothing.
+        """
+
+        sys.stdout.write('\n\nTesting spa file stats...\n')
+
+        with open(self.spa_file, 'rb') as df:
+            exp_wv, exp_vals = DataFileParser(
+                f_obj=df, f_type='spa'
+            ).read_data()
+
+        stats = ParseStats()
+        out = io.StringIO()
+
+        with open(self.spa_file, 'rb') as df, contextlib.redirect_stdout(out):
+            parser = DataFileParser(f_obj=df, f_type='spa', stats=stats)
+            test_wv, test_vals = parser.read_data()
+
+        self.assertEqual(out.getvalue(), '')
+        nptest.assert_array_equal(test_wv, exp_wv)
+        nptest.assert_array_equal(test_vals, exp_vals)
+
+        counters = stats.as_dict()['counters']
+        self.assertEqual(counters['bytes_read'], os.path.getsize(self.spa_file))
+        self.assertEqual(counters['rows_parsed'], len(exp_vals))
+
+        sys.stdout.write('\n PASSED')
+
+    @classmethod
+    def tearDownClass(cls):
+
+        sys.stdout.write('\nRunning teardown procedure... SUCCESS')
+
+if __name__=='__main__':
+    unittest.main()
@@ -4,6 +4,7 @@
 Test class for txt files.
 """
 # import external packages
+import io
 import time
 from unittest.case import TestCase
 import numpy as np
@@ -17,6 +18,7 @@ import json
 
 
 # import package
+from sparse import oceanview
 from sparse.parsers import DataFileParser
 from sparse.utils import show_plot
 
@@ -158,6 +160,202 @@ class TestReadTxt(unittest.TestCase):
 
         sys.stdout.write('\n PASSED')
 
+    def test_parse(self):
+        """
+        Test the single pass parse() method for txt files.
+        """
+
+        sys.stdout.write('\n\nTesting parse()...\n')
+
+        # read the expected data with the reader
+        with open(self.data_file) as df:
+            exp_wv, exp_vals = DataFileParser(
+                f_obj=df, f_type='txt', delimiter='\t'
+            )._read_txt()
+
+        # parse once, the file is closed afterwards
+        with open(self.data_file) as df:
+            test_txt = DataFileParser(f_obj=df, f_type='txt', delimiter='\t')
+            result = test_txt.parse()
+
+        self.assertEqual(result.valid, True)
+        self.assertEqual(result.errors, test_txt.default_message)
+        nptest.assert_array_equal(result.x_data, exp_wv)
+        nptest.assert_array_equal(result.y_data, exp_vals)
+
+        # later calls are served from the cached result
+        self.assertIs(test_txt.parse(), result)
+        self.assertEqual(test_txt.is_valid(), True)
+        test_wv, test_vals = test_txt.read_data()
+        self.assertIs(test_wv, result.x_data)
+        self.assertIs(test_txt.get_y_data(), result.y_data)
+
+        sys.stdout.write('\n PASSED')
+
+    def test_iter_data(self):
+        """
+        Test the streaming iter_data() method for txt files.
+        """
+
+        sys.stdout.write('\n\nTesting iter_data()...\n')
+
+        with open(self.data_file) as df:
+            test_txt = DataFileParser(f_obj=df, f_type='txt', delimiter='\t')
+            exp_wv, exp_vals = test_txt.read_data()
+
+        with open(self.data_file) as df:
+            test_txt = DataFileParser(f_obj=df, f_type='txt', delimiter='\t')
+            blocks = list(test_txt.iter_data(block_size=50))
+
+        # every block but the last is full
+        sizes = [len(x) for x, y in blocks]
+        self.assertTrue(all(n == 50 for n in sizes[:-1]))
+        self.assertTrue(0 < sizes[-1] <= 50)
+
+        nptest.assert_array_equal(
+            np.concatenate([x for x, y in blocks]), exp_wv
+        )
+        nptest.assert_array_equal(
+            np.concatenate([y for x, y in blocks]), exp_vals
+        )
+
+        sys.stdout.write('\n PASSED')
+
+    def test_oceanview_metadata(self):
+        """
+        Test the OceanView preamble and pixel count checks.
+        """
+
+        sys.stdout.write('\n\nTesting OceanView metadata...\n')
+
+        with open(self.data_file) as df:
+            text = df.read()
+
+        test_txt = DataFileParser(f_obj=io.StringIO(text), f_type='txt')
+        result = test_txt.parse()
+
+        # typed preamble fields
+        self.assertEqual(result.valid, True)
+        self.assertEqual(test_txt.metadata['spectrometer'], 'FLMN02631')
+        self.assertEqual(test_txt.metadata['integration_time'], 1.7E-3)
+        self.assertEqual(test_txt.metadata['scans_to_average'], 100)
+        self.assertEqual(test_txt.metadata['pixels'], 128)
+        self.assertEqual(
+            test_txt.metadata['nonlinearity_correction'], False
+        )
+        self.assertEqual(len(result.x_data), 128)
+        self.assertEqual(result.x_data[0], 932.391)
+        self.assertEqual(result.y_data[0], 0.06)
+
+        # streamed blocks carry the same data and metadata
+        test_txt = DataFileParser(f_obj=io.StringIO(text), f_type='txt')
+        blocks = list(test_txt.iter_data(block_size=100))
+        nptest.assert_array_equal(
+            np.concatenate([y for x, y in blocks]), result.y_data
+        )
+        self.assertEqual(test_txt.metadata, result.metadata)
+
+        # a missing row is caught by the declared pixel count
+        short = text.replace('932.391\t0.06\n', '')
+        test_txt = DataFileParser(f_obj=io.StringIO(short), f_type='txt')
+        self.assertEqual(test_txt.is_valid(), False)
+        self.assertEqual(test_txt.errors, 'Expected 128 pixels, found 127.')
+
+        # ragged rows are skipped, never shifted into other columns
+        ragged = text.replace('938.224\t0.05\n', '938.224\n').replace(
+            '944.055\t0.04\n', '944.055\t0.04\t7\n'
+        )
+        test_txt = DataFileParser(f_obj=io.StringIO(ragged), f_type='txt')
+        result = test_txt.parse()
+        self.assertEqual(result.valid, False)
+        self.assertEqual(result.errors, 'Data rows must have 2 fields.')
+        nptest.assert_array_equal(result.x_data[:2], [932.391, 944.055])
+        nptest.assert_array_equal(result.y_data[:2], [0.06, 0.04])
+
+        test_txt = DataFileParser(f_obj=io.StringIO(ragged), f_type='txt')
+        self.assertEqual(test_txt.is_valid(), False)
+
+        with self.assertRaises(ValueError):
+            oceanview.parse_data('1\t2\n3\n5\t6\n', cols=2, rows=3)
+
+        sys.stdout.write('\n PASSED')
+
+    def test_read_metadata(self):
+        """
+        Test header-only metadata of .txt files.
+        """
+
+        sys.stdout.write('\n\nTesting read_metadata()...\n')
+
+        with open(self.data_file) as df:
+            exp_wv, exp_vals = DataFileParser(
+                f_obj=df, f_type='txt'
+            ).read_data()
+
+        with open(self.data_file) as df:
+            test_txt = DataFileParser(f_obj=df, f_type='txt')
+            metadata = test_txt.read_metadata()
+
+        self.assertEqual(metadata['points'], len(exp_wv))
+        self.assertEqual(metadata['spectrometer'], 'FLMN02631')
+        self.assertEqual(metadata['x_range'], (exp_wv[0], exp_wv[-1]))
+
+        # plain files report their header and first and last rows
+        text = 'x\ty\n' + ''.join(
+            str(i) + '\t' + str(i * 2) + '\n' for i in range(2000)
+        )
+        test_txt = DataFileParser(
+            f_obj=io.StringIO(text), f_type='txt', delimiter='\t'
+        )
+        self.assertEqual(test_txt.read_metadata(), {
+            'header': [['x', 'y']], 'columns': 2, 'x_range': (0.0, 1999.0)
+        })
+
+        sys.stdout.write('\n PASSED')
+
+    def test_channels(self):
+        """
+        Test multi-column files and their derived channels.
+        """
+
+        sys.stdout.write('\n\nTesting derived channels...\n')
+
+        # x, dark, reference and three sample replicates
+        text = (
+            'Wavelength\tDark\tReference\tS1\tS2\tS3\n'
+            '500.0\t1.0\t11.0\t2.0\t6.0\t11.0\n'
+            '501.0\t2.0\t102.0\t12.0\t3.0\t52.0\n'
+        )
+
+        exp = np.array([[0.1, 0.5, 1.0], [0.1, 0.01, 0.5]])
+
+        for channel, values in (
+            ('transmittance', exp), ('absorbance', -np.log10(exp))
+        ):
+            x_data, y_data = DataFileParser(
+                f_obj=io.StringIO(text), f_type='txt', delimiter='\t',
+                cols=6, channel=channel
+            ).read_data()
+
+            nptest.assert_array_equal(x_data, [500.0, 501.0])
+            self.assertEqual(y_data.shape, (2, 3))
+            nptest.assert_allclose(y_data, values)
+
+        # four columns keep the single ratio
+        result = DataFileParser(
+            f_obj=io.StringIO(text), f_type='txt', delimiter='\t', cols=4
+        ).parse()
+        self.assertEqual(result.valid, True)
+        nptest.assert_allclose(result.y_data, exp[:, 0])
+
+        # other widths return every column after x
+        x_data, y_data = DataFileParser(
+            f_obj=io.StringIO(text), f_type='txt', delimiter='\t', cols=3
+        ).read_data()
+        nptest.assert_array_equal(y_data, [[1.0, 11.0], [2.0, 102.0]])
+
+        sys.stdout.write('\n PASSED')
+
     @classmethod
     def tearDownClass(cls):
 